@@ -0,0 +1,183 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+import time
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T", bound="LazySingleton")
+
+
+class LazySingleton(ABC):
+    """
+    Mixin for singletons with a heavy one-time setup.
+
+    Subclasses put their expensive work in `_initialize()` and call
+    `self.ensure_initialized()` from `__init__`. The setup then runs exactly once,
+    no matter how it is triggered:
+      - on demand:  the first `Cls()` runs it, concurrent first callers wait for it.
+      - eagerly:    `Cls.warm_up()` runs it in a background thread at startup.
+      - from async: `await Cls.ainstance()` waits without blocking the event loop.
+    The measured setup time is kept in `init_seconds` (see `init_report()`). If the
+    setup raises, the callers waiting on that attempt get a RuntimeError and the next
+    call tries again.
+    """
+    _registry: List[Type["LazySingleton"]] = []
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instance = None
+        cls._singleton_lock = threading.Lock()
+        cls._init_done = threading.Event()
+        cls._init_started = False
+        cls._init_error: Optional[BaseException] = None
+        cls.init_seconds: Optional[float] = None
+        LazySingleton._registry.append(cls)
+
+    @abstractmethod
+    def _initialize(self) -> None:
+        """The heavy one-time setup. Runs on whichever thread triggers it first."""
+        pass
+
+    @classmethod
+    def _get_or_create_instance(cls: Type[T]) -> Tuple[T, bool]:
+        """
+        Thread-safe (double-checked) creation of the bare instance, without running setup.
+        Returns (instance, created_by_this_call).
+        """
+        if cls._instance is None:
+            with cls._singleton_lock:
+                if cls._instance is None:
+                    cls._instance = object.__new__(cls)
+                    return cls._instance, True
+        return cls._instance, False
+
+    def ensure_initialized(self, timeout: Optional[float] = None) -> None:
+        """Runs `_initialize()` once; every other caller waits for that single run."""
+        cls = type(self)
+        if cls._init_done.is_set():
+            return
+        with cls._singleton_lock:
+            attempt = cls._init_done
+            run_here = not cls._init_started
+            cls._init_started = True
+        if not run_here:
+            if not attempt.wait(timeout):
+                raise TimeoutError(f"{cls.__name__} is still initializing.")
+            if cls._init_done is not attempt:  # that attempt failed and was reset
+                raise RuntimeError(f"{cls.__name__} failed to initialize.") from cls._init_error
+            return
+        start = time.perf_counter()
+        try:
+            self._initialize()
+        except BaseException as exc:
+            with cls._singleton_lock:  # reset, so the next call retries the setup
+                cls._init_error = exc
+                cls._init_started = False
+                cls._init_done = threading.Event()
+            attempt.set()  # wake the callers waiting on this attempt
+            raise
+        cls.init_seconds = time.perf_counter() - start
+        cls._init_error = None
+        attempt.set()
+
+    @classmethod
+    def is_initialized(cls) -> bool:
+        return cls._init_done.is_set()
+
+    @classmethod
+    def warm_up(cls) -> threading.Thread:
+        """Starts the one-time setup in a background thread and returns immediately."""
+        thread = threading.Thread(target=cls, name=f"{cls.__name__}-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    @classmethod
+    async def ainstance(cls: Type[T]) -> T:
+        """Awaitable access for asyncio apps: the setup never runs on the event loop thread."""
+        if cls.is_initialized():
+            return cls()
+        return await asyncio.get_running_loop().run_in_executor(None, cls)
+
+    @staticmethod
+    def init_report() -> Dict[str, Optional[float]]:
+        """Measured setup time (seconds) of every lazy singleton; None if not initialized yet."""
+        return {cls.__name__: cls.init_seconds for cls in LazySingleton._registry}
+
+
+# --- Demo: the three initialization modes on throwaway services ---
+def demo_lazy_init() -> None:
+    class HeavyService(LazySingleton):
+        init_runs = 0
+
+        def __new__(cls) -> "HeavyService":
+            return cls._get_or_create_instance()[0]
+
+        def __init__(self) -> None:
+            self.ensure_initialized()
+
+        def _initialize(self) -> None:
+            type(self).init_runs += 1
+            time.sleep(0.3)
+
+    class EagerService(HeavyService):
+        init_runs = 0
+
+    class AsyncService(HeavyService):
+        init_runs = 0
+
+    async def async_demo() -> None:
+        start = time.perf_counter()
+        ticker_lags = []
+
+        async def ticker() -> None:  # would stall for 0.3 s if init blocked the loop
+            for _ in range(30):
+                before = time.perf_counter()
+                await asyncio.sleep(0.01)
+                ticker_lags.append(time.perf_counter() - before)
+
+        instances = await asyncio.gather(*(AsyncService.ainstance() for _ in range(100)), ticker())
+        print(f"async: 100 awaiters got one instance: {len({id(i) for i in instances[:-1]}) == 1}, "
+              f"init runs: {AsyncService.init_runs}, took {time.perf_counter() - start:.2f}s, "
+              f"max event-loop lag {max(ticker_lags) * 1000:.0f} ms")
+
+    # On demand: 10 threads hit the cold singleton at once; the setup runs once.
+    threads = [threading.Thread(target=HeavyService) for _ in range(10)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"on-demand: 10 concurrent first callers, init runs: {HeavyService.init_runs}, "
+          f"took {time.perf_counter() - start:.2f}s")
+
+    # Eager: warm up at startup, do other startup work, first real request is instant.
+    EagerService.warm_up()
+    time.sleep(0.4)  # other startup work
+    start = time.perf_counter()
+    EagerService()
+    print(f"eager: first request after warm-up took {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    asyncio.run(async_demo())
+
+    # Failure: a setup that raises (say, the config server is down) is retried on the next call.
+    class FlakyService(HeavyService):
+        init_runs = 0
+
+        def _initialize(self) -> None:
+            type(self).init_runs += 1
+            if self.init_runs == 1:
+                raise ConnectionError("config server unavailable")
+
+    try:
+        FlakyService()
+    except ConnectionError as exc:
+        print(f"retry: first attempt failed ({exc}), initialized? {FlakyService.is_initialized()}")
+    FlakyService()
+    print(f"retry: second call initialized it: {FlakyService.is_initialized()}, "
+          f"init runs: {FlakyService.init_runs}")
+
+    print(f"init report: {LazySingleton.init_report()}")
+
+
+if __name__ == "__main__":
+    demo_lazy_init()
@@ -1,29 +1,540 @@
-from typing import List
+from array import array
+from bisect import bisect_left
+from collections import deque
+from contextlib import redirect_stdout
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+import atexit
+import glob
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
 import time
+import tracemalloc
 
-class Logger:
-    _instance = None
+from lazy_singleton import LazySingleton
+
+# A queued log record is kept as a compact tuple: (timestamp, level, message).
+# Formatting into "LEVEL: message" is deferred to the writer thread.
+LogRecord = Tuple[float, str, str]
+LogSink = Callable[[List[LogRecord]], None]
+
+LEVELS: Tuple[str, ...] = ("INFO", "WARNING", "ERROR")
+LEVEL_CODES = {name: code for code, name in enumerate(LEVELS)}
+
+
+class LogEntry:
+    """A single stored log entry. Formatting happens only when it is read."""
+    __slots__ = ("timestamp", "level_code", "message")
+
+    def __init__(self, timestamp: float, level_code: int, message: str) -> None:
+        self.timestamp = timestamp
+        self.level_code = level_code
+        self.message = message
+
+    @property
+    def level(self) -> str:
+        return LEVELS[self.level_code]
+
+    def format(self) -> str:
+        return f"{LEVELS[self.level_code]}: {self.message}"
+
+
+class _Postings:
+    """
+    Ascending sequence numbers of the entries of one level, stored in an array.
+    Evicted entries are always the oldest, so they are dropped by advancing `head`;
+    the array is compacted once the dead prefix dominates.
+    """
+    __slots__ = ("seqs", "head")
+
+    def __init__(self) -> None:
+        self.seqs = array('q')
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.head
+
+    def append(self, seq: int) -> None:
+        self.seqs.append(seq)
+
+    def pop_oldest(self) -> None:
+        self.head += 1
+        if self.head >= 1024 and self.head * 2 >= len(self.seqs):
+            del self.seqs[:self.head]
+            self.head = 0
+
+    def count_between(self, lo_seq: int, hi_seq: int) -> Tuple[int, int]:
+        """Returns the index range of postings with lo_seq <= seq < hi_seq."""
+        i = bisect_left(self.seqs, lo_seq, self.head)
+        return i, bisect_left(self.seqs, hi_seq, i)
+
+
+class RingBufferLogStore:
+    """
+    Fixed-capacity log history. Once full, each append overwrites the oldest entry,
+    so memory stays flat no matter how many messages are logged.
+
+    Entries live in three preallocated parallel arrays instead of one object per entry:
+      - timestamps: array('d')  -> 8 bytes
+      - levels:     array('B')  -> 1 byte
+      - messages:   list slot   -> 8 bytes (a reference to the caller's message string)
+    i.e. 17 bytes of bookkeeping per entry plus the message string itself.
+
+    Two indexes make queries independent of the history size:
+      - time: entries are kept in timestamp order (a late timestamp from a racing
+        thread is clamped to the previous one), so a time range is a binary search.
+      - level: one posting list of sequence numbers per level (8 more bytes per entry).
+    """
+    def __init__(self, capacity: int = 10_000) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive.")
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._levels = array('B', bytes(capacity))
+        self._messages: List[Optional[str]] = [None] * capacity
+        self._postings = [_Postings() for _ in LEVELS]
+        self._last_timestamp = 0.0
+        self._total = 0  # number of entries ever appended (sequence of the next entry)
+        self._lock = threading.Lock()
+
+    def _append_locked(self, timestamp: float, level_code: int, message: str) -> None:
+        seq = self._total
+        slot = seq % self.capacity
+        if seq >= self.capacity:
+            self._postings[self._levels[slot]].pop_oldest()
+        if timestamp < self._last_timestamp:
+            timestamp = self._last_timestamp
+        self._last_timestamp = timestamp
+        self._timestamps[slot] = timestamp
+        self._levels[slot] = level_code
+        self._messages[slot] = message
+        self._postings[level_code].append(seq)
+        self._total = seq + 1
+
+    def append(self, timestamp: float, level_code: int, message: str) -> None:
+        with self._lock:
+            self._append_locked(timestamp, level_code, message)
+
+    def extend(self, records: List[LogRecord]) -> None:
+        """Appends a whole batch of (timestamp, level, message) records under one lock."""
+        with self._lock:
+            for timestamp, level, message in records:
+                self._append_locked(timestamp, LEVEL_CODES[level], message)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._messages = [None] * self.capacity
+            self._postings = [_Postings() for _ in LEVELS]
+            self._last_timestamp = 0.0
+            self._total = 0
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+    def entries(self, last_n: Optional[int] = None) -> Iterator[LogEntry]:
+        """Yields stored entries oldest-first (only the newest `last_n` if given)."""
+        end = self._total
+        count = len(self) if last_n is None else max(0, min(last_n, len(self)))
+        for seq in range(end - count, end):
+            slot = seq % self.capacity
+            entry = LogEntry(self._timestamps[slot], self._levels[slot], self._messages[slot])
+            # A concurrent writer may have lapped us; skip entries that were overwritten.
+            if seq >= self._total - self.capacity:
+                yield entry
+
+    # --- Indexed queries ---
+    def _first_seq_after(self, timestamp: float, inclusive: bool) -> int:
+        """Binary search over the live entries for the first one at (or after) `timestamp`."""
+        lo, hi = self._total - len(self), self._total
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self._timestamps[mid % self.capacity]
+            if value < timestamp or (not inclusive and value == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _seq_bounds(self, since: Optional[float], until: Optional[float]) -> Tuple[int, int]:
+        lo_seq = self._total - len(self)
+        hi_seq = self._total
+        if since is not None:
+            lo_seq = self._first_seq_after(since, inclusive=True)
+        if until is not None:
+            hi_seq = self._first_seq_after(until, inclusive=False)
+        return lo_seq, hi_seq
+
+    def _candidate_seqs(self, level: Optional[str], since: Optional[float],
+                        until: Optional[float]) -> Iterable[int]:
+        lo_seq, hi_seq = self._seq_bounds(since, until)
+        if level is None:
+            return range(lo_seq, max(lo_seq, hi_seq))
+        postings = self._postings[LEVEL_CODES[level.upper()]]
+        i, j = postings.count_between(lo_seq, hi_seq)
+        return postings.seqs[i:j]
+
+    def query(self, level: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None, contains: Optional[str] = None) -> List[LogEntry]:
+        """
+        Returns entries matching every given filter, oldest first. Level and time
+        range come from the indexes; the `contains` substring filter runs last,
+        only over those candidates.
+        """
+        with self._lock:
+            seqs = self._candidate_seqs(level, since, until)
+            capacity = self.capacity
+            if contains is None:
+                return [LogEntry(self._timestamps[seq % capacity], self._levels[seq % capacity],
+                                 self._messages[seq % capacity]) for seq in seqs]
+            result = []
+            for seq in seqs:
+                message = self._messages[seq % capacity]
+                if contains in message:
+                    result.append(LogEntry(self._timestamps[seq % capacity],
+                                           self._levels[seq % capacity], message))
+            return result
+
+    def count(self, level: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None) -> int:
+        """Counts matching entries in O(log n) without materializing them."""
+        with self._lock:
+            lo_seq, hi_seq = self._seq_bounds(since, until)
+            if level is None:
+                return max(0, hi_seq - lo_seq)
+            i, j = self._postings[LEVEL_CODES[level.upper()]].count_between(lo_seq, hi_seq)
+            return j - i
+
+    def nbytes(self) -> int:
+        """Bookkeeping memory of the buffer (excluding the message strings themselves)."""
+        return (self._timestamps.itemsize * len(self._timestamps)
+                + self._levels.itemsize * len(self._levels)
+                + 8 * len(self._messages)
+                + sum(p.seqs.itemsize * len(p.seqs) for p in self._postings))
+
+
+class LogView:
+    """Cheap, read-only view over the newest entries of a store. Formats lazily on iteration."""
+    __slots__ = ("_store", "_last_n")
+
+    def __init__(self, store: RingBufferLogStore, last_n: Optional[int] = None) -> None:
+        self._store = store
+        self._last_n = last_n
+
+    def __len__(self) -> int:
+        size = len(self._store)
+        return size if self._last_n is None else max(0, min(self._last_n, size))
+
+    def __iter__(self) -> Iterator[str]:
+        for entry in self._store.entries(self._last_n):
+            yield entry.format()
+
+
+class _Segment:
+    """In-memory summary of one segment file, used to skip segments outside a time range."""
+    __slots__ = ("path", "end", "count", "first_timestamp", "last_timestamp")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.end = 0
+        self.count = 0
+        self.first_timestamp = 0.0
+        self.last_timestamp = 0.0
+
+
+class MmapSegmentSink:
+    """
+    Persistent LogSink that appends binary records to preallocated, memory-mapped
+    segment files. When a record does not fit, it rolls over to a new segment and
+    deletes the oldest files so that only the newest `max_segments` are kept.
+
+    Record layout: <uint32 record size><float64 timestamp><uint8 level code><utf-8 message>.
+    The preallocated tail of a segment is zero-filled, so a zero size marks its end. The
+    size is written last, so a record torn by a crash is never mistaken for a real one.
+    """
+    HEADER = struct.Struct("<IdB")
+    _SIZE = struct.Struct("<I")
+    _BODY = struct.Struct("<dB")
+    FILE_PATTERN = "segment-{:08d}.log"
+
+    def __init__(self, directory: str, segment_size: int = 4 * 1024 * 1024,
+                 max_segments: int = 8) -> None:
+        if segment_size <= self.HEADER.size or max_segments < 1:
+            raise ValueError("segment_size must exceed the record header and max_segments must be positive.")
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        self._segments: List[_Segment] = []
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        os.makedirs(directory, exist_ok=True)
+        for path in sorted(glob.glob(os.path.join(directory, "segment-*.log"))):
+            self._segments.append(self._scan(path))
+        if self._segments:
+            self._map(self._segments[-1].path)
+        else:
+            self._roll_over()
+
+    # --- Writing ---
+    def __call__(self, batch: List[LogRecord]) -> None:
+        with self._lock:
+            if self._mmap is None:
+                raise RuntimeError("Segment sink is closed.")
+            for timestamp, level, message in batch:
+                self._write(timestamp, LEVEL_CODES[level], message.encode("utf-8"))
+
+    def _write(self, timestamp: float, level_code: int, payload: bytes) -> None:
+        size = self.HEADER.size + len(payload)
+        if size > self.segment_size:
+            raise ValueError(f"Log record of {size} bytes exceeds the segment size.")
+        segment = self._segments[-1]
+        if segment.end + size > len(self._mmap):
+            self._roll_over()
+            segment = self._segments[-1]
+        offset = segment.end
+        self._BODY.pack_into(self._mmap, offset + self._SIZE.size, timestamp, level_code)
+        self._mmap[offset + self.HEADER.size:offset + size] = payload
+        self._SIZE.pack_into(self._mmap, offset, size)  # publishes the record
+        segment.end = offset + size
+        if segment.count == 0:
+            segment.first_timestamp = timestamp
+        segment.last_timestamp = timestamp
+        segment.count += 1
+
+    def _map(self, path: str) -> None:
+        """Maps a whole segment, first growing it if it predates a larger `segment_size`."""
+        self._file = open(path, "r+b")
+        length = os.fstat(self._file.fileno()).st_size
+        if length < self.segment_size:
+            self._file.truncate(self.segment_size)
+            length = self.segment_size
+        self._mmap = mmap.mmap(self._file.fileno(), length)
+
+    def _unmap(self) -> None:
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def _roll_over(self) -> None:
+        self._unmap()
+        index = int(os.path.basename(self._segments[-1].path)[8:16]) + 1 if self._segments else 0
+        path = os.path.join(self.directory, self.FILE_PATTERN.format(index))
+        with open(path, "wb") as f:
+            f.truncate(self.segment_size)  # preallocate; unwritten bytes read back as zeros
+        self._segments.append(_Segment(path))
+        self._map(path)
+        while len(self._segments) > self.max_segments:
+            oldest = self._segments.pop(0)
+            try:
+                os.remove(oldest.path)
+            except OSError:
+                pass  # e.g. still mapped by a concurrent reader on Windows
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._unmap()
+
+    # --- Reading (decoded straight from the mapped files) ---
+    def _scan(self, path: str) -> _Segment:
+        """Rebuilds the summary of an existing segment by walking its record headers."""
+        segment = _Segment(path)
+        for end, timestamp, _, _ in self._decode(path, None, decode_messages=False):
+            if segment.count == 0:
+                segment.first_timestamp = timestamp
+            segment.last_timestamp = timestamp
+            segment.count += 1
+            segment.end = end
+        return segment
+
+    def _decode(self, path: str, end: Optional[int], level_code: Optional[int] = None,
+                decode_messages: bool = True) -> Iterator[Tuple[int, float, int, Optional[str]]]:
+        """
+        Yields (record end offset, timestamp, level code, message) per record. Only the
+        fixed-size headers are unpacked for every record; message bytes are sliced out
+        of the mapping only for records that pass the level filter.
+        """
+        header = self.HEADER
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            limit = len(mm) if end is None else end
+            offset = 0
+            while offset + header.size <= limit:
+                size, timestamp, code = header.unpack_from(mm, offset)
+                if size == 0:
+                    break
+                if level_code is None or code == level_code:
+                    message = (mm[offset + header.size:offset + size].decode("utf-8")
+                               if decode_messages else None)
+                    yield offset + size, timestamp, code, message
+                offset += size
+
+    def _iter_entries(self, level_code: Optional[int], since: Optional[float],
+                      until: Optional[float]) -> Iterator[LogEntry]:
+        with self._lock:
+            segments = [(seg.path, seg.end, seg.first_timestamp, seg.last_timestamp)
+                        for seg in self._segments if seg.count]
+        for path, end, first, last in segments:
+            if (since is not None and last < since) or (until is not None and first > until):
+                continue
+            try:
+                for _, timestamp, code, message in self._decode(path, end, level_code):
+                    if (since is None or timestamp >= since) and (until is None or timestamp <= until):
+                        yield LogEntry(timestamp, code, message)
+            except FileNotFoundError:
+                continue  # rotated away while we were reading
+
+    def entries(self, since: Optional[float] = None, until: Optional[float] = None) -> Iterator[LogEntry]:
+        """Yields persisted entries oldest-first, skipping whole segments outside [since, until]."""
+        return self._iter_entries(None, since, until)
+
+    def query(self, level: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None, contains: Optional[str] = None) -> List[LogEntry]:
+        """Same filters as Logger.query(), evaluated over the persisted segments."""
+        level_code = None if level is None else LEVEL_CODES[level.upper()]
+        return [entry for entry in self._iter_entries(level_code, since, until)
+                if contains is None or contains in entry.message]
+
+
+class AsyncLogWriter:
+    """
+    Drains queued log records on a dedicated thread and hands them to the
+    sinks in batches. `max_queue_size` bounds memory; `policy` decides what
+    happens when the queue is full:
+      - "block":       the caller waits until the writer frees a slot.
+      - "drop_oldest": the oldest queued record is discarded.
+      - "drop_newest": the incoming record is discarded.
+    """
+    POLICIES = ("block", "drop_oldest", "drop_newest")
+
+    def __init__(self, sinks: List[LogSink], max_queue_size: int = 10_000,
+                 policy: str = "block", batch_size: int = 256) -> None:
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy!r}")
+        if max_queue_size < 1 or batch_size < 1:
+            raise ValueError("max_queue_size and batch_size must be positive.")
+        self._sinks = list(sinks)
+        self._max_queue_size = max_queue_size
+        self._policy = policy
+        self._batch_size = batch_size
+        self._queue: Deque[LogRecord] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0      # queued + currently being written
+        self._closed = False
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="AsyncLogWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: LogRecord) -> bool:
+        """Enqueues a record. Returns False if it was dropped by the policy."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Log writer is closed.")
+            if len(self._queue) >= self._max_queue_size:
+                if self._policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                if self._policy == "drop_oldest":
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self.dropped += 1
+                else:
+                    while len(self._queue) >= self._max_queue_size and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        raise RuntimeError("Log writer is closed.")
+            self._queue.append(record)
+            self._pending += 1
+            # The writer only sleeps on an empty queue, so one wake-up per batch is enough.
+            if len(self._queue) == 1:
+                self._not_empty.notify()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every submitted record reached the sinks. Returns False on timeout."""
+        with self._lock:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stops accepting records, drains what is queued and joins the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return  # closed and fully drained
+                count = min(self._batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._not_full.notify_all()
+
+            for sink in self._sinks:
+                try:
+                    sink(batch)
+                except Exception as exc:  # one broken sink must not stop the writer
+                    print(f"AsyncLogWriter: sink {sink!r} failed: {exc}", file=sys.stderr)
+
+            with self._lock:
+                self._pending -= count
+                if self._pending == 0:
+                    self._idle.notify_all()
+
+
+class Logger(LazySingleton):
     _initialized = False
-    _logs = []
+    _store = RingBufferLogStore()
+    _writer: Optional[AsyncLogWriter] = None
+    _file_sink: Optional[MmapSegmentSink] = None
 
     def __new__(cls) -> 'Logger':
-        if cls._instance is None:
+        instance, created = cls._get_or_create_instance()
+        if created:
             print("Creating a new Logger instance...")
-            cls._instance = super(Logger, cls).__new__(cls)
         else:
             print("Using the existing Logger instance...")
-        return cls._instance
+        return instance
 
     def __init__(self):
-        if not self._initialized:
-            print("Logger initialized (first time only).")
-            time.sleep(0.5)
-            self._initialized = True
+        # Heavy setup runs once; concurrent first callers (or a warm_up() thread) share it.
+        self.ensure_initialized()
+
+    def _initialize(self) -> None:
+        print("Logger initialized (first time only).")
+        time.sleep(0.5)
+        self._initialized = True
 
     def _add_log(self, level: str, message: str) -> None:
-        """Helper method to append log messages to the internal list"""
-        log_entry = f"{level.upper()}: {message}"
-        self._logs.append(log_entry)
+        """Helper method to record log messages in the history buffer"""
+        level = level.upper()
+        writer = self._writer
+        if writer is not None:
+            # Async mode: only enqueue a compact record, the writer thread does the rest.
+            writer.submit((time.time(), level, message))
+            return
+        timestamp = time.time()
+        self._store.append(timestamp, LEVEL_CODES[level], message)
+        if self._file_sink is not None:
+            self._file_sink([(timestamp, level, message)])
+        log_entry = f"{level}: {message}"
         print(f"Logged: {log_entry}")
 
     def info(self, message: str) -> None:
@@ -35,36 +546,302 @@ class Logger:
     def error(self, message: str) -> None:
         self._add_log(level="ERROR", message=message)
 
-    def get_logs(self) -> List[str]:
-        return self._logs
+    def get_logs(self, last_n: Optional[int] = None) -> LogView:
+        """Returns a lazy view of the stored logs (optionally only the newest `last_n`)."""
+        return LogView(self._store, last_n)
+
+    def get_entries(self, last_n: Optional[int] = None) -> Iterator[LogEntry]:
+        """Iterates over the raw stored entries, oldest first."""
+        return self._store.entries(last_n)
+
+    def query(self, level: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None, contains: Optional[str] = None) -> List[LogEntry]:
+        """Indexed search, e.g. query(level="ERROR", since=t0, until=t1, contains="db")."""
+        return self._store.query(level, since, until, contains)
+
+    def count(self, level: Optional[str] = None, since: Optional[float] = None,
+              until: Optional[float] = None) -> int:
+        """Cheap counter for health checks, e.g. count(level="ERROR", since=time.time() - 60)."""
+        return self._store.count(level, since, until)
+
+    @classmethod
+    def set_history_capacity(cls, capacity: int) -> None:
+        """Replaces the history buffer with one of `capacity` entries, keeping the newest ones."""
+        store = RingBufferLogStore(capacity)
+        store.extend([(e.timestamp, e.level, e.message) for e in cls._store.entries(capacity)])
+        cls._store = store
+
+    # --- Persistent storage ---
+    def attach_file_sink(self, directory: str, segment_size: int = 4 * 1024 * 1024,
+                         max_segments: int = 8, restore: bool = True) -> MmapSegmentSink:
+        """
+        Persists every log record into memory-mapped segment files under `directory`.
+        With `restore`, the newest persisted entries are reloaded into the in-memory
+        history, so get_logs()/query() survive a restart.
+        """
+        if self._writer is not None:
+            raise RuntimeError("Attach the file sink before enabling async mode.")
+        self.detach_file_sink()
+        sink = MmapSegmentSink(directory, segment_size, max_segments)
+        if restore:
+            newest = deque(sink.entries(), maxlen=self._store.capacity)
+            self._store.extend([(e.timestamp, e.level, e.message) for e in newest])
+        type(self)._file_sink = sink
+        return sink
+
+    def detach_file_sink(self) -> None:
+        """Closes the file sink. In async mode the writer is drained and stopped first (see close())."""
+        sink = self._file_sink
+        if sink is not None:
+            self.close()
+            type(self)._file_sink = None
+            sink.close()
+
+    def query_persisted(self, level: Optional[str] = None, since: Optional[float] = None,
+                        until: Optional[float] = None, contains: Optional[str] = None) -> List[LogEntry]:
+        """Like query(), but over everything still kept on disk rather than the in-memory window."""
+        if self._file_sink is None:
+            return []
+        return self._file_sink.query(level, since, until, contains)
+
+    # --- Asynchronous (batched) mode ---
+    def memory_sink(self, batch: List[LogRecord]) -> None:
+        """Sink that stores records in the shared in-memory history buffer."""
+        self._store.extend(batch)
+
+    @staticmethod
+    def console_sink(batch: List[LogRecord]) -> None:
+        """Sink that prints a whole batch with a single write."""
+        print("\n".join([f"Logged: {level}: {message}" for _, level, message in batch]))
+
+    def enable_async(self, sinks: Optional[List[LogSink]] = None, max_queue_size: int = 10_000,
+                     policy: str = "block", batch_size: int = 256) -> None:
+        """
+        Switches the logger to asynchronous mode: info/warning/error only enqueue
+        a record and a background writer delivers batches to `sinks`
+        (defaults to the in-memory log plus the console).
+        """
+        if self._writer is not None:
+            raise RuntimeError("Logger is already in async mode; call close() first.")
+        if sinks is None:
+            sinks = [self.memory_sink, self.console_sink]
+            if self._file_sink is not None:
+                sinks.append(self._file_sink)
+        type(self)._writer = AsyncLogWriter(sinks, max_queue_size, policy, batch_size)
+        atexit.register(self.close)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until all queued records were written. No-op in synchronous mode."""
+        writer = self._writer
+        return writer.flush(timeout) if writer is not None else True
+
+    def close(self) -> None:
+        """Drains the queue, stops the writer thread and returns to synchronous mode."""
+        writer = self._writer
+        if writer is None:
+            return
+        type(self)._writer = None
+        writer.close()
+        atexit.unregister(self.close)
+
+
+# --- Benchmark: per-call latency, synchronous vs asynchronous ---
+def _measure_calls(logger: Logger, num_calls: int) -> Tuple[float, float]:
+    """Returns (mean, p99) latency of logger.info() in microseconds."""
+    samples = []
+    for i in range(num_calls):
+        start = time.perf_counter_ns()
+        logger.info(f"request {i} handled")
+        samples.append(time.perf_counter_ns() - start)
+    samples.sort()
+    return sum(samples) / num_calls / 1000, samples[int(num_calls * 0.99)] / 1000
+
+
+def benchmark_logger(num_calls: int = 50_000) -> None:
+    logger = Logger()
+    saved_store = Logger._store
+    Logger._store = RingBufferLogStore(saved_store.capacity)  # keep the demo history intact
+    # Console output goes to a line-buffered file: like a terminal or a log file,
+    # every print() in synchronous mode costs one write syscall.
+    with tempfile.TemporaryFile("w", buffering=1) as sink_file, redirect_stdout(sink_file):
+        sync_mean, sync_p99 = _measure_calls(logger, num_calls)
+        logger.enable_async(max_queue_size=num_calls, policy="block")
+        async_mean, async_p99 = _measure_calls(logger, num_calls)
+        logger.flush()
+        logger.close()
+    Logger._store = saved_store
+
+    print(f"{'mode':<8}{'mean (us)':>12}{'p99 (us)':>12}")
+    print(f"{'sync':<8}{sync_mean:>12.2f}{sync_p99:>12.2f}")
+    print(f"{'async':<8}{async_mean:>12.2f}{async_p99:>12.2f}")
+
+
+# --- Benchmark: history memory stays flat ---
+def benchmark_history_memory(num_calls: int = 1_000_000, capacity: int = 10_000) -> None:
+    """Logs millions of messages into a bounded store and samples traced memory along the way."""
+    saved_store = Logger._store
+    store = Logger._store = RingBufferLogStore(capacity)
+    logger = Logger()
+    checkpoints = {num_calls // 100, num_calls // 10, num_calls // 2, num_calls}
+    tracemalloc.start()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for i in range(1, num_calls + 1):
+            logger.info(f"request {i} handled")
+            if i in checkpoints:
+                current, _ = tracemalloc.get_traced_memory()
+                print(f"{i:>10,} calls -> {current / 1024:>8.0f} KiB traced, {len(store)} entries kept",
+                      file=sys.__stdout__)
+    tracemalloc.stop()
+    print(f"Bookkeeping: {store.nbytes() / capacity:.0f} bytes/entry "
+          f"({store.nbytes() / 1024:.0f} KiB for {capacity} entries) + message strings")
+    Logger._store = saved_store
+
+
+# --- Benchmark: health-check poll vs history size ---
+def benchmark_error_poll(sizes: Tuple[int, ...] = (10_000, 100_000, 1_000_000), polls: int = 10) -> None:
+    """Counts ERRORs of the last minute with a full scan and with the indexes."""
+    print(f"{'entries':>10}{'scan (ms)':>12}{'indexed (ms)':>14}")
+    for size in sizes:
+        store = RingBufferLogStore(size)
+        now = time.time()
+        for i in range(size):  # one entry per millisecond, every 10th is an ERROR
+            store.append(now - (size - i) / 1000, 2 if i % 10 == 0 else 0, f"request {i} handled")
+        since = now - 60
+
+        start = time.perf_counter()
+        for _ in range(polls):
+            scanned = sum(1 for e in store.entries() if e.level == "ERROR" and e.timestamp >= since)
+        scan_ms = (time.perf_counter() - start) / polls * 1000
+
+        start = time.perf_counter()
+        for _ in range(polls):
+            indexed = store.count(level="ERROR", since=since)
+        indexed_ms = (time.perf_counter() - start) / polls * 1000
+
+        assert scanned == indexed
+        print(f"{size:>10,}{scan_ms:>12.3f}{indexed_ms:>14.4f}")
+
+
+# --- Benchmark: persistent write throughput ---
+def benchmark_file_sink(num_records: int = 200_000) -> None:
+    """Plain line-by-line file writes (flushed per record) vs the memory-mapped segment sink."""
+    records = [(time.time(), "INFO", f"request {i} handled") for i in range(num_records)]
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        with open(os.path.join(directory, "plain.log"), "w") as f:
+            for timestamp, level, message in records:
+                f.write(f"{timestamp:.6f} {level}: {message}\n")
+                f.flush()
+        plain_s = time.perf_counter() - start
+
+        sink = MmapSegmentSink(os.path.join(directory, "segments"), segment_size=1024 * 1024, max_segments=4)
+        start = time.perf_counter()
+        for record in records:
+            sink([record])
+        mmap_s = time.perf_counter() - start
+
+        # In async mode the writer thread hands the sink whole batches.
+        start = time.perf_counter()
+        for i in range(0, num_records, 256):
+            sink(records[i:i + 256])
+        batched_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        kept = sum(1 for _ in sink.entries())
+        read_s = time.perf_counter() - start
+        sink.close()
+
+    print(f"{'writer':<22}{'records/s':>14}")
+    print(f"{'line-by-line file':<22}{num_records / plain_s:>14,.0f}")
+    print(f"{'mmap segments':<22}{num_records / mmap_s:>14,.0f}")
+    print(f"{'mmap segments, batched':<22}{num_records / batched_s:>14,.0f}")
+    print(f"Read back {kept:,} retained entries from 4 x 1 MiB segments in {read_s * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    # Start the heavy setup in the background; Logger() below waits only for what is left.
+    Logger.warm_up()
+
+    print("\n--- Test 1: First Logger Instance ---")
+    logger1 = Logger()
+    logger1.info("Application started.")
+    logger1.warning("Potential configuration issue detected.")
+
+    print("\n--- Test 2: Second Logger Instance ---")
+    logger2 = Logger()
+    logger2.error("Critical error: Database connection lost!")
+    logger2.info("User logged in successfully.")
+
+    print("\n--- Test 3: Third Logger Instance ---")
+    logger3 = Logger()
+    logger3.warning("Low disk space.")
+
+    print("\n--- Verifying Singleton Behavior ---")
+    print(f"Are logger1 and logger2 the same object? {logger1 is logger2}")
+    print(f"Are logger1 and logger3 the same object? {logger1 is logger3}")
+
+    print("\n--- All Accumulated Logs (from logger1's perspective) ---")
+    for log in logger1.get_logs():
+        print(log)
+
+    print("\n--- All Accumulated Logs (from logger2's perspective) ---")
+    for log in logger2.get_logs():
+        print(log)
+
+    print(f"\nNumber of logs from logger1: {len(logger1.get_logs())}")
+    print(f"Number of logs from logger2: {len(logger2.get_logs())}")
+
+    print("\n--- Test 4: Asynchronous Batched Mode ---")
+    logger1.enable_async(max_queue_size=100, policy="drop_oldest")
+    logger1.info("Queued by the request thread.")
+    logger2.error("Also queued, written by the background writer.")
+    logger1.flush()
+    print(f"Number of logs after flush: {len(logger1.get_logs())}")
+    logger1.close()
+
+    print("\n--- Test 5: Indexed Queries ---")
+    t0 = time.time() - 3600
+    for entry in logger1.query(level="ERROR", since=t0, contains="Database"):
+        print(f"{entry.timestamp:.3f} {entry.format()}")
+    print(f"Errors in the last hour: {logger1.count(level='ERROR', since=t0)}")
 
+    print("\n--- Test 6: Persistent Segment Files ---")
+    saved_store = Logger._store
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger1.attach_file_sink(log_dir, segment_size=4096, max_segments=2)
+        logger1.error("Disk write failed: retrying.")
+        logger1.info("Disk write succeeded.")
+        logger1.detach_file_sink()
+        # Simulate a restart: a fresh history buffer is refilled from the segment files.
+        Logger._store = RingBufferLogStore()
+        logger1.attach_file_sink(log_dir, segment_size=4096, max_segments=2)
+        print(f"Restored logs: {list(logger1.get_logs())}")
+        print(f"Persisted errors: {[e.format() for e in logger1.query_persisted(level='ERROR')]}")
+        logger1.detach_file_sink()
 
-print("\n--- Test 1: First Logger Instance ---")
-logger1 = Logger()
-logger1.info("Application started.")
-logger1.warning("Potential configuration issue detected.")
+        # Async mode writes to the same segments; detaching drains the writer before closing them.
+        logger1.attach_file_sink(log_dir, segment_size=4096, max_segments=2, restore=False)
+        logger1.enable_async(sinks=[logger1.memory_sink, logger1._file_sink])
+        logger1._add_log("warning", "Queued for disk.")
+        logger1.detach_file_sink()
+        print(f"Async mode still on after detaching? {Logger._writer is not None}")
+        print(f"Lower-case level stored as: {[e.level for e in logger1.query(contains='Queued for disk')]}")
+    Logger._store = saved_store
 
-print("\n--- Test 2: Second Logger Instance ---")
-logger2 = Logger()
-logger2.error("Critical error: Database connection lost!")
-logger2.info("User logged in successfully.")
+    print(f"\nInit report: {LazySingleton.init_report()}")
 
-print("\n--- Test 3: Third Logger Instance ---")
-logger3 = Logger()
-logger3.warning("Low disk space.")
+    print("\n--- Benchmark: logger.info() latency ---")
+    benchmark_logger()
 
-print("\n--- Verifying Singleton Behavior ---")
-print(f"Are logger1 and logger2 the same object? {logger1 is logger2}")
-print(f"Are logger1 and logger3 the same object? {logger1 is logger3}")
+    print("\n--- Benchmark: history memory over millions of calls ---")
+    benchmark_history_memory()
 
-print("\n--- All Accumulated Logs (from logger1's perspective) ---")
-for log in logger1.get_logs():
-    print(log)
+    print("\n--- Benchmark: ERROR count poll (last 60 s) ---")
+    benchmark_error_poll()
 
-print("\n--- All Accumulated Logs (from logger2's perspective) ---")
-for log in logger2.get_logs():
-    print(log)
+    print("\n--- Benchmark: persistent writes ---")
+    benchmark_file_sink()
 
-\
-print(f"\nNumber of logs from logger1: {len(logger1.get_logs())}")
-print(f"Number of logs from logger2: {len(logger2.get_logs())}")
+    print("\n--- Newest 3 logs (formatted on read) ---")
+    for log in logger1.get_logs(last_n=3):
+        print(log)
@@ -1,64 +1,471 @@
+import atexit
+import datetime
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
 import time
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
 
-class ApplicationSettings:
-    _instance: 'ApplicationSettings' = None
+from lazy_singleton import LazySingleton
+
+SettingsListener = Callable[[str, Any, Any], None]  # (key, old value, new value)
+
+
+class SettingsSnapshot:
+    """
+    An immutable, versioned view of all settings. The underlying dict is never
+    mutated after publication, so readers share it without copying or locking.
+    (Values themselves are not deep-frozen; treat them as read-only.)
+    """
+    __slots__ = ("version", "settings")
+
+    def __init__(self, version: int, settings: Dict[str, Any]) -> None:
+        self.version = version
+        self.settings: Mapping[str, Any] = MappingProxyType(settings)
+
+
+class SettingsFileStore:
+    """
+    Write-behind persistence for settings, as two files:
+      - <path>:         a full JSON snapshot, replaced atomically on compaction.
+      - <path>.journal: append-only JSON lines, one per flush, holding only changed keys.
+    Startup reads the snapshot and replays the journal. `record()` never touches the
+    disk: changes are coalesced in memory and a background thread appends them once
+    writes have been quiet for `debounce_interval` (or at the latest after `max_delay`).
+    Values must be JSON-serializable; `record()` rejects others with TypeError. A failed
+    write keeps the changes pending, is counted in `write_errors` and retried later.
+
+    Every snapshot carries a generation and every journal line the generation it was
+    written under, so lines already folded into a snapshot are skipped on load, even
+    if a crash left the journal untruncated after a compaction.
+    """
+    def __init__(self, path: str, debounce_interval: float = 0.2, max_delay: float = 2.0,
+                 compact_after: int = 500) -> None:
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.debounce_interval = debounce_interval
+        self.max_delay = max_delay
+        self.compact_after = compact_after
+        self.journal_writes = 0
+        self.write_errors = 0
+        self.last_error: Optional[Exception] = None
+        self._state: Dict[str, Any] = {}
+        self._pending: Dict[str, Any] = {}
+        self._first_pending_at = 0.0
+        self._last_change_at = 0.0
+        self._journal_lines = 0
+        self._generation = 0
+        self._closed = False
+        self._cond = threading.Condition()  # guards the pending changes, never held during disk I/O
+        self._io_lock = threading.Lock()    # one writer at a time, so flushes reach the disk in order
+        self._thread = threading.Thread(target=self._run, name="SettingsFileStore", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def load(self) -> Dict[str, Any]:
+        """Returns the persisted settings (snapshot + journal), or {} on first start."""
+        state: Dict[str, Any] = {}
+        generation = 0
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if set(snapshot) == {"generation", "settings"}:
+                generation, state = snapshot["generation"], snapshot["settings"]
+            else:
+                state = snapshot  # a plain settings file, e.g. written by hand
+        lines = 0
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn last line from a crash mid-append
+                    lines += 1
+                    if entry["gen"] == generation:  # older lines are already in the snapshot
+                        state.update(entry["set"])
+        with self._io_lock, self._cond:
+            self._state = dict(state)
+            self._generation = generation
+            self._journal_lines = lines
+        return state
+
+    def record(self, changes: Mapping[str, Any]) -> None:
+        """Queues changes for the next background flush (later values overwrite earlier ones)."""
+        try:
+            json.dumps(dict(changes))
+        except (TypeError, ValueError) as exc:
+            raise TypeError(f"Settings must be JSON-serializable to be persisted: {exc}") from None
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_pending_at = now
+            self._pending.update(changes)
+            self._last_change_at = now
+            self._cond.notify()
+
+    def flush(self) -> None:
+        """Writes pending changes now."""
+        self._write_pending()
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._write_pending()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if not self._pending:
+                        self._cond.wait()
+                        continue
+                    now = time.monotonic()
+                    due = min(self._last_change_at + self.debounce_interval,
+                              self._first_pending_at + self.max_delay)
+                    if now >= due:
+                        break
+                    self._cond.wait(due - now)
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        # The disk I/O runs outside self._cond, so record() (and thus set_setting()) never waits for it.
+        with self._io_lock:
+            with self._cond:
+                if not self._pending:
+                    return
+                changes, self._pending = self._pending, {}
+                compact = self._journal_lines >= self.compact_after
+            try:
+                if compact:
+                    self._compact({**self._state, **changes}, self._generation + 1)
+                else:
+                    line = json.dumps({"gen": self._generation, "set": changes}, separators=(",", ":")) + "\n"
+                    with open(self.journal_path, "a", encoding="utf-8") as f:
+                        f.write(line)
+            except Exception as exc:  # keep the changes and the flusher thread; retry after a debounce
+                with self._cond:
+                    changes.update(self._pending)
+                    self._pending = changes
+                    self._first_pending_at = self._last_change_at = time.monotonic()
+                    self.write_errors += 1
+                    self.last_error = exc
+                print(f"SettingsFileStore: write to {self.journal_path} failed, will retry: {exc}", file=sys.stderr)
+                return
+            self._state.update(changes)
+            if compact:
+                self._generation += 1
+                self._journal_lines = 0
+            else:
+                self._journal_lines += 1
+            self.journal_writes += 1
+
+    def _compact(self, state: Dict[str, Any], generation: int) -> None:
+        """
+        Folds the journal into a fresh snapshot (written to a temp file, then renamed).
+        The journal is truncated afterwards; until then its lines belong to an older
+        generation and load() ignores them.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"generation": generation, "settings": state}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        open(self.journal_path, "w").close()
+
+
+class ApplicationSettings(LazySingleton):
     _initialized: bool = False
+    verbose: bool = True  # print on every write (the original behaviour)
+    _write_lock = threading.Lock()
+    _file_store: Optional[SettingsFileStore] = None
+    _listeners: Dict[Optional[str], List[SettingsListener]] = {}
 
     def __new__(cls) -> 'ApplicationSettings':
-        if not cls._instance:
+        instance, created = cls._get_or_create_instance()
+        if created:
             print("Creating a new ApplicationSettings instance...")
-            instance = super().__new__(cls)
-            cls._instance = instance
         else:
             print("Using existing ApplicationSettings instance...")
-        return cls._instance
+        return instance
 
     def __init__(self) -> None:
-        default_settings: dict[str, Any] = {
+        if self._initialized:
+            print("Object already initialized")
+            return
+        # Runs _initialize() exactly once, even if several threads (or warm_up()) get here first.
+        self.ensure_initialized()
+
+    @classmethod
+    def use_file_store(cls, path: str, debounce_interval: float = 0.2) -> SettingsFileStore:
+        """
+        Persists settings under `path`. Call before the first ApplicationSettings();
+        a store configured earlier is closed (its pending changes written) and replaced.
+        """
+        if cls._init_started:
+            raise RuntimeError("Configure the file store before ApplicationSettings is initialized.")
+        if cls._file_store is not None:
+            cls._file_store.close()
+        cls._file_store = SettingsFileStore(path, debounce_interval)
+        return cls._file_store
+
+    def _initialize(self) -> None:
+        defaults: Dict[str, Any] = {
             "theme": "dark",
             "default_path": "/home/user/documents",
             "recent_files": []}
-        if not self._initialized:
-            print(f"Intializing a new instance with default settings..")
-            time.sleep(1)
-            self._settings = default_settings
-            self._initialized = True
-            print("Initialization complete")
+        if self._file_store is not None:
+            print(f"Loading settings from {self._file_store.path}..")
+            defaults.update(self._file_store.load())
         else:
-            print("Object already initialized")
+            print(f"Intializing a new instance with default settings..")
+            time.sleep(1)  # simulated load from a file
+        self._snapshot = SettingsSnapshot(0, defaults)
+        self._initialized = True
+        print("Initialization complete")
 
+    # Reads: one attribute load of the current snapshot, no lock and no copy.
     def get_setting(self, key: str) -> Any:
-        return self._settings[key]
+        return self._snapshot.settings[key]
+
+    def get_all_settings(self) -> Mapping[str, Any]:
+        """Returns a read-only view of the current version (O(1), never changes under you)."""
+        return self._snapshot.settings
+
+    def snapshot(self) -> SettingsSnapshot:
+        return self._snapshot
 
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def is_stale(self, version: int) -> bool:
+        """Cheap check for callers that cache a snapshot: has anything been written since?"""
+        return self._snapshot.version != version
+
+    # Writes: copy-on-write under a writer lock, then publish with a single reference swap.
     def set_setting(self, key: str, value: Any):
-        if key in self._settings:
-            print(f"Updating exiting setting for {key} from {self._settings.get(key)} to new setting value: {value}")
-        else:
-            print("Setting update complete")
+        self.set_settings({key: value})
+
+    def set_settings(self, changes: Mapping[str, Any]) -> None:
+        """Applies several changes as one new version (one copy instead of one per key)."""
+        with self._write_lock:
+            current = self._snapshot
+            if self._file_store is not None:
+                # Journaled in publication order; a value that cannot be persisted is rejected
+                # (TypeError) before anything is published.
+                self._file_store.record(changes)
+            if self.verbose:
+                for key, value in changes.items():
+                    if key in current.settings:
+                        print(f"Updating exiting setting for {key} from {current.settings[key]} to new setting value: {value}")
+                    else:
+                        print("Setting update complete")
+            updated = dict(current.settings)
+            updated.update(changes)
+            self._snapshot = SettingsSnapshot(current.version + 1, updated)
+            listeners = self._listeners
+        # Notify outside the lock so callbacks may read or even write settings.
+        for key, value in changes.items():
+            old = current.settings.get(key)
+            if old == value and key in current.settings:
+                continue
+            for listener in listeners.get(key, []) + listeners.get(None, []):
+                try:
+                    listener(key, old, value)
+                except Exception as exc:  # one broken component must not break the writer
+                    print(f"ApplicationSettings: listener {listener!r} failed: {exc}", file=sys.stderr)
+
+    # Change notifications: react to updates instead of polling get_setting().
+    def on_change(self, key: Optional[str], listener: SettingsListener) -> Callable[[], None]:
+        """
+        Calls `listener(key, old, new)` whenever `key` changes (key=None: any key).
+        Returns a function that unsubscribes the listener.
+        """
+        with self._write_lock:
+            listeners = dict(self._listeners)  # copy-on-write, like the settings themselves
+            listeners[key] = listeners.get(key, []) + [listener]
+            type(self)._listeners = listeners
+
+        def unsubscribe() -> None:
+            with self._write_lock:
+                listeners = dict(self._listeners)
+                listeners[key] = [l for l in listeners.get(key, []) if l is not listener]
+                type(self)._listeners = listeners
+        return unsubscribe
+
+    def flush(self) -> None:
+        """Forces pending changes to disk (no-op without a file store)."""
+        if self._file_store is not None:
+            self._file_store.flush()
+
+
+# --- Benchmark: many readers, one writer ---
+class _CopyingSettings:
+    """The previous design: a shared dict, copied on every read, mutated in place."""
+    def __init__(self, settings: Dict[str, Any]) -> None:
+        self._settings = dict(settings)
+
+    def get_setting(self, key: str) -> Any:
+        return self._settings[key]
+
+    def set_setting(self, key: str, value: Any) -> None:
         self._settings[key] = value
 
-    def get_all_settings(self) -> dict[str, Any]:
+    def get_all_settings(self) -> Dict[str, Any]:
         return self._settings.copy()
 
-app1 = ApplicationSettings()
-app2 = ApplicationSettings()
-app3 = ApplicationSettings()
 
-app1.set_setting(key='theme', value="light_modern")
+def benchmark_settings(reader_counts: Sequence[int] = (1, 4, 16), duration: float = 0.5,
+                       num_keys: int = 200) -> None:
+    """Total reads/s of get_all_settings() + get_setting() with one writer updating 100x/s."""
+    app = ApplicationSettings()
+    app.verbose = False
+    app.set_settings({f"key_{i}": i for i in range(num_keys)})
+    stores = {"dict.copy()": _CopyingSettings(dict(app.get_all_settings())), "snapshot": app}
+
+    print(f"{'readers':>8}" + "".join(f"{name:>16}" for name in stores))
+    for readers in reader_counts:
+        row = f"{readers:>8}"
+        for store in stores.values():
+            stop = threading.Event()
+            counts = [0] * readers
+
+            def reader(slot: int) -> None:
+                n = 0
+                while not stop.is_set():
+                    all_settings = store.get_all_settings()
+                    store.get_setting("theme")
+                    n += len(all_settings) > 0
+                counts[slot] = n
+
+            def writer() -> None:
+                i = 0
+                while not stop.is_set():
+                    store.set_setting("key_0", i)
+                    i += 1
+                    time.sleep(0.01)
+
+            threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+            threads.append(threading.Thread(target=writer))
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            time.sleep(duration)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start  # includes GIL hand-off delays of the main thread
+            row += f"{sum(counts) / elapsed:>16,.0f}"
+        print(row)
+    app.verbose = True
+
+
+if __name__ == "__main__":
+    # Pretend a previous run left a settings file behind; loading it replaces the simulated 1 s load.
+    settings_dir = tempfile.mkdtemp()
+    settings_path = os.path.join(settings_dir, "settings.json")
+    with open(settings_path, "w", encoding="utf-8") as f:
+        json.dump({"default_path": "/home/user/projects"}, f)
+    abandoned = ApplicationSettings.use_file_store(settings_path)  # configured twice by mistake
+    store = ApplicationSettings.use_file_store(settings_path, debounce_interval=0.05)
+    print(f"Reconfigured the file store; the first one was closed: {not abandoned._thread.is_alive()}")
+
+    # Kick off the load at startup; the first real access only waits for the remainder.
+    ApplicationSettings.warm_up()
+
+    app1 = ApplicationSettings()
+    app2 = ApplicationSettings()
+    app3 = ApplicationSettings()
+
+    app1.set_setting(key='theme', value="light_modern")
+
+    try:
+        ApplicationSettings.use_file_store(settings_path)
+    except RuntimeError as exc:
+        print(f"Too late to switch stores: {exc}")
+
+    print("\n--- Verifying Singleton Behavior ---")
+    print(f"Are app1 and app2 the same object? {app1 is app2}")
+    print(f"Are app1 and app3 the same object? {app1 is app3}")
+
+    print("\n--- All Settings (from app1's perspective) ---")
+    for key, value in app1.get_all_settings().items():
+        print(f"{key}: {value}")
+
+    print("\n--- All Settings (from app2's perspective) ---")
+    for key, value in app2.get_all_settings().items():
+        print(f"{key}: {value}")
+
+    print("\n--- All Settings (from app3's perspective) ---")
+    for key, value in app3.get_all_settings().items():
+        print(f"{key}: {value}")
+
+    print(f"\nInit report: {LazySingleton.init_report()}")
+
+    print("\n--- Versioned Snapshots ---")
+    cached = app1.snapshot()
+    print(f"Cached version {cached.version}, stale? {app1.is_stale(cached.version)}")
+    app2.set_setting(key="recent_files", value=["notes.txt"])
+    print(f"After a write: stale? {app1.is_stale(cached.version)}; "
+          f"cached theme still {cached.settings['theme']!r}, new version {app1.version}")
+    try:
+        app1.get_all_settings()["theme"] = "hacked"
+    except TypeError as exc:
+        print(f"Snapshots are read-only: {exc}")
+
+    print("\n--- Change Notifications + Write-Behind Persistence ---")
+    unsubscribe = app1.on_change("theme", lambda key, old, new: print(f"  [UI] {key}: {old} -> {new}"))
+    app1.verbose = False
+    for i in range(1000):  # a burst of writes, e.g. a slider being dragged
+        app1.set_setting("font_size", 10 + i % 8)
+    app1.set_setting("theme", "solarized")
+    unsubscribe()
+    app1.set_setting("theme", "high_contrast")  # no longer reported
+    time.sleep(0.2)  # let the debounce interval elapse
+    print(f"1002 set_setting() calls -> {store.journal_writes} journal append(s)")
+
+    start = time.perf_counter()
+    restarted_store = SettingsFileStore(settings_path)
+    restarted = restarted_store.load()  # what the next cold start would see
+    restarted_store.close()
+    print(f"Restart would load {restarted} in {(time.perf_counter() - start) * 1000:.2f} ms")
 
-print("\n--- Verifying Singleton Behavior ---")
-print(f"Are app1 and app2 the same object? {app1 is app2}")
-print(f"Are app1 and app3 the same object? {app1 is app3}")
+    # A crash after the compacted snapshot is renamed in but before the journal is truncated.
+    crash_store = SettingsFileStore(os.path.join(settings_dir, "crash.json"), compact_after=1)
+    crash_store.record({"theme": "old"})
+    crash_store.flush()  # a journal line of generation 0
+    with open(crash_store.journal_path, encoding="utf-8") as f:
+        stale_journal = f.read()
+    crash_store.record({"theme": "new"})
+    crash_store.flush()  # compacted into the generation 1 snapshot
+    crash_store.close()
+    with open(crash_store.journal_path, "w", encoding="utf-8") as f:
+        f.write(stale_journal)
+    reloaded = SettingsFileStore(crash_store.path)
+    print(f"Journal left behind by a crash mid-compaction: theme reloads as {reloaded.load()['theme']!r}")
+    reloaded.close()
 
-print("\n--- All Settings (from app1's perspective) ---")
-for key, value in app1.get_all_settings().items():
-    print(f"{key}: {value}")
+    try:
+        app1.set_setting("last_backup", datetime.date(2024, 1, 1))
+    except TypeError as exc:
+        print(f"Rejected before publishing: {exc}")
+    print(f"last_backup published? {'last_backup' in app1.get_all_settings()}; "
+          f"flusher alive? {store._thread.is_alive()}")
 
-print("\n--- All Settings (from app2's perspective) ---")
-for key, value in app2.get_all_settings().items():
-    print(f"{key}: {value}")
+    print("\n--- Benchmark: reads/s with a concurrent writer ---")
+    benchmark_settings()
 
-print("\n--- All Settings (from app3's perspective) ---")
-for key, value in app3.get_all_settings().items():
-    print(f"{key}: {value}")
+    store.close()
+    shutil.rmtree(settings_dir)
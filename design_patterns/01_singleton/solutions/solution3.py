@@ -1,50 +1,789 @@
+import asyncio
+import atexit
+import multiprocessing
+import os
+import random
 import threading
-from typing import List, Optional
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from multiprocessing import shared_memory
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
-class ThreadSafeResourcePool:
-    _instance: Optional['ThreadSafeResourcePool'] = None
-    _lock = threading.Lock() # Lock for thread-safe instantiation and resource operations
 
-    def __new__(cls, size: int = 3, *args, **kwargs) -> 'ThreadSafeResourcePool':
-        """Ensures single instance creation using double-checked locking."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    # Create and initialize the instance under the lock
-                    cls._instance = super().__new__(cls)
-                    cls._instance.available_resources: List[str] = [f"Res-{i+1}" for i in range(size)]
-                    cls._instance.resources_in_use: List[str] = []
-        return cls._instance
+class _Waiter:
+    """
+    A thread blocked in acquire(); release() hands it a resource directly (FIFO).
+    `ready` is created locked and released once by the hand-off: cheaper than a
+    Condition, which allocates a lock per wait and re-takes the pool lock on wake-up.
+    """
+    __slots__ = ("ready", "resource")
+
+    def __init__(self) -> None:
+        self.ready = threading.Lock()
+        self.ready.acquire()
+        self.resource: Optional[str] = None
 
+
+class ResourcePool:
+    """
+    The pool mechanics, without the singleton part:
+      - free resources:  a deque  -> O(1) popleft/append
+      - in-use:          a set    -> O(1) membership check and removal
+      - blocked callers: a FIFO deque of waiters. A released resource goes straight
+        to the longest-waiting caller, so newcomers cannot overtake it.
+    Fairness has a throughput cost: once callers queue, every release is a thread
+    hand-off, and a thread that releases and re-acquires must wait its turn instead of
+    taking the resource straight back. With many more threads than resources (e.g. 64
+    threads on 4 resources in benchmark_pool) this can run 2-3x slower than a pool that
+    lets callers barge in; in exchange no caller waits behind later arrivals.
+    """
     def __init__(self, size: int = 3) -> None:
-        # Pass (Initialization handled in __new__)
-        pass
+        self._setup(size)
+
+    def _setup(self, size: int) -> None:
+        self._size = size
+        self._pool_lock = threading.Lock()
+        self.available_resources: Deque[str] = deque(f"Res-{i+1}" for i in range(size))
+        self.resources_in_use: Set[str] = set()
+        self._waiters: Deque[_Waiter] = deque()
 
     def acquire_resource(self) -> str:
-        """Acquires a resource from the pool (thread-safe)."""
-        with self._lock:
-            if not self.available_resources:
+        """Acquires a resource from the pool (thread-safe). Raises ValueError if none is free."""
+        with self._pool_lock:
+            if not self.available_resources or self._waiters:
                 raise ValueError("Pool empty!")
-            resource = self.available_resources.pop(0)
-            self.resources_in_use.append(resource)
+            resource = self.available_resources.popleft()
+            self.resources_in_use.add(resource)
             return resource
 
+    def acquire(self, timeout: Optional[float] = None) -> str:
+        """
+        Acquires a resource, waiting up to `timeout` seconds (None: forever) for one
+        to be released. Waiters are served first-come, first-served.
+        Raises TimeoutError if no resource became available in time.
+        """
+        with self._pool_lock:
+            if self.available_resources and not self._waiters:
+                resource = self.available_resources.popleft()
+                self.resources_in_use.add(resource)
+                return resource
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+        if not waiter.ready.acquire(timeout=-1 if timeout is None else max(0.0, timeout)):
+            with self._pool_lock:
+                if waiter.resource is None:  # not handed one while the timeout fired
+                    self._waiters.remove(waiter)  # O(n), but only on the timeout path
+                    raise TimeoutError(f"No resource became available within {timeout} s.")
+        return waiter.resource
+
     def release_resource(self, resource: str) -> None:
         """Releases a resource back to the pool (thread-safe)."""
-        with self._lock:
+        with self._pool_lock:
             if resource not in self.resources_in_use:
                 return # Fail silently or raise error, keeping it minimal here
-
-            self.resources_in_use.remove(resource)
+            if self._waiters:
+                # Hand-off: the resource stays "in use", now owned by the oldest waiter.
+                waiter = self._waiters.popleft()
+                waiter.resource = resource
+                waiter.ready.release()
+                return
+            self.resources_in_use.discard(resource)
             self.available_resources.append(resource)
 
+    @contextmanager
+    def resource(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """`with pool.resource(timeout=1.0) as res:` -- released even if the block raises."""
+        acquired = self.acquire(timeout)
+        try:
+            yield acquired
+        finally:
+            self.release_resource(acquired)
+
     def get_pool_status(self) -> str:
         """Returns current pool status (thread-safe read)."""
-        # Lock is necessary to ensure consistent reading of both lists
-        with self._lock:
+        # Lock is necessary to ensure consistent reading of both collections
+        with self._pool_lock:
             return (f"Avail: {len(self.available_resources)}. "
                     f"In Use: {len(self.resources_in_use)}.")
 
+
+class _Shard:
+    """One independently locked sub-pool. `free` is a dict used as an ordered set."""
+    __slots__ = ("lock", "free", "in_use")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.free: Dict[str, None] = {}
+        self.in_use: Set[str] = set()
+
+
+class ShardedResourcePool(ResourcePool):
+    """
+    Low-contention variant: resources are spread over `shards` sub-pools, each with
+    its own lock, so threads rarely queue on the same lock.
+      - fast path: a thread first asks for the resource it released last (still warm);
+        otherwise it starts at its own home shard, picking the most recently freed one.
+      - work stealing: when that shard is empty, it scans the other shards.
+      - status: summed from per-shard sizes without taking any lock.
+    Blocked acquire() calls wait on a shared condition and are not strictly FIFO.
+    """
+    def __init__(self, size: int = 3, shards: int = 4) -> None:
+        self._setup(size, shards)
+
+    def _setup(self, size: int, shards: int = 4) -> None:
+        self._size = size
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._home: Dict[str, _Shard] = {}  # resource -> owning shard, fixed after setup
+        for i in range(size):
+            resource = f"Res-{i+1}"
+            shard = self._shards[i % len(self._shards)]
+            shard.free[resource] = None
+            self._home[resource] = shard
+        self._local = threading.local()
+        self._available = threading.Condition()
+        self._waiting = 0
+
+    def _try_acquire(self) -> Optional[str]:
+        local = self._local
+        last = getattr(local, "last_released", None)
+        if last is not None:
+            local.last_released = None
+            shard = self._home[last]
+            with shard.lock:
+                if last in shard.free:
+                    del shard.free[last]
+                    shard.in_use.add(last)
+                    return last
+        start = getattr(local, "home_shard", None)
+        if start is None:
+            start = local.home_shard = threading.get_ident() % len(self._shards)
+        shards = self._shards
+        for offset in range(len(shards)):
+            shard = shards[(start + offset) % len(shards)]
+            if not shard.free:  # unlocked peek: skip obviously empty shards
+                continue
+            with shard.lock:
+                if shard.free:
+                    resource = shard.free.popitem()[0]
+                    shard.in_use.add(resource)
+                    return resource
+        return None
+
+    def acquire_resource(self) -> str:
+        resource = self._try_acquire()
+        if resource is None:
+            raise ValueError("Pool empty!")
+        return resource
+
+    def acquire(self, timeout: Optional[float] = None) -> str:
+        resource = self._try_acquire()
+        if resource is not None:
+            return resource
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._available:
+            self._waiting += 1
+            try:
+                while True:
+                    resource = self._try_acquire()
+                    if resource is not None:
+                        return resource
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No resource became available within {timeout} s.")
+                    self._available.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+    def release_resource(self, resource: str) -> None:
+        shard = self._home.get(resource)
+        if shard is None:
+            return
+        with shard.lock:
+            if resource not in shard.in_use:
+                return
+            shard.in_use.discard(resource)
+            shard.free[resource] = None
+        self._local.last_released = resource
+        if self._waiting:
+            with self._available:
+                self._available.notify()
+
+    @property
+    def available_resources(self) -> List[str]:
+        return [resource for shard in self._shards for resource in list(shard.free)]
+
+    @property
+    def resources_in_use(self) -> Set[str]:
+        return {resource for shard in self._shards for resource in list(shard.in_use)}
+
+    def get_pool_status(self) -> str:
+        """Lock-free: len() of each shard is atomic, the sum may be momentarily stale."""
+        available = sum(len(shard.free) for shard in self._shards)
+        return f"Avail: {available}. In Use: {self._size - available}."
+
+
+class ElasticResourcePool(ResourcePool):
+    """
+    A pool of real resources built by `factory`, sized between `min_size` and `max_size`:
+      - grows on demand: an acquire() that finds no idle resource creates one (outside
+        the lock, so slow connects do not block other callers) while below max_size.
+      - shrinks when quiet: resources idle for longer than `idle_ttl` are destroyed,
+        down to min_size.
+      - validate-on-borrow: `validate(resource)` runs before a resource is handed out;
+        broken ones are destroyed and replaced transparently.
+      - a maintenance thread (every `maintenance_interval` s) evicts idle resources,
+        recycles broken idle ones and tops the pool back up to min_size.
+    Idle resources are reused most-recently-released first, so the least recently
+    used ones sit at the other end of the deque and age out in O(1).
+    """
+    def __init__(self, factory: Callable[[], Any], min_size: int = 1, max_size: int = 10,
+                 idle_ttl: float = 60.0, validate: Optional[Callable[[Any], bool]] = None,
+                 destroy: Optional[Callable[[Any], None]] = None,
+                 maintenance_interval: Optional[float] = 5.0) -> None:
+        self._setup(factory, min_size, max_size, idle_ttl, validate, destroy, maintenance_interval)
+
+    def _setup(self, factory: Callable[[], Any], min_size: int = 1, max_size: int = 10,
+               idle_ttl: float = 60.0, validate: Optional[Callable[[Any], bool]] = None,
+               destroy: Optional[Callable[[Any], None]] = None,
+               maintenance_interval: Optional[float] = 5.0) -> None:
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError("Need 0 <= min_size <= max_size and max_size >= 1.")
+        self._factory = factory
+        self._validate = validate
+        self._destroy = destroy
+        self.min_size = min_size
+        self.max_size = max_size
+        self._size = max_size
+        self.idle_ttl = idle_ttl
+        self._pool_lock = threading.Lock()
+        self._changed = threading.Condition(self._pool_lock)
+        self._idle: Deque[Tuple[Any, float]] = deque()  # (resource, released at), newest on the right
+        self.resources_in_use: Set[Any] = set()
+        self._creating = 0
+        self._checking = 0  # idle resources taken out by run_maintenance() for validation
+        self._closed = False
+        self.stats = {"created": 0, "evicted": 0, "recycled": 0}
+        for _ in range(min_size):
+            self._idle.append((self._create(), time.monotonic()))
+        self._stop = threading.Event()
+        self._maintenance: Optional[threading.Thread] = None
+        if maintenance_interval:
+            self._maintenance = threading.Thread(target=self._maintenance_loop, args=(maintenance_interval,),
+                                                 name="PoolMaintenance", daemon=True)
+            self._maintenance.start()
+
+    @property
+    def available_resources(self) -> List[Any]:
+        return [resource for resource, _ in self._idle]
+
+    def _total(self) -> int:
+        return len(self._idle) + len(self.resources_in_use) + self._creating + self._checking
+
+    def _create(self) -> Any:
+        resource = self._factory()
+        with self._pool_lock:
+            self.stats["created"] += 1
+        return resource
+
+    def _discard(self, resource: Any) -> None:
+        if self._destroy is not None:
+            try:
+                self._destroy(resource)
+            except Exception:
+                pass  # it is being thrown away anyway
+
+    def _is_healthy(self, resource: Any) -> bool:
+        if self._validate is None:
+            return True
+        try:
+            return bool(self._validate(resource))
+        except Exception:
+            return False
+
+    def acquire_resource(self) -> Any:
+        try:
+            return self.acquire(timeout=0)
+        except TimeoutError:
+            raise ValueError("Pool empty!") from None
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._pool_lock:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Pool is closed.")
+                    if self._idle:
+                        resource, _ = self._idle.pop()
+                        self.resources_in_use.add(resource)  # reserved while we validate it
+                        create = False
+                        break
+                    if self._total() < self.max_size:
+                        self._creating += 1  # reserve the slot, create outside the lock
+                        create = True
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No resource became available within {timeout} s.")
+                    self._changed.wait(remaining)
+
+            if create:
+                try:
+                    resource = self._create()
+                except BaseException:
+                    with self._pool_lock:
+                        self._creating -= 1
+                        self._changed.notify()
+                    raise
+                with self._pool_lock:
+                    self._creating -= 1
+                    self.resources_in_use.add(resource)
+                return resource
+
+            if self._is_healthy(resource):
+                return resource
+            with self._pool_lock:  # broken: drop it and try again (its slot is free now)
+                self.resources_in_use.discard(resource)
+                self.stats["recycled"] += 1
+                self._changed.notify()
+            self._discard(resource)
+
+    def release_resource(self, resource: Any) -> None:
+        with self._pool_lock:
+            if resource not in self.resources_in_use:
+                return
+            self.resources_in_use.discard(resource)
+            if not self._closed:
+                self._idle.append((resource, time.monotonic()))
+                self._changed.notify()
+                return
+        self._discard(resource)
+
+    def run_maintenance(self) -> None:
+        """One maintenance pass: evict idle-too-long, recycle broken idle ones, top up to min_size."""
+        now = time.monotonic()
+        doomed: List[Any] = []
+        with self._pool_lock:
+            while (self._idle and self._total() > self.min_size
+                   and now - self._idle[0][1] > self.idle_ttl):
+                doomed.append(self._idle.popleft()[0])
+                self.stats["evicted"] += 1
+            # Take the idle ones out so no borrower can get a resource while it is validated.
+            checking = list(self._idle) if self._validate is not None else []
+            if checking:
+                self._idle.clear()
+                self._checking = len(checking)
+
+        if checking:
+            healthy, broken = [], []
+            for item in checking:
+                (healthy if self._is_healthy(item[0]) else broken).append(item)
+            with self._pool_lock:
+                self._checking = 0
+                if self._closed:
+                    doomed.extend(resource for resource, _ in checking)
+                else:
+                    self._idle.extendleft(reversed(healthy))  # older than anything released meanwhile
+                    doomed.extend(resource for resource, _ in broken)
+                    self.stats["recycled"] += len(broken)
+                self._changed.notify_all()
+        for resource in doomed:
+            self._discard(resource)
+
+        while True:
+            with self._pool_lock:
+                if self._closed or self._total() >= self.min_size:
+                    return
+                self._creating += 1
+            try:
+                resource = self._create()
+            except BaseException:
+                with self._pool_lock:
+                    self._creating -= 1
+                raise
+            with self._pool_lock:
+                self._creating -= 1
+                self._idle.append((resource, time.monotonic()))
+                self._changed.notify()
+
+    def _maintenance_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.run_maintenance()
+            except Exception:
+                pass  # e.g. the backend is down; retry on the next pass
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stops maintenance (waiting up to `timeout` s for a pass in progress) and destroys
+        idle resources; in-use ones are destroyed on release.
+        """
+        self._stop.set()
+        maintenance = self._maintenance
+        if maintenance is not None and maintenance is not threading.current_thread():
+            maintenance.join(timeout)
+        with self._pool_lock:
+            self._closed = True
+            doomed = [resource for resource, _ in self._idle]
+            self._idle.clear()
+            self._changed.notify_all()
+        for resource in doomed:
+            self._discard(resource)
+
+    def get_pool_status(self) -> str:
+        with self._pool_lock:
+            return (f"Avail: {len(self._idle)}. In Use: {len(self.resources_in_use)}. "
+                    f"Total: {self._total()} (min {self.min_size}, max {self.max_size}).")
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+def _process_start_time(pid: int) -> int:
+    """The process's start time in clock ticks since boot (Linux), or 0 where unknown."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return 0
+    return int(stat[stat.rindex(b")") + 2:].split()[19])  # field 22: starttime
+
+
+_own_start_time: Dict[int, int] = {}  # pid -> start time; keyed by pid because fork changes it
+
+
+def _owner_alive(pid: int, start_time: int) -> bool:
+    """True if `pid` is still the process that took the lease (not a later one reusing the pid)."""
+    if not _pid_alive(pid):
+        return False
+    return start_time == 0 or _process_start_time(pid) in (0, start_time)
+
+
+class SharedMemoryResourcePool(ResourcePool):
+    """
+    One logical pool shared by several processes on a host (e.g. pre-fork workers).
+    Create it in the parent before forking; children inherit the mapping and the lock.
+    Only the "fork" start method works: the lock and the mapping cannot be passed to
+    spawn/forkserver children, so pickling the pool raises RuntimeError.
+
+    Slot state lives in a `multiprocessing.shared_memory` block of int64 values:
+      [0]                     number of free slots (top of the free stack)
+      [1 .. size]             free stack of slot indexes  -> O(1) acquire/release
+      [size+1 .. 2*size]      owner pid per slot (0 = free)
+      [2*size+1 .. 3*size]    owner start time per slot (Linux /proc; 0 = unknown)
+    guarded by a process-shared `multiprocessing.Condition`.
+
+    A process that dies while holding leases never releases them; acquire() reclaims
+    slots whose owner no longer exists whenever the free stack runs dry. An owner is
+    identified by (pid, start time), so a new process that reuses a dead owner's pid does
+    not keep its lease alive (where the start time is unavailable, only the pid is checked).
+    The dead process must have been reaped by its parent -- a zombie still counts as alive.
+
+    Limits: only leases are recovered. A process killed while it holds the Condition's
+    lock (inside acquire/release, a few memory writes) leaves it locked and every other
+    process deadlocks; a plain POSIX semaphore offers no owner-death recovery.
+    """
+    def __init__(self, size: int = 3) -> None:
+        self._setup(size)
+
+    def _setup(self, size: int) -> None:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("SharedMemoryResourcePool needs the 'fork' start method (POSIX).")
+        self._size = size
+        self._names = [f"Res-{i+1}" for i in range(size)]
+        self._slot_of = {name: i for i, name in enumerate(self._names)}
+        self._shm = shared_memory.SharedMemory(create=True, size=8 * (3 * size + 1))
+        self._slots = self._shm.buf.cast("q")
+        self._slots[0] = size
+        for position in range(size):  # stack top hands out Res-1 first
+            self._slots[1 + position] = size - 1 - position
+        for slot in range(2 * size):
+            self._slots[1 + size + slot] = 0
+        fork = multiprocessing.get_context("fork")
+        self._cond = fork.Condition(fork.Lock())
+        self._creator_pid = os.getpid()
+        atexit.register(self.close)
+
+    # --- slot operations (call with self._cond held) ---
+    def _pop_free(self) -> Optional[int]:
+        top = self._slots[0]
+        if top == 0:
+            return None
+        top -= 1
+        slot = self._slots[1 + top]
+        self._slots[0] = top
+        pid = os.getpid()
+        if pid not in _own_start_time:
+            _own_start_time[pid] = _process_start_time(pid)
+        self._slots[1 + self._size + slot] = pid
+        self._slots[1 + 2 * self._size + slot] = _own_start_time[pid]
+        return slot
+
+    def _push_free(self, slot: int) -> None:
+        self._slots[1 + self._size + slot] = 0
+        self._slots[1 + 2 * self._size + slot] = 0
+        top = self._slots[0]
+        self._slots[1 + top] = slot
+        self._slots[0] = top + 1
+
+    def _reclaim_locked(self) -> int:
+        reclaimed = 0
+        for slot in range(self._size):
+            pid = self._slots[1 + self._size + slot]
+            if pid and not _owner_alive(pid, self._slots[1 + 2 * self._size + slot]):
+                self._push_free(slot)
+                reclaimed += 1
+        if reclaimed:
+            self._cond.notify_all()
+        return reclaimed
+
+    def reclaim_dead_leases(self) -> int:
+        """Frees slots held by processes that no longer exist. Returns how many were freed."""
+        with self._cond:
+            return self._reclaim_locked()
+
+    def acquire_resource(self) -> str:
+        with self._cond:
+            slot = self._pop_free()
+            if slot is None and self._reclaim_locked():
+                slot = self._pop_free()
+        if slot is None:
+            raise ValueError("Pool empty!")
+        return self._names[slot]
+
+    def acquire(self, timeout: Optional[float] = None, poll_interval: float = 0.1) -> str:
+        """
+        Blocks until a slot is free in any process. Waits are capped at `poll_interval`
+        so that leases of crashed holders (who will never notify) get reclaimed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                slot = self._pop_free()
+                if slot is None and self._reclaim_locked():
+                    slot = self._pop_free()
+                if slot is not None:
+                    return self._names[slot]
+                remaining = poll_interval if deadline is None else min(poll_interval, deadline - time.monotonic())
+                if remaining <= 0:
+                    raise TimeoutError(f"No resource became available within {timeout} s.")
+                self._cond.wait(remaining)
+
+    def release_resource(self, resource: str) -> None:
+        """Releases a resource held by *this* process (others' leases are left alone)."""
+        slot = self._slot_of.get(resource)
+        if slot is None:
+            return
+        with self._cond:
+            if self._slots[1 + self._size + slot] != os.getpid():
+                return
+            self._push_free(slot)
+            self._cond.notify()
+
+    @property
+    def available_resources(self) -> List[str]:
+        with self._cond:
+            return [self._names[slot] for slot in range(self._size)
+                    if self._slots[1 + self._size + slot] == 0]
+
+    @property
+    def resources_in_use(self) -> Set[str]:
+        """Resources leased by any process."""
+        with self._cond:
+            return {self._names[slot] for slot in range(self._size)
+                    if self._slots[1 + self._size + slot] != 0}
+
+    def get_pool_status(self) -> str:
+        with self._cond:
+            available = self._slots[0]
+        return f"Avail: {available}. In Use: {self._size - available} (all processes)."
+
+    def __getstate__(self):
+        raise RuntimeError("SharedMemoryResourcePool can only be inherited by fork, not pickled "
+                           "(spawn/forkserver children and queues cannot share its lock and mapping).")
+
+    def _rebuild_in_child(self) -> Optional['SharedMemoryResourcePool']:
+        # The mapping and the process-shared lock stay valid after fork: keep using them.
+        return self
+
+    def close(self) -> None:
+        """Detaches this process; the creating process also frees the shared block."""
+        if self._slots is None:
+            return
+        self._slots.release()
+        self._slots = None
+        self._shm.close()
+        if os.getpid() == self._creator_pid:
+            self._shm.unlink()
+        atexit.unregister(self.close)
+
+
+class ThreadSafeResourcePool(ResourcePool):
+    _instance: Optional['ThreadSafeResourcePool'] = None
+    _lock = threading.Lock() # Lock for thread-safe instantiation only, never for pool operations
+
+    def __new__(cls, size: Optional[int] = None, *args, shards: int = 1, shared: bool = False,
+                factory: Optional[Callable[[], Any]] = None, **elastic_options) -> 'ThreadSafeResourcePool':
+        """
+        Ensures single instance creation using double-checked locking.
+        Options only apply to the first creation:
+          - `shards > 1` selects the sharded, low-contention mode.
+          - `factory=...` (plus min_size, max_size, idle_ttl, validate, ...) selects the
+            elastic mode with real resources; `size` there means max_size.
+          - `shared=True` selects one pool shared with the processes forked afterwards.
+        Asking an existing pool for a different `size` raises ValueError instead of being ignored.
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    # Create and initialize the instance under the lock
+                    if factory is not None:
+                        if size is not None:  # in elastic mode `size` is the upper bound
+                            if elastic_options.setdefault("max_size", size) != size:
+                                raise ValueError(f"size={size} conflicts with "
+                                                 f"max_size={elastic_options['max_size']}.")
+                        instance = super().__new__(_ElasticThreadSafeResourcePool)
+                        instance._setup(factory, **elastic_options)
+                    elif shared:
+                        instance = super().__new__(_SharedThreadSafeResourcePool)
+                        instance._setup(3 if size is None else size)
+                    elif shards > 1:
+                        instance = super().__new__(_ShardedThreadSafeResourcePool)
+                        instance._setup(3 if size is None else size, shards)
+                    else:
+                        instance = super().__new__(cls)
+                        instance._setup(3 if size is None else size)
+                    cls._instance = instance
+                    return instance
+        if size is not None and size != cls._instance._size:
+            raise ValueError(f"The pool already exists with size {cls._instance._size}; cannot resize to {size}.")
+        return cls._instance
+
+    def __init__(self, size: int = 3, *args, **kwargs) -> None:
+        # Pass (Initialization handled in __new__)
+        pass
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        """
+        Runs in a freshly forked child. The lock may have been held by a parent thread
+        that does not exist here, so it is replaced. A shared-memory pool stays shared;
+        any other pool (thread locks, maintenance threads, live connections) is dropped
+        so the child builds its own on first use.
+        """
+        cls._lock = threading.Lock()
+        instance = cls._instance
+        rebuild = getattr(instance, "_rebuild_in_child", None)
+        cls._instance = rebuild() if rebuild is not None else None
+
+
+class _ShardedThreadSafeResourcePool(ThreadSafeResourcePool, ShardedResourcePool):
+    """The singleton's class when created with shards > 1 (pool methods come from ShardedResourcePool)."""
+
+
+class _ElasticThreadSafeResourcePool(ThreadSafeResourcePool, ElasticResourcePool):
+    """The singleton's class when created with a resource factory."""
+
+
+class _SharedThreadSafeResourcePool(ThreadSafeResourcePool, SharedMemoryResourcePool):
+    """The singleton's class when created with shared=True."""
+
+
+class AsyncResourcePool:
+    """
+    asyncio-native counterpart of ThreadSafeResourcePool (one instance per process).
+    Nothing here blocks the event loop: waiting callers park on futures, served FIFO.
+    Use it from one event loop; coroutines interleave only at `await`, so the pool
+    state itself needs no lock.
+    """
+    _instance: Optional['AsyncResourcePool'] = None
+    _lock = threading.Lock() # Lock for thread-safe instantiation
+
+    def __new__(cls, size: Optional[int] = None, *args, **kwargs) -> 'AsyncResourcePool':
+        """Like ThreadSafeResourcePool: asking an existing pool for a different `size` raises ValueError."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._size = 3 if size is None else size
+                    instance.available_resources: Deque[str] = deque(f"Res-{i+1}" for i in range(instance._size))
+                    instance.resources_in_use: Set[str] = set()
+                    instance._waiters: Deque[asyncio.Future] = deque()
+                    cls._instance = instance
+                    return instance
+        if size is not None and size != cls._instance._size:
+            raise ValueError(f"The pool already exists with size {cls._instance._size}; cannot resize to {size}.")
+        return cls._instance
+
+    def __init__(self, size: Optional[int] = None) -> None:
+        # Pass (Initialization handled in __new__)
+        pass
+
+    async def acquire(self, timeout: Optional[float] = None) -> str:
+        """Waits up to `timeout` seconds for a resource. Raises TimeoutError when it runs out."""
+        if self.available_resources and not self._waiters:
+            resource = self.available_resources.popleft()
+            self.resources_in_use.add(resource)
+            return resource
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except BaseException as exc:  # timeout or cancellation of the calling task
+            if waiter.done() and not waiter.cancelled():
+                # A resource was handed over just as we gave up: pass it on, never leak it.
+                self.release_resource(waiter.result())
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                raise TimeoutError(f"No resource became available within {timeout} s.") from None
+            raise
+
+    def release_resource(self, resource: str) -> None:
+        """Returns a resource; the oldest still-waiting caller gets it directly."""
+        if resource not in self.resources_in_use:
+            return
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():  # skip callers that already timed out or were cancelled
+                waiter.set_result(resource)
+                return
+        self.resources_in_use.discard(resource)
+        self.available_resources.append(resource)
+
+    @asynccontextmanager
+    async def resource(self, timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """`async with pool.resource() as res:` -- released even if the body raises or is cancelled."""
+        acquired = await self.acquire(timeout)
+        try:
+            yield acquired
+        finally:
+            self.release_resource(acquired)
+
+    def get_pool_status(self) -> str:
+        return (f"Avail: {len(self.available_resources)}. "
+                f"In Use: {len(self.resources_in_use)}. Waiting: {len(self._waiters)}.")
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Futures belong to the parent's event loop; the child starts from a fresh pool.
+        cls._lock = threading.Lock()
+        cls._instance = None
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=ThreadSafeResourcePool._reset_after_fork)
+    os.register_at_fork(after_in_child=AsyncResourcePool._reset_after_fork)
+
+
 # --- Multi-threaded Test Harness (Interview Demo Focus) ---
 def worker_function(thread_id: int, results: List[str]):
     """Function run by each thread to test the singleton and resource pool."""
@@ -61,6 +800,253 @@ def worker_function(thread_id: int, results: List[str]):
         if acquired_res:
             pool.release_resource(acquired_res)
 
+def blocking_worker_function(thread_id: int, results: List[str]):
+    """Like worker_function, but waits (FIFO) for a resource instead of failing."""
+    pool = ThreadSafeResourcePool(size=3)
+    with pool.resource(timeout=2.0) as res:
+        time.sleep(0.01)  # hold it briefly so the pool actually runs dry
+        results.append(f"T-{thread_id} Acquired {res}")
+
+
+# --- Benchmark: throughput under contention ---
+class _ListResourcePool:
+    """The previous design: list.pop(0) / `in` / list.remove, fails fast when empty."""
+    def __init__(self, size: int) -> None:
+        self._lock = threading.Lock()
+        self.available_resources = [f"Res-{i+1}" for i in range(size)]
+        self.resources_in_use: List[str] = []
+
+    def acquire(self, timeout: Optional[float] = None) -> str:
+        while True:  # callers had to retry on ValueError themselves
+            with self._lock:
+                if self.available_resources:
+                    resource = self.available_resources.pop(0)
+                    self.resources_in_use.append(resource)
+                    return resource
+            time.sleep(0)
+
+    def release_resource(self, resource: str) -> None:
+        with self._lock:
+            if resource not in self.resources_in_use:
+                return
+            self.resources_in_use.remove(resource)
+            self.available_resources.append(resource)
+
+
+def benchmark_pool(thread_counts: Sequence[int] = (4, 16, 64), pool_sizes: Sequence[int] = (4, 64, 1024),
+                   ops_per_thread: int = 2000) -> None:
+    """
+    Acquire/release cycles per second. Each thread keeps its share of the pool
+    checked out, so the pool runs near-empty and the in-use collection near-full,
+    and returns them in random order (as real connections are).
+    """
+    print(f"{'threads':>8}{'size':>7}{'list pool (ops/s)':>20}{'deque pool (ops/s)':>20}")
+    for threads_count in thread_counts:
+        for size in pool_sizes:
+            row = f"{threads_count:>8}{size:>7}"
+            for pool_cls in (_ListResourcePool, ResourcePool):
+                pool = pool_cls(size)
+
+                share = max(1, size // threads_count)
+
+                def worker(seed: int) -> None:
+                    rng = random.Random(seed)
+                    held: List[str] = []
+                    for _ in range(ops_per_thread):
+                        held.append(pool.acquire(timeout=10))
+                        if len(held) >= share:
+                            pool.release_resource(held.pop(rng.randrange(len(held))))
+                    for resource in held:
+                        pool.release_resource(resource)
+
+                threads = [threading.Thread(target=worker, args=(i,)) for i in range(threads_count)]
+                start = time.perf_counter()
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                elapsed = time.perf_counter() - start
+                row += f"{threads_count * ops_per_thread / elapsed:>20,.0f}"
+            print(row)
+
+
+def benchmark_sharded(thread_counts: Sequence[int] = (1, 8, 32, 128), size: int = 64, shards: int = 8,
+                      total_ops: int = 200_000) -> None:
+    """Acquire/hold/release throughput plus concurrent status polling, single lock vs sharded."""
+    print(f"{'threads':>8}{'single lock (ops/s)':>22}{'sharded (ops/s)':>18}")
+    for threads_count in thread_counts:
+        row = f"{threads_count:>8}"
+        for pool in (ResourcePool(size), ShardedResourcePool(size, shards)):
+            ops_per_thread = total_ops // threads_count
+
+            def worker() -> None:
+                for i in range(ops_per_thread):
+                    with pool.resource(timeout=10):
+                        if i % 16 == 0:
+                            pool.get_pool_status()  # e.g. a metrics scrape
+
+            threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+            start = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            width = 18 if isinstance(pool, ShardedResourcePool) else 22
+            row += f"{ops_per_thread * threads_count / elapsed:>{width},.0f}"
+        print(row)
+
+
+# --- Elastic Pool Demo (fake connections with a configurable connect latency) ---
+class FakeConnection:
+    """Stand-in for a DB connection: slow to create, can be marked broken."""
+    _counter = 0
+
+    def __init__(self, connect_latency: float = 0.02) -> None:
+        time.sleep(connect_latency)
+        FakeConnection._counter += 1
+        self.name = f"Conn-{FakeConnection._counter}"
+        self.healthy = True
+        self.closed = False
+
+    def ping(self) -> bool:
+        return self.healthy and not self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+def elastic_pool_demo(connect_latency: float = 0.02) -> None:
+    def check(label: str, ok: bool) -> None:
+        print(f"  {'SUCCESS' if ok else 'FAILURE'} - {label}")
+
+    pool = ElasticResourcePool(lambda: FakeConnection(connect_latency), min_size=2, max_size=6,
+                               idle_ttl=0.2, validate=FakeConnection.ping, destroy=FakeConnection.close,
+                               maintenance_interval=0.05)
+    check(f"starts warm with min_size connections ({pool.get_pool_status()})", len(pool.available_resources) == 2)
+
+    # Spike: 10 threads each hold a connection for a moment; the pool grows to max_size and
+    # the extra callers wait instead of failing.
+    failures: List[str] = []
+
+    def burst_worker() -> None:
+        try:
+            with pool.resource(timeout=2.0):
+                time.sleep(0.05)
+        except TimeoutError as exc:
+            failures.append(str(exc))
+
+    threads = [threading.Thread(target=burst_worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.03)
+    peak = len(pool.resources_in_use) + len(pool.available_resources)
+    for thread in threads:
+        thread.join()
+    check(f"grew under the spike without failed acquisitions (peak {peak}, {pool.stats['created']} created)",
+          peak <= 6 and pool.stats["created"] <= 6 and not failures)
+
+    time.sleep(0.4)  # > idle_ttl: maintenance shrinks back to min_size
+    check(f"shrank after idle_ttl ({pool.get_pool_status()})", len(pool.available_resources) == 2)
+
+    conn = pool.acquire()
+    conn.healthy = False
+    pool.release_resource(conn)
+    replacement = pool.acquire()
+    check(f"validate-on-borrow skipped broken {conn} and handed out {replacement}", replacement.ping())
+    pool.release_resource(replacement)
+
+    for idle_conn in pool.available_resources:
+        idle_conn.healthy = False
+    time.sleep(0.2)
+    check(f"maintenance recycled broken idle connections ({pool.stats})",
+          all(c.ping() for c in pool.available_resources) and len(pool.available_resources) == 2)
+    pool.close()
+
+
+# --- Cross-process Demo (pre-fork workers sharing one pool) ---
+def _shared_pool_worker(pool: SharedMemoryResourcePool, worker_id: int, crash: bool,
+                        results: "multiprocessing.Queue") -> None:
+    # The parent forked us while holding the singleton lock; the fork hook replaced it,
+    # so this does not deadlock and yields a fresh per-process pool.
+    local_pool = ThreadSafeResourcePool()
+    resource = pool.acquire(timeout=5)
+    if crash:
+        os._exit(1)  # dies holding its lease
+    time.sleep(0.05)
+    pool.release_resource(resource)
+    results.put(f"W-{worker_id} (pid {os.getpid()}) used {resource}; own singleton: {local_pool.get_pool_status()}")
+
+
+def shared_pool_demo(num_workers: int = 6) -> None:
+    if not hasattr(os, "fork"):
+        print("Skipped: needs os.fork (POSIX).")
+        return
+    ctx = multiprocessing.get_context("fork")
+    pool = SharedMemoryResourcePool(size=3)
+    results = ctx.Queue()
+    workers = [ctx.Process(target=_shared_pool_worker, args=(pool, i, i == 0, results))
+               for i in range(num_workers)]
+    with ThreadSafeResourcePool._lock:
+        for worker in workers:
+            worker.start()
+    while any(worker.is_alive() for worker in workers):
+        multiprocessing.active_children()  # reap exited workers, like a pre-fork master does
+        time.sleep(0.01)
+    for worker in workers:
+        worker.join()
+    for _ in range(num_workers - 1):
+        print(f"  {results.get(timeout=5)}")
+    crashed = [w.pid for w in workers if w.exitcode != 0]
+    print(f"Crashed worker(s): {crashed}; final status: {pool.get_pool_status()}")
+    if len(pool.available_resources) == 3:
+        print("Verification: SUCCESS - crashed worker's lease was recovered.")
+    else:
+        print("Verification: FAILURE - a lease leaked.")
+    pool.close()
+
+
+# --- asyncio Demo + Benchmark ---
+async def async_demo() -> None:
+    pool = AsyncResourcePool()
+    held = [await pool.acquire() for _ in range(len(pool.available_resources))]
+    waiting = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    print(f"Pool drained: {pool.get_pool_status()}")
+    waiting.cancel()
+    try:
+        await pool.acquire(timeout=0.05)
+    except TimeoutError as exc:
+        print(f"Timed out as expected: {exc}")
+    for resource in held:
+        pool.release_resource(resource)
+    print(f"After cancel/timeout/release: {pool.get_pool_status()}")
+
+
+async def benchmark_async_pool(num_tasks: int = 5000, size: int = 10, hold: float = 0.0005) -> None:
+    """Thousands of tasks contend for a small pool; reports how long each waited for a resource."""
+    pool = AsyncResourcePool(size=size)
+    waits: List[float] = []
+
+    async def task() -> None:
+        start = time.perf_counter()
+        async with pool.resource(timeout=30):
+            waits.append(time.perf_counter() - start)
+            await asyncio.sleep(hold)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(task() for _ in range(num_tasks)))
+    elapsed = time.perf_counter() - start
+    waits.sort()
+    pct = lambda p: waits[min(len(waits) - 1, int(len(waits) * p))] * 1000
+    print(f"{num_tasks} tasks on {len(pool.available_resources)} resources in {elapsed:.2f}s: "
+          f"wait p50 {pct(0.50):.1f} ms, p90 {pct(0.90):.1f} ms, p99 {pct(0.99):.1f} ms, max {waits[-1] * 1000:.1f} ms")
+    print(f"Final async pool status: {pool.get_pool_status()}")
+
+
 if __name__ == "__main__":
     print("--- Starting Multi-threaded Singleton Test ---")
 
@@ -93,3 +1079,39 @@ if __name__ == "__main__":
         print("Verification: SUCCESS - All resources returned and pool size is correct.")
     else:
         print("Verification: FAILURE - Resource count error.")
+
+    print("\n--- Blocking acquire(timeout=...): 8 threads share 3 resources ---")
+    blocking_results: List[str] = []
+    threads = [threading.Thread(target=blocking_worker_function, args=(i, blocking_results))
+               for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for result in blocking_results:
+        print(f"  {result}")
+    print(f"Final Pool Status: {final_pool.get_pool_status()}")
+
+    print("\n--- Benchmark: contention (threads x pool size) ---")
+    benchmark_pool()
+
+    print("\n--- Sharded mode: thread-local fast path ---")
+    sharded = ShardedResourcePool(size=8, shards=4)
+    first = sharded.acquire()
+    sharded.release_resource(first)
+    print(f"Re-acquired the same warm resource: {sharded.acquire() == first}; status: {sharded.get_pool_status()}")
+
+    print("\n--- Benchmark: single lock vs sharded ---")
+    benchmark_sharded()
+
+    print("\n--- Elastic pool: grow, shrink, health checks ---")
+    elastic_pool_demo()
+
+    print("\n--- Shared-memory pool across forked worker processes ---")
+    shared_pool_demo()
+
+    print("\n--- Benchmark: asyncio pool wait times ---")
+    asyncio.run(benchmark_async_pool())
+
+    print("\n--- asyncio pool: cancellation-safe acquire ---")
+    asyncio.run(async_demo())
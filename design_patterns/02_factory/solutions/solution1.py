@@ -1,54 +1,87 @@
 from abc import ABC, abstractmethod
+from functools import partial
+
+from creator_registry import RegisteredCreator, benchmark_creations
 
 class UIElement(ABC):
+    stateless = False  # stateless elements are shared as flyweights by the creators
+
     @abstractmethod
     def render(self) -> str:
         pass
 
 class WindowsButton(UIElement):
+    stateless = True
+
     def render(self) -> str:
         return "Rendering a Windows Button."
 
 class MacOSButton(UIElement):
+    stateless = True
+
     def render(self) -> str:
         return "Rendering a MacOS Button."
 
 class LinuxButton(UIElement):
+    stateless = True
+
     def render(self) -> str:
         return "Rendering a Linux Button."
 
 
-class UIElementCreator(ABC):
+class UIElementCreator(RegisteredCreator, ABC):
+    factory_method = "create_button"
+
     @abstractmethod
     def create_button(self) -> UIElement:
         pass
 
     def display_dialog(self) -> str:
-        button = self.create_button()
+        button = self.get_product()
         result = button.render()
         return f"Displaying dialog with: {result}"
 
-class WindowsCreator(UIElementCreator):
+class WindowsCreator(UIElementCreator, key="windows"):
     def create_button(self) -> WindowsButton:
         return WindowsButton()
 
-class MacOSCreator(UIElementCreator):
+class MacOSCreator(UIElementCreator, key="macos"):
     def create_button(self) -> MacOSButton:
         return MacOSButton()
 
 
-class LinuxCreator(UIElementCreator):
+class LinuxCreator(UIElementCreator, key="linux"):
     def create_button(self) -> LinuxButton:
         return LinuxButton()
 
-windows_creator = WindowsCreator()
-windows_creator.display_dialog()
 
-macos_creator = MacOSCreator()
-macos_creator.display_dialog()
+def benchmark_ui_creation() -> None:
+    creators = {"windows": WindowsCreator, "macos": MacOSCreator, "linux": LinuxCreator}
+    creator = WindowsCreator()
+    benchmark_creations("UIElementCreator", {
+        "before: pick creator class + create_button()": lambda: creators["windows"]().create_button(),
+        "before: creator.create_button()": creator.create_button,
+        "after:  UIElementCreator.create('windows')": partial(UIElementCreator.create, "windows"),
+    })
+
+
+if __name__ == "__main__":
+    windows_creator = WindowsCreator()
+    print(windows_creator.display_dialog())
+
+    macos_creator = MacOSCreator()
+    print(macos_creator.display_dialog())
+
+    linux_creator = LinuxCreator()
+    print(linux_creator.display_dialog())
+
+    # Keyed dispatch: the caller names a platform instead of a creator class.
+    for platform in UIElementCreator.keys():
+        print(f"{platform}: {UIElementCreator.create(platform).render()}")
+    print(f"Buttons shared as flyweights: "
+          f"{UIElementCreator.create('linux') is UIElementCreator.create('linux')}")
 
-linux_creator = LinuxCreator()
-linux_creator.display_dialog()
+    benchmark_ui_creation()
 
 # Output:
 # Displaying dialog with: Rendering a Windows Button.
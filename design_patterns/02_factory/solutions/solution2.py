@@ -1,47 +1,579 @@
+import heapq
+import threading
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from creator_registry import RegisteredCreator, benchmark_creations
 
 class Notification(ABC):
+    stateless = False  # stateless notifications are shared as flyweights by the creators
+    max_batch_size = 1  # > 1: the channel can carry that many messages in one bulk send
+    max_concurrency = 4  # default number of concurrent sends per channel in dispatch_many()
+
     @abstractmethod
     def send(self, message: str) -> str:
         """Simulate sending a notification and return a confirmation string."""
         pass
 
+    def send_batch(self, messages: List[str]) -> List[str]:
+        """Sends several messages; bulk-capable channels override this with one round trip."""
+        return [self.send(message) for message in messages]
+
 class EmailNotification(Notification):
+    stateless = True
+    max_batch_size = 100  # one SMTP session can carry many messages
+
     def send(self, message: str) -> str:
         return f"Sending email: {message}"
 
 class SMSNotification(Notification):
+    stateless = True
+
     def send(self, message: str) -> str:
         return f"Sending SMS: {message}"
 
 class PushNotification(Notification):
+    stateless = True
+
     def send(self, message: str) -> str:
         return f"Sending push notification: {message}"
 
 
-class NotificationCreator(ABC):
+class NotificationCreator(RegisteredCreator, ABC):
+    factory_method = "create_notification"
+
     @abstractmethod
     def create_notification(self) -> Notification:
         """Factory method to create a Notification object."""
         pass
 
     def dispatch_notification(self, message: str) -> str:
-        notification = self.create_notification()
+        notification = self.get_product()
         return notification.send(message)  # Return only the send result for clarity
 
-class EmailNotificationCreator(NotificationCreator):
+    @classmethod
+    def dispatch_many(cls, messages: Iterable[str], channels: Iterable[Union[str, Notification]], *,
+                      channel_limits: Optional[Dict[str, int]] = None,
+                      max_pending: int = 64) -> Iterator["DispatchResult"]:
+        """
+        Sends every message on every channel concurrently and streams the results back
+        in completion order.
+
+        - channels:       registry keys ("email") or ready-made Notification objects (named by
+                          class; further instances of one class become "Class#2", ...).
+        - channel_limits: concurrent sends per channel (default: `max_concurrency` of
+                          the channel's product); each channel gets its own bounded pool.
+        - bulk sends:     channels with `max_batch_size > 1` get one `send_batch()` per chunk.
+        - max_pending:    cap on queued sends, so `messages` may be a huge generator and
+                          neither the messages nor the results are ever all held in memory.
+        """
+        targets: Dict[str, Notification] = {}
+        seen_objects: Set[int] = set()
+        for channel in channels:
+            if isinstance(channel, str):
+                targets[channel] = cls.create(channel)
+            elif id(channel) not in seen_objects:  # the same object twice is one channel
+                seen_objects.add(id(channel))
+                name, n = type(channel).__name__, 1
+                while name in targets:
+                    n += 1
+                    name = f"{type(channel).__name__}#{n}"
+                targets[name] = channel
+        if not targets:
+            raise ValueError("dispatch_many() needs at least one channel.")
+        limits = channel_limits or {}
+        executors = {name: ThreadPoolExecutor(max_workers=limits.get(name, notification.max_concurrency),
+                                              thread_name_prefix=f"dispatch-{name}")
+                     for name, notification in targets.items()}
+        chunk_size = max(notification.max_batch_size for notification in targets.values())
+        pending: Set[Future] = set()
+
+        def drain(keep: int) -> Iterator[DispatchResult]:
+            while len(pending) > keep:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+                for future in done:
+                    yield from future.result()
+
+        try:
+            message_iter = iter(messages)
+            while chunk := list(islice(message_iter, chunk_size)):
+                for name, notification in targets.items():
+                    step = notification.max_batch_size
+                    for start in range(0, len(chunk), step):
+                        pending.add(executors[name].submit(
+                            _send_unit, name, notification, chunk[start:start + step]))
+                yield from drain(max_pending)
+            yield from drain(0)
+        finally:  # also runs if the caller stops iterating early
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+
+class DispatchResult(NamedTuple):
+    channel: str
+    message: str
+    result: Optional[str]
+    error: Optional[Exception] = None
+
+
+def _send_unit(channel: str, notification: Notification, batch: List[str]) -> List[DispatchResult]:
+    """One unit of dispatch_many() work: a single send or one bulk send; errors become results."""
+    try:
+        results = notification.send_batch(batch) if len(batch) > 1 else [notification.send(batch[0])]
+    except Exception as e:
+        return [DispatchResult(channel, message, None, e) for message in batch]
+    outcomes = [DispatchResult(channel, message, result) for message, result in zip(batch, results)]
+    if len(results) != len(batch):
+        missing = RuntimeError(f"send_batch() returned {len(results)} results for {len(batch)} messages")
+        outcomes.extend(DispatchResult(channel, message, None, missing) for message in batch[len(results):])
+    return outcomes
+
+
+class EmailNotificationCreator(NotificationCreator, key="email"):
     def create_notification(self) -> Notification:
         return EmailNotification()
 
-class SMSNotificationCreator(NotificationCreator):
+class SMSNotificationCreator(NotificationCreator, key="sms"):
     def create_notification(self) -> Notification:
         return SMSNotification()
 
-class PushNotificationCreator(NotificationCreator):
+class PushNotificationCreator(NotificationCreator, key="push"):
     def create_notification(self) -> Notification:
         return PushNotification()
 
 
+# --- Dispatch queue: rate limiting, deduplication and digests in front of the products ---
+class TokenBucket:
+    """Allows `rate` sends per second on average, with bursts of up to `capacity`."""
+    def __init__(self, rate: float, capacity: float):
+        if not rate > 0:
+            raise ValueError(f"rate must be positive, got {rate}.")
+        if not capacity >= 1:
+            raise ValueError(f"capacity must be at least 1 (one send), got {capacity}.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated: Optional[float] = None
+
+    def try_take(self, now: float) -> bool:
+        if self._updated is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def next_token_at(self, now: float) -> float:
+        """When the next token will be available (call after a failed try_take)."""
+        return now + (1 - self._tokens) / self.rate
+
+
+class _Digest:
+    __slots__ = ("messages", "overflow", "attempts", "limited")
+
+    def __init__(self, message: str):
+        self.messages = [message]
+        self.overflow = 0
+        self.attempts = 0
+        self.limited = False
+
+
+class NotificationQueue:
+    """
+    Buffers notifications in front of the Notification products to absorb alert storms:
+      - deduplication: a (recipient, message) pair seen on a channel within `dedup_window`
+                       seconds is dropped.
+      - coalescing:    messages for one recipient on one channel are held for
+                       `coalesce_window` seconds and sent as a single digest.
+      - rate limiting: each channel has a token bucket (`rates[channel] = (per_second, burst)`);
+                       a digest that finds no token waits (and keeps absorbing messages,
+                       up to `max_digest` of them) until one is available.
+      - failures:      a send that raises is counted in `failed` and the digest is retried
+                       after `retry_delay` seconds, at most `max_retries` times; then its
+                       messages are dropped and counted in `dropped_failed`.
+    `pump()` sends whatever is due; `start()` runs it on a background thread.
+    """
+    max_retries: int = 3
+    retry_delay: float = 1.0
+
+    def __init__(self, rates: Dict[str, Tuple[float, float]], *, dedup_window: float = 60.0,
+                 coalesce_window: float = 1.0, max_digest: int = 20,
+                 channels: Optional[Dict[str, Notification]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self._buckets: Dict[str, TokenBucket] = {}
+        for channel, (rate, burst) in rates.items():
+            try:
+                self._buckets[channel] = TokenBucket(rate, burst)
+            except ValueError as exc:
+                raise ValueError(f"Rate for channel '{channel}': {exc}") from None
+        self._channels = channels or {channel: NotificationCreator.create(channel) for channel in rates}
+        self.dedup_window = dedup_window
+        self.coalesce_window = coalesce_window
+        self.max_digest = max_digest
+        self._clock = clock
+        self._seen: Dict[Tuple[str, str, str], float] = {}  # insertion order == expiry order
+        self._pending: Dict[Tuple[str, str], _Digest] = {}
+        self._due: List[Tuple[float, int, Tuple[str, str], _Digest]] = []  # heap: one entry per pending digest
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.received = 0
+        self.sent = 0
+        self.dropped_duplicate = 0
+        self.dropped_overflow = 0
+        self.coalesced = 0
+        self.rate_limited = 0  # digests that had to wait for a token (once each)
+        self.failed = 0  # send attempts that raised
+        self.dropped_failed = 0  # messages given up after max_retries
+
+    def enqueue(self, channel: str, recipient: str, message: str) -> bool:
+        """Queues a message; returns False if it was dropped as a duplicate."""
+        if channel not in self._buckets:
+            raise ValueError(f"No rate configured for channel '{channel}'.")
+        with self._lock:
+            now = self._clock()
+            self.received += 1
+            self._expire_seen(now)
+            key = (channel, recipient, message)
+            if key in self._seen:
+                self.dropped_duplicate += 1
+                return False
+            self._seen[key] = now + self.dedup_window
+            digest = self._pending.get((channel, recipient))
+            if digest is None:
+                digest = self._pending[(channel, recipient)] = _Digest(message)
+                self._schedule(now + self.coalesce_window, (channel, recipient), digest)
+            elif len(digest.messages) < self.max_digest:
+                digest.messages.append(message)
+            else:
+                digest.overflow += 1
+                self.dropped_overflow += 1
+            return True
+
+    def _expire_seen(self, now: float) -> None:
+        seen = self._seen
+        while seen:
+            key = next(iter(seen))
+            if seen[key] > now:
+                break
+            del seen[key]
+
+    def _schedule(self, due: float, key: Tuple[str, str], digest: _Digest) -> None:
+        self._sequence += 1
+        heapq.heappush(self._due, (due, self._sequence, key, digest))
+
+    def pump(self) -> int:
+        """Sends every due digest that its channel's rate limit allows; returns the sends made."""
+        ready = []
+        with self._lock:
+            now = self._clock()
+            deferred = []
+            while self._due and self._due[0][0] <= now:
+                _, _, key, digest = heapq.heappop(self._due)
+                bucket = self._buckets[key[0]]
+                if not bucket.try_take(now):
+                    if not digest.limited:
+                        digest.limited = True
+                        self.rate_limited += 1
+                    deferred.append((bucket.next_token_at(now), key, digest))
+                    continue
+                del self._pending[key]
+                ready.append((key, digest))
+            for due, key, digest in deferred:
+                self._schedule(due, key, digest)
+        sent = 0
+        for (channel, recipient), digest in ready:  # slow I/O stays outside the lock
+            try:
+                self._channels[channel].send(self._format(recipient, digest))
+            except Exception:
+                self._send_failed((channel, recipient), digest)
+                continue
+            sent += 1
+            with self._lock:
+                self.sent += 1
+                self.coalesced += len(digest.messages) - 1
+        return sent
+
+    def _send_failed(self, key: Tuple[str, str], digest: _Digest) -> None:
+        """Requeues a digest whose send raised, merged with any newer one; drops it after max_retries."""
+        with self._lock:
+            self.failed += 1
+            digest.attempts += 1
+            if digest.attempts > self.max_retries:
+                self.dropped_failed += len(digest.messages)
+                return
+            newer = self._pending.get(key)
+            if newer is not None:  # messages arrived meanwhile: one digest, the failed ones first
+                messages = digest.messages + newer.messages
+                newer.messages = messages[:self.max_digest]
+                newer.overflow += digest.overflow + len(messages) - len(newer.messages)
+                self.dropped_overflow += len(messages) - len(newer.messages)
+                newer.attempts = max(newer.attempts, digest.attempts)
+                return
+            self._pending[key] = digest
+            self._schedule(self._clock() + self.retry_delay, key, digest)
+
+    @staticmethod
+    def _format(recipient: str, digest: _Digest) -> str:
+        if len(digest.messages) == 1:
+            return f"[{recipient}] {digest.messages[0]}"
+        more = f" (+{digest.overflow} more)" if digest.overflow else ""
+        return f"[{recipient}] Digest of {len(digest.messages) + digest.overflow} messages{more}: " \
+               + " | ".join(digest.messages)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def start(self, interval: float = 0.01) -> None:
+        def run() -> None:
+            while not self._stop.wait(interval):
+                self.pump()
+        self._thread = threading.Thread(target=run, name="notification-queue", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stops the background pump and delivers everything still pending (rate limits apply)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        while self.pending():
+            if not self.pump():
+                time.sleep(0.01)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"received": self.received, "sent": self.sent, "coalesced": self.coalesced,
+                    "dropped_duplicate": self.dropped_duplicate,
+                    "dropped_overflow": self.dropped_overflow, "rate_limited": self.rate_limited,
+                    "failed": self.failed, "dropped_failed": self.dropped_failed}
+
+
+def benchmark_notification_creation() -> None:
+    creators = {"email": EmailNotificationCreator, "sms": SMSNotificationCreator,
+                "push": PushNotificationCreator}
+    creator = EmailNotificationCreator()
+    benchmark_creations("NotificationCreator", {
+        "before: pick creator class + create_notification()": lambda: creators["email"]().create_notification(),
+        "before: creator.create_notification()": creator.create_notification,
+        "after:  NotificationCreator.create('email')": partial(NotificationCreator.create, "email"),
+    })
+
+
+# --- Local stand-ins for the delivery backends (no network) ---
+class LocalSMTPSink:
+    """
+    In-process stand-in for an SMTP server. Every session costs one round trip
+    (`latency`); a session can carry many messages, which is what makes email bulk-capable.
+    """
+    def __init__(self, latency: float = 0.005, per_message: float = 0.00002):
+        self.latency = latency
+        self.per_message = per_message
+        self.sessions = 0
+        self.delivered = 0
+        self._lock = threading.Lock()
+
+    def deliver(self, messages: List[str]) -> None:
+        time.sleep(self.latency + self.per_message * len(messages))
+        with self._lock:
+            self.sessions += 1
+            self.delivered += len(messages)
+
+
+class FakeSMSGateway:
+    """Stand-in for an HTTP SMS gateway: one request per message, `latency` per request."""
+    def __init__(self, latency: float = 0.002):
+        self.latency = latency
+        self.delivered = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def submit(self, message: str) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+            self.delivered += 1
+
+
+class SinkEmailNotification(EmailNotification):
+    def __init__(self, sink: LocalSMTPSink):
+        self.sink = sink
+
+    def send(self, message: str) -> str:
+        self.sink.deliver([message])
+        return super().send(message)
+
+    def send_batch(self, messages: List[str]) -> List[str]:
+        self.sink.deliver(messages)
+        return [EmailNotification.send(self, message) for message in messages]
+
+
+class GatewaySMSNotification(SMSNotification):
+    max_concurrency = 8  # the gateway's documented per-account request limit
+
+    def __init__(self, gateway: FakeSMSGateway):
+        self.gateway = gateway
+
+    def send(self, message: str) -> str:
+        self.gateway.submit(message)
+        return super().send(message)
+
+
+class ShortBatchEmail(EmailNotification):
+    """A misbehaving bulk channel that acknowledges one message fewer than it was given."""
+    def send_batch(self, messages: List[str]) -> List[str]:
+        return super().send_batch(messages)[:-1]
+
+
+def demo_bulk_dispatch(campaign_size: int = 500) -> None:
+    print(f"\n--- Bulk dispatch: {campaign_size} messages x (email, sms) ---")
+    messages = [f"Campaign message #{i}" for i in range(campaign_size)]
+
+    sink, gateway = LocalSMTPSink(), FakeSMSGateway()
+    email, sms = SinkEmailNotification(sink), GatewaySMSNotification(gateway)
+    start = time.perf_counter()
+    for message in messages:
+        email.send(message)
+        sms.send(message)
+    sequential = time.perf_counter() - start
+    print(f"sequential sends:  {sequential:6.2f}s  ({2 * campaign_size / sequential:8,.0f} sends/s, "
+          f"{sink.sessions} SMTP sessions)")
+
+    sink, gateway = LocalSMTPSink(), FakeSMSGateway()
+    email, sms = SinkEmailNotification(sink), GatewaySMSNotification(gateway)
+    start = time.perf_counter()
+    seen = set()
+    failures = 0
+    for outcome in NotificationCreator.dispatch_many(messages, [email, sms]):
+        seen.add((outcome.channel, outcome.message))
+        failures += outcome.error is not None
+    concurrent = time.perf_counter() - start
+    print(f"dispatch_many():   {concurrent:6.2f}s  ({2 * campaign_size / concurrent:8,.0f} sends/s, "
+          f"{sink.sessions} SMTP sessions, sms peak concurrency {gateway.peak_in_flight})  "
+          f"{sequential / concurrent:.0f}x faster")
+    complete = len(seen) == 2 * campaign_size and failures == 0
+    complete = complete and sink.delivered == gateway.delivered == campaign_size
+    print(f"{'SUCCESS' if complete else 'FAILURE'}: every message sent exactly once per channel.")
+    limited = gateway.peak_in_flight <= GatewaySMSNotification.max_concurrency
+    print(f"{'SUCCESS' if limited else 'FAILURE'}: sms gateway never saw more than "
+          f"{GatewaySMSNotification.max_concurrency} concurrent requests.")
+
+    # Two sinks behind the same class are two channels; a short bulk reply is an error, not a gap.
+    first, second = LocalSMTPSink(latency=0), LocalSMTPSink(latency=0)
+    outcomes = list(NotificationCreator.dispatch_many(
+        messages[:10], [SinkEmailNotification(first), SinkEmailNotification(second), ShortBatchEmail()]))
+    errors = [outcome for outcome in outcomes if outcome.error is not None]
+    ok = first.delivered == second.delivered == 10 and len(outcomes) == 30 and len(errors) == 1
+    print(f"{'SUCCESS' if ok else 'FAILURE'}: same-class channels each get every message; "
+          f"{len(errors)} message missing from a short send_batch() reply is reported.")
+
+    # Streaming: a generator campaign; results are consumed as they arrive.
+    campaign_size *= 200
+    sink = LocalSMTPSink(latency=0.001)
+    tracemalloc.start()
+    start = time.perf_counter()
+    sent = sum(outcome.error is None for outcome in NotificationCreator.dispatch_many(
+        (f"Campaign message #{i}" for i in range(campaign_size)), [SinkEmailNotification(sink)]))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"streamed {sent:,} emails in {elapsed:.2f}s over {sink.sessions:,} SMTP sessions, "
+          f"peak traced memory {peak / 1024:,.0f} KiB")
+
+
+class CountingNotification(Notification):
+    def __init__(self, name: str):
+        self.name = name
+        self.sends: List[float] = []
+
+    def send(self, message: str) -> str:
+        self.sends.append(time.monotonic())
+        return f"Sending {self.name}: {message}"
+
+
+def demo_alert_storm(alerts: int = 5_000) -> None:
+    print(f"\n--- Alert storm: {alerts:,} alerts through NotificationQueue ---")
+    email, sms = CountingNotification("email"), CountingNotification("sms")
+    queue = NotificationQueue({"email": (20, 10), "sms": (2, 2)}, dedup_window=2.0,
+                              coalesce_window=0.2, channels={"email": email, "sms": sms})
+    recipients = ["oncall-a", "oncall-b", "oncall-c"]
+    queue.start()
+    start = time.monotonic()
+    for i in range(alerts):
+        # the same 50 alerts keep firing, plus a unique counter message now and then
+        message = f"disk {i % 50} is full" if i % 100 else f"storm sample #{i}"
+        for channel in ("email", "sms"):
+            queue.enqueue(channel, recipients[i % len(recipients)], message)
+        if i % 500 == 0:
+            time.sleep(0.05)  # the storm arrives in waves
+    queue.close()
+    elapsed = time.monotonic() - start
+    stats = queue.stats()
+    print("  ".join(f"{name}={value:,}" for name, value in stats.items()))
+    print(f"downstream sends: email {len(email.sends)}, sms {len(sms.sends)} over {elapsed:.2f}s "
+          f"({1 - stats['sent'] / stats['received']:.2%} of the load avoided)")
+    accounted = stats["sent"] + stats["coalesced"] + stats["dropped_duplicate"] + stats["dropped_overflow"] \
+        + stats["dropped_failed"]
+    print(f"{'SUCCESS' if accounted == stats['received'] else 'FAILURE'}: "
+          f"every received message was sent, merged into a digest or dropped.")
+    within = all(count <= burst + rate * (sent_at - start) + 1
+                 for sends, (rate, burst) in ((email.sends, (20, 10)), (sms.sends, (2, 2)))
+                 for count, sent_at in enumerate(sends, 1))
+    print(f"{'SUCCESS' if within else 'FAILURE'}: no channel exceeded its token-bucket rate.")
+    demo_failing_channel()
+
+
+class FlakyNotification(CountingNotification):
+    """Raises on its first `failures` sends (or always, if failures is None)."""
+    def __init__(self, name: str, failures: Optional[int]):
+        super().__init__(name)
+        self.failures = failures
+        self.attempts = 0
+
+    def send(self, message: str) -> str:
+        self.attempts += 1
+        if self.failures is None or self.attempts <= self.failures:
+            raise RuntimeError(f"{self.name} backend unavailable")
+        return super().send(message)
+
+
+def demo_failing_channel() -> None:
+    flaky, down = FlakyNotification("email", failures=2), FlakyNotification("sms", failures=None)
+    queue = NotificationQueue({"email": (100, 10), "sms": (100, 10)}, coalesce_window=0.01,
+                              channels={"email": flaky, "sms": down})
+    queue.retry_delay = 0.02
+    queue.start()
+    for i in range(3):
+        queue.enqueue("email", "oncall-a", f"alert {i}")
+        queue.enqueue("sms", "oncall-a", f"alert {i}")
+    time.sleep(0.3)
+    alive = queue._thread.is_alive()
+    queue.enqueue("email", "oncall-b", "after the outage")
+    queue.close()
+    stats = queue.stats()
+    ok = alive and len(flaky.sends) == 2 and stats["failed"] == 2 + queue.max_retries + 1 \
+        and stats["dropped_failed"] == 3 and queue.pending() == 0
+    print(f"{'SUCCESS' if ok else 'FAILURE'}: failing sends are retried then dropped, counted "
+          f"(failed={stats['failed']}, dropped_failed={stats['dropped_failed']}), and the pump keeps running.")
+
+    try:
+        NotificationQueue({"sms": (0, 5)})
+        print("FAILURE: a zero send rate was accepted.")
+    except ValueError as exc:
+        print(f"SUCCESS: a zero send rate is rejected up front: {exc}")
+
+
 if __name__ == "__main__":
     creators = [
         EmailNotificationCreator(),
@@ -54,4 +586,16 @@ if __name__ == "__main__":
         "You have a new follower!"
     ]
     for creator, msg in zip(creators, messages):
-        print(creator.dispatch_notification(msg))
\ No newline at end of file
+        print(creator.dispatch_notification(msg))
+
+    # Keyed dispatch: the channel comes from data, not from a hand-picked creator class.
+    for channel in ("sms", "email"):
+        print(NotificationCreator.create(channel).send("Your order has shipped."))
+    try:
+        NotificationCreator.create("fax")
+    except ValueError as e:
+        print(f"Error: {e}")
+
+    benchmark_notification_creation()
+    demo_bulk_dispatch()
+    demo_alert_storm()
@@ -1,55 +1,330 @@
+import gc
+import math
+import random
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from functools import partial
+from itertools import compress, repeat
+from operator import gt, le, sub
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from creator_registry import RegisteredCreator, benchmark_creations
 
 class Enemy(ABC):
+    # Enemies are game entities with per-spawn state, so every spawn is a fresh object
+    # (no flyweight sharing, see RegisteredCreator).
+    stateless = False
+    max_hp = 10.0
+    damage = 1.0
+    __slots__ = ("hp", "x", "y", "_in_pool")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self._in_pool = False  # idle in an EnemyPool's free list
+        self.reset(x, y)
+
+    def reset(self, x: float = 0.0, y: float = 0.0) -> None:
+        """Restores a freshly-spawned state, so a recycled enemy is as good as a new one.
+        Subclasses with extra state extend this."""
+        self.hp = self.max_hp
+        self.x = x
+        self.y = y
+
     @abstractmethod
     def attack(self) -> str:
         """Return a string describing the enemy's attack."""
         pass
 
+    def encounter(self, hero_attack: float, reach: float) -> float:
+        """
+        A hero at the origin strikes this enemy if it is alive and within `reach`;
+        if it survives, it strikes back. Returns the damage dealt to the hero.
+        """
+        if self.hp <= 0 or math.hypot(self.x, self.y) > reach:
+            return 0.0
+        self.hp -= hero_attack
+        return self.damage if self.hp > 0 else 0.0
+
 class Orc(Enemy):
+    __slots__ = ()
+    max_hp = 30.0
+    damage = 8.0
+
     def attack(self) -> str:
         return "Orc swings a crude axe!"
 
 class Elf(Enemy):
+    __slots__ = ()
+    max_hp = 20.0
+    damage = 6.0
+
     def attack(self) -> str:
         return "Elf fires an arrow with precision!"
 
 class Dragon(Enemy):
+    __slots__ = ()
+    max_hp = 200.0
+    damage = 25.0
+
     def attack(self) -> str:
         return "Dragon breathes fire!"
 
-class EnemySpawner(ABC):
+class EnemySpawner(RegisteredCreator, ABC):
+    factory_method = "create_enemy"
+
     @abstractmethod
     def create_enemy(self) -> Enemy:
         """Factory method to create an Enemy."""
         pass
 
+    pool: Optional["EnemyPool"] = None  # per concrete spawner, see enable_pool()
+
+    @classmethod
+    def enable_pool(cls, cap: int = 1024) -> "EnemyPool":
+        """Makes this spawner recycle its enemies, keeping at most `cap` idle ones."""
+        cls.pool = EnemyPool(cls().create_enemy, cap)
+        return cls.pool
+
+    @classmethod
+    def disable_pool(cls) -> None:
+        cls.pool = None
+
+    def spawn(self, x: float = 0.0, y: float = 0.0) -> Enemy:
+        """A ready enemy at (x, y): recycled from the pool if there is one, else new."""
+        pool = self.pool
+        enemy = pool.acquire() if pool is not None else self.create_enemy()
+        enemy.x = x
+        enemy.y = y
+        return enemy
+
+    def despawn(self, enemy: Enemy) -> None:
+        """Hands a dead or off-screen enemy back for reuse; the caller must drop its reference."""
+        if self.pool is not None:
+            self.pool.release(enemy)
+
     def simulate_encounter(self) -> str:
         """Simulate a game encounter with an enemy."""
-        enemy = self.create_enemy()
-        return f"An encounter begins! [{enemy.attack()}]"
+        enemy = self.spawn()
+        try:
+            return f"An encounter begins! [{enemy.attack()}]"
+        finally:
+            self.despawn(enemy)
 
-class OrcSpawner(EnemySpawner):
+class OrcSpawner(EnemySpawner, key="orc"):
     def create_enemy(self) -> Enemy:
         return Orc()
 
-class ElfSpawner(EnemySpawner):
+class ElfSpawner(EnemySpawner, key="elf"):
     def create_enemy(self) -> Enemy:
         return Elf()
 
-class DragonSpawner(EnemySpawner):
+class DragonSpawner(EnemySpawner, key="dragon"):
     def create_enemy(self) -> Enemy:
         return Dragon()
 
 # Extensibility: Add new enemy types easily
 class Goblin(Enemy):
+    __slots__ = ()
+    max_hp = 12.0
+    damage = 4.0
+
     def attack(self) -> str:
         return "Goblin stabs with a rusty dagger!"
 
-class GoblinSpawner(EnemySpawner):
+class GoblinSpawner(EnemySpawner, key="goblin"):
     def create_enemy(self) -> Enemy:
         return Goblin()
 
+
+# --- Recycling: per-type enemy pools ---
+class EnemyPool:
+    """
+    Free list of idle enemies of one type. `release()` resets an enemy and keeps it for the
+    next `acquire()`; beyond `cap` idle enemies the extras are left to the garbage
+    collector. Meant for one game-loop thread (list pop/append are atomic, the counters
+    are not exact under concurrent use). Releasing an enemy that is already idle in the
+    pool is ignored (and counted in `double_released`), so two acquire() calls can
+    never hand out the same live object.
+    """
+    def __init__(self, factory: Callable[[], Enemy], cap: int = 1024):
+        self._factory = factory
+        self.cap = cap
+        self._free: List[Enemy] = []
+        self.allocated = 0
+        self.reused = 0
+        self.discarded = 0
+        self.double_released = 0
+
+    def acquire(self) -> Enemy:
+        try:
+            enemy = self._free.pop()
+        except IndexError:
+            self.allocated += 1
+            return self._factory()
+        enemy._in_pool = False
+        self.reused += 1
+        return enemy
+
+    def release(self, enemy: Enemy) -> None:
+        if enemy._in_pool:
+            self.double_released += 1
+        elif len(self._free) < self.cap:
+            enemy.reset()
+            enemy._in_pool = True
+            self._free.append(enemy)
+        else:
+            self.discarded += 1
+
+    def prefill(self, n: int) -> None:
+        """Allocates up to `n` idle enemies ahead of time, e.g. during a loading screen."""
+        for _ in range(min(n, self.cap) - len(self._free)):
+            self.allocated += 1
+            enemy = self._factory()
+            enemy._in_pool = True
+            self._free.append(enemy)
+
+
+class GCPauseStats:
+    """Context manager that records every garbage-collector pause (via gc.callbacks)."""
+    def __init__(self):
+        self.pauses: List[tuple] = []  # (generation, seconds)
+        self._started = 0.0
+
+    def _callback(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        else:
+            self.pauses.append((info["generation"], time.perf_counter() - self._started))
+
+    def __enter__(self) -> "GCPauseStats":
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        gc.callbacks.remove(self._callback)
+
+    def summary(self) -> str:
+        total = sum(seconds for _, seconds in self.pauses)
+        longest = max((seconds for _, seconds in self.pauses), default=0.0)
+        per_gen = [sum(1 for gen, _ in self.pauses if gen == g) for g in range(3)]
+        return (f"{len(self.pauses)} collections (gen0/1/2: {'/'.join(map(str, per_gen))}), "
+                f"total pause {total * 1000:.1f} ms, longest {longest * 1000:.2f} ms")
+
+
+# --- Bulk path: struct-of-arrays storage for mass spawning ---
+class EnemyBatch(NamedTuple):
+    """A contiguous range of rows in an EnemyStore."""
+    start: int
+    stop: int
+
+
+class EncounterReport(NamedTuple):
+    engaged: int
+    defeated: int
+    damage_taken: float
+
+
+class EnemyStore:
+    """
+    Columnar (struct-of-arrays) enemy storage: one typed array per attribute instead of
+    one Python object per enemy, about 13 bytes per enemy. Rows are appended in batches
+    by `spawn_batch()` and processed a whole batch at a time by `simulate_encounters()`;
+    `view(row)` gives the per-object Enemy API on top of a single row.
+    """
+    def __init__(self):
+        self.type_id = array("B")
+        self.hp = array("f")
+        self.x = array("f")
+        self.y = array("f")
+        self._prototypes: List[Enemy] = []  # type id -> one enemy of that kind
+        self._type_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.type_id)
+
+    def _type_id(self, kind: str) -> int:
+        type_id = self._type_ids.get(kind)
+        if type_id is None:
+            self._prototypes.append(EnemySpawner.create(kind))  # the factory still picks the type
+            type_id = self._type_ids[kind] = len(self._prototypes) - 1
+        return type_id
+
+    def spawn_batch(self, kind: str, n: int, area: float = 100.0,
+                    rng: Optional[random.Random] = None) -> EnemyBatch:
+        """Spawns `n` enemies of `kind` at random positions in a square of side 2 * `area`."""
+        type_id = self._type_id(kind)
+        uniform = (rng or random).uniform
+        start = len(self)
+        self.type_id.extend(bytes((type_id,)) * n)
+        self.hp.extend(array("f", (self._prototypes[type_id].max_hp,)) * n)
+        self.x.extend(array("f", [uniform(-area, area) for _ in range(n)]))
+        self.y.extend(array("f", [uniform(-area, area) for _ in range(n)]))
+        return EnemyBatch(start, start + n)
+
+    def simulate_encounters(self, batch: EnemyBatch, hero_attack: float, reach: float) -> EncounterReport:
+        """
+        `Enemy.encounter()` for every row of the batch at once. Every step is a C-level
+        pass (map/compress over the columns) instead of a Python call per enemy: one pass
+        over the batch finds the rows in reach, the rest only touches those rows.
+        """
+        start, stop = batch
+        hp = self.hp
+        in_reach = map(le, map(math.hypot, self.x[start:stop], self.y[start:stop]), repeat(reach))
+        rows = list(compress(range(start, stop), in_reach))
+        rows = list(compress(rows, map(gt, map(hp.__getitem__, rows), repeat(0.0))))  # and alive
+        after = list(map(sub, map(hp.__getitem__, rows), repeat(hero_attack)))
+        deque(map(hp.__setitem__, rows, after), maxlen=0)  # scatter the new hp back
+        survivors = list(compress(rows, map(gt, after, repeat(0.0))))
+        damage = [enemy.damage for enemy in self._prototypes]
+        damage_taken = sum(map(damage.__getitem__, map(self.type_id.__getitem__, survivors)))
+        return EncounterReport(len(rows), len(rows) - len(survivors), float(damage_taken))
+
+    def view(self, row: int) -> "EnemyRow":
+        return EnemyRow(self, row)
+
+    def views(self, batch: EnemyBatch) -> List["EnemyRow"]:
+        return [EnemyRow(self, row) for row in range(*batch)]
+
+
+def _column(name: str) -> property:
+    def get(self: "EnemyRow") -> float:
+        return getattr(self._store, name)[self._row]
+
+    def set(self: "EnemyRow", value: float) -> None:
+        getattr(self._store, name)[self._row] = value
+    return property(get, set)
+
+
+class EnemyRow(Enemy):
+    """Thin Enemy view over one EnemyStore row: attribute reads and writes hit the columns."""
+    __slots__ = ("_store", "_row")
+    hp = _column("hp")
+    x = _column("x")
+    y = _column("y")
+
+    def __init__(self, store: EnemyStore, row: int):
+        self._in_pool = False
+        self._store = store
+        self._row = row
+
+    @property
+    def kind(self) -> Enemy:
+        return self._store._prototypes[self._store.type_id[self._row]]
+
+    @property
+    def damage(self) -> float:
+        return self.kind.damage
+
+    @property
+    def max_hp(self) -> float:
+        return self.kind.max_hp
+
+    def attack(self) -> str:
+        return self.kind.attack()
+
+
 # --- Usage Example ---
 def demo_encounters():
     spawners = [
@@ -62,8 +337,146 @@ def demo_encounters():
     for spawner in spawners:
         print(spawner.simulate_encounter())
 
+    print("--- Spawning by key ---")
+    for kind in EnemySpawner.keys():
+        print(f"{kind}: {EnemySpawner.create(kind).attack()}")
+    print(f"Each spawn is a fresh enemy: {EnemySpawner.create('orc') is not EnemySpawner.create('orc')}")
+
+
+def benchmark_enemy_creation() -> None:
+    spawners = {"orc": OrcSpawner, "elf": ElfSpawner, "dragon": DragonSpawner, "goblin": GoblinSpawner}
+    spawner = OrcSpawner()
+    benchmark_creations("EnemySpawner (stateful, no flyweights)", {
+        "before: pick spawner class + create_enemy()": lambda: spawners["orc"]().create_enemy(),
+        "before: spawner.create_enemy()": spawner.create_enemy,
+        "after:  EnemySpawner.create('orc')": partial(EnemySpawner.create, "orc"),
+    })
+
+
+def benchmark_enemy_store(n: int = 200_000, hero_attack: float = 15.0, reach: float = 60.0) -> None:
+    print(f"\n--- Per-object enemies vs EnemyStore: {n:,} orcs ---")
+    spawner = OrcSpawner()
+
+    def spawn_objects(positions: List[tuple]) -> List[Enemy]:
+        enemies = []
+        for x, y in positions:
+            enemy = spawner.create_enemy()
+            enemy.x, enemy.y = x, y
+            enemies.append(enemy)
+        return enemies
+
+    def timed(fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - start
+
+    def traced_bytes(fn, *args) -> int:
+        tracemalloc.start()
+        result = fn(*args)  # kept alive until measured
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del result
+        return size
+
+    def spawn_store() -> EnemyStore:
+        store = EnemyStore()
+        store.spawn_batch("orc", n)
+        return store
+
+    store_bytes = traced_bytes(spawn_store)
+    store = EnemyStore()
+    batch, store_spawn = timed(store.spawn_batch, "orc", n, 100.0, random.Random(7))
+    positions = list(zip(store.x, store.y))  # same (float32) positions for both paths
+    object_bytes = traced_bytes(spawn_objects, positions)
+    enemies, object_spawn = timed(spawn_objects, positions)
+
+    rounds = 3  # the hero keeps swinging: later rounds also skip the fallen
+    object_time = store_time = 0.0
+    object_damage = store_damage = 0.0
+    reports = []
+    for _ in range(rounds):
+        damage, elapsed = timed(sum, (enemy.encounter(hero_attack, reach) for enemy in enemies))
+        object_damage += damage
+        object_time += elapsed
+        report, elapsed = timed(store.simulate_encounters, batch, hero_attack, reach)
+        reports.append(report)
+        store_damage += report.damage_taken
+        store_time += elapsed
+
+    print(f"{'path':<12}{'bytes/enemy':>12}{'spawns/s':>14}{'encounters/s':>16}")
+    print(f"{'per-object':<12}{object_bytes / n:>12.1f}{n / object_spawn:>14,.0f}"
+          f"{rounds * n / object_time:>16,.0f}")
+    print(f"{'EnemyStore':<12}{store_bytes / n:>12.1f}{n / store_spawn:>14,.0f}"
+          f"{rounds * n / store_time:>16,.0f}")
+    print("per round (engaged, defeated): " + ", ".join(f"({r.engaged:,}, {r.defeated:,})" for r in reports))
+    same = store_damage == object_damage and list(store.hp) == [enemy.hp for enemy in enemies]
+    print(f"{'SUCCESS' if same else 'FAILURE'}: batch results match the per-object encounters.")
+
+    row = store.view(batch.start)
+    print(f"Row view: {row.attack()} hp={row.hp:.0f} at ({row.x:.1f}, {row.y:.1f}), "
+          f"isinstance Enemy: {isinstance(row, Enemy)}")
+
+
+def benchmark_enemy_pool(frames: int = 300, per_frame: int = 2_000, world_size: int = 300_000) -> None:
+    print(f"\n--- Game loop: {frames} frames x {per_frame:,} short-lived enemies ---")
+    world = [[] for _ in range(world_size)]  # long-lived objects every full collection must walk
+    spawners = [OrcSpawner(), ElfSpawner(), DragonSpawner(), GoblinSpawner()]
+    rng = random.Random(3)
+    positions = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(per_frame)]
+
+    def run(pooled: bool) -> None:
+        for spawner in spawners:
+            if pooled:
+                type(spawner).enable_pool(cap=per_frame).prefill(per_frame // len(spawners))
+            else:
+                type(spawner).disable_pool()
+        frame_times = []
+        with GCPauseStats() as gc_stats:
+            for _ in range(frames):
+                start = time.perf_counter()
+                spawned = [(spawners[i & 3], spawners[i & 3].spawn(x, y)) for i, (x, y) in enumerate(positions)]
+                for spawner, enemy in spawned:
+                    enemy.encounter(15.0, 60.0)
+                for spawner, enemy in spawned:
+                    spawner.despawn(enemy)
+                del spawned
+                frame_times.append(time.perf_counter() - start)
+        frame_times.sort()
+        if pooled:
+            allocations = sum(type(spawner).pool.allocated for spawner in spawners)
+            reuse = sum(type(spawner).pool.reused for spawner in spawners)
+        else:
+            allocations, reuse = frames * per_frame, 0
+        print(f"{'pooled' if pooled else 'fresh objects'}:")
+        print(f"  enemy allocations {allocations:,} (reused {reuse:,})")
+        print(f"  frame time p50 {frame_times[len(frame_times) // 2] * 1000:.2f} ms, "
+              f"p99 {frame_times[int(len(frame_times) * 0.99)] * 1000:.2f} ms, "
+              f"max {frame_times[-1] * 1000:.2f} ms")
+        print(f"  gc: {gc_stats.summary()}")
+
+    run(pooled=False)
+    run(pooled=True)
+    for spawner in spawners:
+        type(spawner).disable_pool()
+    del world
+
+    # A bug that despawns the same enemy twice must not make two later spawns share it.
+    spawner = OrcSpawner()
+    pool = OrcSpawner.enable_pool()
+    orc = spawner.spawn()
+    spawner.despawn(orc)
+    spawner.despawn(orc)
+    distinct = spawner.spawn() is not spawner.spawn()
+    print(f"{'SUCCESS' if distinct and pool.double_released == 1 else 'FAILURE'}: "
+          f"a double despawn is ignored ({pool.double_released} counted); later spawns stay distinct.")
+    OrcSpawner.disable_pool()
+
+
 if __name__ == "__main__":
     demo_encounters()
+    benchmark_enemy_creation()
+    benchmark_enemy_store()
+    benchmark_enemy_pool()
 
 # Output:
 # --- Simulating Encounters ---
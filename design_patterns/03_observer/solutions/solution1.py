@@ -1,5 +1,20 @@
+import csv
+import math
+import os
+import random
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import count, islice, repeat
+from operator import gt, lt, mul, sub, truediv
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Reading = Tuple[float, float, float]  # (temperature, humidity, pressure)
 
 # --- 1. Observer (Subscriber) Interface ---
 class Observer(ABC):
@@ -14,6 +29,16 @@ class Observer(ABC):
         """
         pass
 
+    def update_batch(self, temperatures: Sequence[float], humidities: Sequence[float],
+                     pressures: Sequence[float]) -> None:
+        """
+        Receives a chunk of readings at once (see WeatherStation.set_measurements_batch).
+        Observers that can process whole columns override this; the default replays
+        the chunk row by row through `update()`.
+        """
+        for reading in zip(temperatures, humidities, pressures):
+            self.update(*reading)
+
 # --- Subject (Publisher) Interface ---
 # (Optional, but good practice to define abstract Subject for consistency)
 class Subject(ABC):
@@ -35,48 +60,747 @@ class Subject(ABC):
         """Notifies all registered observers about a state change."""
         pass
 
+# --- Asynchronous delivery: one bounded queue per observer ---
+OVERFLOW_POLICIES = ("block", "drop_oldest", "keep_latest")
+
+
+class ObserverQueue:
+    """
+    Bounded mailbox in front of one observer. Readings are delivered in order by a worker
+    borrowed from the station's shared thread pool; at most one worker drains a given
+    observer at a time, and it hands the thread back after `burst` readings so a slow
+    observer cannot monopolize the pool.
+
+    When the queue is full, `overflow` decides:
+      - "block":       the producer waits for room (no reading is lost).
+      - "drop_oldest": the oldest queued reading is discarded.
+      - "keep_latest": only the newest reading is kept (queue of one, always fresh).
+    An exception from the observer is counted and kept in `last_error`; delivery goes on.
+    """
+    def __init__(self, observer: Observer, executor: ThreadPoolExecutor,
+                 maxsize: int = 64, overflow: str = "block", burst: int = 32):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'. Use one of {OVERFLOW_POLICIES}.")
+        self.observer = observer
+        self.maxsize = 1 if overflow == "keep_latest" else maxsize
+        self.overflow = overflow
+        self.burst = burst
+        self._executor = executor
+        self._readings: deque = deque()
+        self._cond = threading.Condition()
+        self._scheduled = False
+        self.delivered = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_error: Optional[Exception] = None
+
+    def put(self, reading: Reading) -> None:
+        with self._cond:
+            if len(self._readings) >= self.maxsize:
+                if self.overflow == "block":
+                    self._cond.wait_for(lambda: len(self._readings) < self.maxsize)
+                else:  # drop_oldest / keep_latest (whose queue holds a single reading)
+                    self._readings.popleft()
+                    self.dropped += 1
+            self._readings.append(reading)
+            schedule = not self._scheduled
+            self._scheduled = True
+        if schedule:
+            self._executor.submit(self._drain)
+
+    def _drain(self) -> None:
+        for _ in range(self.burst):
+            with self._cond:
+                if not self._readings:
+                    self._scheduled = False
+                    self._cond.notify_all()
+                    return
+                reading = self._readings.popleft()
+                self._cond.notify_all()  # room for a blocked producer
+            try:
+                self.observer.update(*reading)
+                self.delivered += 1
+            except Exception as e:  # isolate the failure to this observer
+                self.failed += 1
+                self.last_error = e
+        self._executor.submit(self._drain)  # yield the thread, continue later
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued reading has been delivered."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._readings and not self._scheduled, timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {"queued": len(self._readings), "delivered": self.delivered,
+                    "dropped": self.dropped, "failed": self.failed}
+
+
+# --- Delivery policies: coalescing at the subject ---
+class DeliveryPolicy:
+    """
+    Decides, at the subject, which readings one observer actually receives. Readings
+    that do not qualify are coalesced away (never delivered) instead of being delivered
+    and ignored. Use one policy instance per observer.
+    """
+    def __init__(self) -> None:
+        self.offered = 0
+        self.delivered = 0
+        self._held: Optional[Reading] = None
+
+    def offer(self, reading: Reading, now: float) -> Optional[Reading]:
+        """Called with every new reading; returns the reading to deliver now, if any."""
+        self.offered += 1
+        return self._sent(reading)
+
+    def due(self, now: float) -> Optional[Reading]:
+        """A held reading whose time has come (see WeatherStation.tick())."""
+        return None
+
+    def next_due(self) -> Optional[float]:
+        """When the held reading, if any, becomes due; WeatherStation schedules its timer on it."""
+        return None
+
+    def _sent(self, reading: Reading) -> Reading:
+        self.delivered += 1
+        self._held = None
+        return reading
+
+    @property
+    def coalesced(self) -> int:
+        return self.offered - self.delivered
+
+
+class Deadband(DeliveryPolicy):
+    """
+    Delivers a reading only if a watched field moved by at least its threshold since
+    the last delivered reading. Fields left as None are not watched.
+    """
+    def __init__(self, temperature: Optional[float] = None, humidity: Optional[float] = None,
+                 pressure: Optional[float] = None) -> None:
+        super().__init__()
+        if temperature is None and humidity is None and pressure is None:
+            raise ValueError("Deadband needs a threshold for at least one field.")
+        self.thresholds = (temperature, humidity, pressure)
+        self._last: Optional[Reading] = None
+
+    def offer(self, reading: Reading, now: float) -> Optional[Reading]:
+        self.offered += 1
+        last = self._last
+        if last is None or any(threshold is not None and value != previous and abs(value - previous) >= threshold
+                               for value, previous, threshold in zip(reading, last, self.thresholds)):
+            self._last = reading
+            return self._sent(reading)
+        return None
+
+
+class MaxRate(DeliveryPolicy):
+    """
+    At most `per_second` deliveries per second. A reading arriving too soon is held; a
+    newer one replaces it, and the latest is delivered once the interval has passed.
+    """
+    def __init__(self, per_second: float) -> None:
+        super().__init__()
+        self.interval = 1.0 / per_second
+        self._last_sent = float("-inf")
+
+    def offer(self, reading: Reading, now: float) -> Optional[Reading]:
+        self.offered += 1
+        self._held = reading
+        return self.due(now)
+
+    def due(self, now: float) -> Optional[Reading]:
+        if self._held is not None and now - self._last_sent >= self.interval:
+            self._last_sent = now
+            return self._sent(self._held)
+        return None
+
+    def next_due(self) -> Optional[float]:
+        return None if self._held is None else self._last_sent + self.interval
+
+
+class LatestEvery(DeliveryPolicy):
+    """Samples the stream: the latest reading, once per `interval_ms` tick of a fixed grid."""
+    def __init__(self, interval_ms: float) -> None:
+        super().__init__()
+        self.interval = interval_ms / 1000
+        self._next_due: Optional[float] = None
+
+    def offer(self, reading: Reading, now: float) -> Optional[Reading]:
+        self.offered += 1
+        self._held = reading
+        if self._next_due is None:
+            self._next_due = (math.floor(now / self.interval) + 1) * self.interval
+        return self.due(now)
+
+    def due(self, now: float) -> Optional[Reading]:
+        if self._held is None or self._next_due is None or now < self._next_due:
+            return None
+        self._next_due += self.interval * (math.floor((now - self._next_due) / self.interval) + 1)
+        return self._sent(self._held)
+
+    def next_due(self) -> Optional[float]:
+        return None if self._held is None else self._next_due
+
+
 # --- 2. Subject (Publisher) - Concrete Implementation ---
 class WeatherStation(Subject):
     """
     The Concrete Subject that collects weather data and notifies its observers.
     It stores the current measurements internally.
+
+    By default observers are updated inline, one after the other. After `enable_async()`
+    every observer gets its own bounded ObserverQueue and `set_measurements` returns as
+    soon as the reading is queued; `flush()` waits for delivery, `close()` shuts down.
+
+    An observer registered with a DeliveryPolicy (Deadband, MaxRate, LatestEvery) only
+    receives the readings its policy lets through. A reading a policy holds back is
+    delivered when it falls due by `tick()`, which a timer thread calls when `auto_tick`
+    is on (the default with the real clock; with a custom clock the caller ticks).
     """
-    def __init__(self):
+    verbose: bool = True  # print on every registration and update (the original behaviour)
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, auto_tick: Optional[bool] = None):
+        self._clock = clock
+        self._auto_tick = clock is time.monotonic if auto_tick is None else auto_tick
+        self._policy_lock = threading.Lock()  # policies are driven by notify and the timer thread
+        self._outbox: deque = deque()  # (observer, reading) let through by policies, in order
+        self._draining = False
+        self._timer: Optional[threading.Timer] = None
+        self._timer_due = math.inf
+        self._policies: Dict[Observer, DeliveryPolicy] = {}
         self._observers: List[Observer] = []
         self._temperature: float = 0.0
         self._humidity: float = 0.0
         self._pressure: float = 0.0
+        self._queue_options: Dict[Observer, Tuple[int, str]] = {}
+        self._queues: Dict[Observer, ObserverQueue] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
 
-    def register_observer(self, observer: Observer) -> None:
-        """Adds an observer to the list of subscribers."""
+    def register_observer(self, observer: Observer, *, policy: Optional[DeliveryPolicy] = None,
+                          queue_size: int = 64, overflow: str = "block") -> None:
+        """
+        Adds an observer to the list of subscribers, optionally behind a delivery
+        `policy`. `queue_size` and `overflow` (see ObserverQueue) only apply in async mode.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'. Use one of {OVERFLOW_POLICIES}.")
         if observer not in self._observers:
             self._observers.append(observer)
-            print(f"WeatherStation: Registered {observer.__class__.__name__}.")
+            self._queue_options[observer] = (queue_size, overflow)
+            if policy is not None:
+                with self._policy_lock:
+                    self._policies[observer] = policy
+            if self._executor is not None:
+                self._queues[observer] = ObserverQueue(observer, self._executor, queue_size, overflow)
+            if self.verbose:
+                print(f"WeatherStation: Registered {observer.__class__.__name__}.")
 
     def remove_observer(self, observer: Observer) -> None:
         """Removes an observer from the list of subscribers."""
         if observer in self._observers:
             self._observers.remove(observer)
-            print(f"WeatherStation: Removed {observer.__class__.__name__}.")
+            del self._queue_options[observer]
+            with self._policy_lock:
+                self._policies.pop(observer, None)
+            self._queues.pop(observer, None)  # readings already queued are still delivered
+            if self.verbose:
+                print(f"WeatherStation: Removed {observer.__class__.__name__}.")
+
+    def enable_async(self, max_workers: int = 4) -> None:
+        """Switches to queued delivery on a shared pool of `max_workers` threads."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="weather-observer")
+            self._queues = {observer: ObserverQueue(observer, self._executor, *self._queue_options[observer])
+                            for observer in self._observers}
 
     def notify_observers(self) -> None:
         """
         Notifies all registered observers by pushing the current measurements.
         """
-        print(f"\nWeatherStation: Notifying observers about new measurements...")
-        for observer in self._observers:
-            observer.update(self._temperature, self._humidity, self._pressure)
+        if self.verbose:
+            print(f"\nWeatherStation: Notifying observers about new measurements...")
+        reading = (self._temperature, self._humidity, self._pressure)
+        policies = self._policies
+        if not policies:
+            for observer in list(self._observers):
+                self._deliver(observer, reading)
+            return
+        with self._policy_lock:
+            now = self._clock()
+            for observer in list(self._observers):
+                policy = policies.get(observer)
+                if policy is None:
+                    self._outbox.append((observer, reading))
+                else:
+                    due = policy.offer(reading, now)
+                    if due is not None:
+                        self._outbox.append((observer, due))
+            self._schedule_tick()
+        self._drain_outbox()
+
+    def tick(self) -> int:
+        """Delivers readings that policies held back and are now due; returns how many."""
+        with self._policy_lock:
+            now = self._clock()
+            delivered = 0
+            for observer, policy in list(self._policies.items()):
+                due = policy.due(now)
+                if due is not None:
+                    self._outbox.append((observer, due))
+                    delivered += 1
+            self._schedule_tick()
+        self._drain_outbox()
+        return delivered
+
+    def _drain_outbox(self) -> None:
+        """
+        Delivers the outbox in order, outside _policy_lock, so an observer whose queue is
+        full ("block") stalls only the thread delivering, never other producers or the
+        timer. If another thread is already delivering, it picks up our entries too.
+        """
+        with self._policy_lock:
+            if self._draining:
+                return
+            self._draining = True
+        try:
+            while True:
+                with self._policy_lock:
+                    if not self._outbox:
+                        self._draining = False
+                        return
+                    observer, reading = self._outbox.popleft()
+                self._deliver(observer, reading)
+        except BaseException:
+            with self._policy_lock:
+                self._draining = False
+            raise
+
+    def _schedule_tick(self) -> None:
+        """Keeps one timer armed for the earliest held reading (caller holds _policy_lock)."""
+        if not self._auto_tick:
+            return
+        due = min((due for due in (policy.next_due() for policy in self._policies.values()) if due is not None),
+                  default=math.inf)
+        if due >= self._timer_due:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer_due = due
+        self._timer = threading.Timer(max(0.0, due - self._clock()), self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._policy_lock:
+            if self._timer is not threading.current_thread():
+                return  # superseded by an earlier timer
+            self._timer, self._timer_due = None, math.inf
+        self.tick()
+
+    def _deliver(self, observer: Observer, reading: Reading) -> None:
+        queue = self._queues.get(observer)
+        if queue is not None:
+            queue.put(reading)
+            return
+        try:
+            observer.update(*reading)
+        except Exception as e:  # one failing display must not starve the others
+            print(f"WeatherStation: {observer.__class__.__name__} failed: {e!r}")
+
+    def policy_stats(self) -> Dict[str, Dict[str, int]]:
+        """Offered / delivered / coalesced readings, summed per policy type."""
+        stats: Dict[str, Dict[str, int]] = {}
+        with self._policy_lock:
+            policies = list(self._policies.values())
+        for policy in policies:
+            totals = stats.setdefault(type(policy).__name__, {"offered": 0, "delivered": 0, "coalesced": 0})
+            totals["offered"] += policy.offered
+            totals["delivered"] += policy.delivered
+            totals["coalesced"] += policy.coalesced
+        return stats
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Async mode: waits until every observer has received every queued reading."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for queue in list(self._queues.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not queue.join(remaining):
+                return False
+        return True
+
+    def close(self) -> None:
+        """
+        Delivers what is queued, then stops the async workers (back to inline delivery)
+        and the policy timer; readings still held by a policy are not delivered.
+        """
+        with self._policy_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer, self._timer_due = None, math.inf
+        if self._executor is not None:
+            self.flush()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._queues = {}
+
+    def delivery_stats(self) -> Dict[str, Dict[str, int]]:
+        return {observer.__class__.__name__: queue.stats() for observer, queue in self._queues.items()}
 
     def set_measurements(self, temperature: float, humidity: float, pressure: float) -> None:
         """
         Updates the weather measurements and triggers notification to observers.
         """
-        print(f"\nWeatherStation: New measurements received - Temp: {temperature}°C, Humidity: {humidity}%, Pressure: {pressure}hPa")
+        if self.verbose:
+            print(f"\nWeatherStation: New measurements received - Temp: {temperature}°C, Humidity: {humidity}%, Pressure: {pressure}hPa")
         self._temperature = temperature
         self._humidity = humidity
         self._pressure = pressure
         self.notify_observers()
 
+    def set_measurements_batch(self, temperatures: Iterable, humidities: Optional[Sequence[float]] = None,
+                               pressures: Optional[Sequence[float]] = None, *,
+                               chunk_size: int = 65_536) -> int:
+        """
+        Ingests many readings at once, e.g. to backfill history. Accepts either three
+        equal-length columns (lists, array('d'), ...) or, as the only argument, an
+        iterable of (temperature, humidity, pressure) rows such as a csv.reader, which is
+        streamed without loading the file. Readings are handed to each observer's
+        `update_batch()` in chunks of `chunk_size`, on the calling thread (queued async
+        deliveries are flushed first so observers still see readings in order).
+        Delivery policies apply to live readings only; a backfill reaches every observer.
+        Returns the number of readings ingested.
+        """
+        if (humidities is None) != (pressures is None):
+            raise ValueError("Pass all three columns, or a single iterable of rows.")
+        self.flush()
+        if humidities is None:
+            chunks = self._row_chunks(temperatures, chunk_size)
+        else:
+            if not len(temperatures) == len(humidities) == len(pressures):
+                raise ValueError("The measurement columns must have the same length.")
+            chunks = self._column_chunks((temperatures, humidities, pressures), chunk_size)
+        ingested = 0
+        try:
+            for chunk in chunks:  # each chunk is fully validated before any observer sees it
+                for observer in list(self._observers):
+                    try:
+                        observer.update_batch(*chunk)
+                    except Exception as e:
+                        print(f"WeatherStation: {observer.__class__.__name__} failed on a batch: {e!r}")
+                ingested += len(chunk[0])
+                self._temperature, self._humidity, self._pressure = chunk[0][-1], chunk[1][-1], chunk[2][-1]
+        except BatchIngestionError as e:
+            e.ingested = ingested
+            e.args = (f"{e.args[0]} ({ingested:,} earlier readings were ingested; nothing after them)",)
+            raise
+        if self.verbose:
+            print(f"\nWeatherStation: Ingested {ingested:,} readings in batches.")
+        return ingested
+
+    @staticmethod
+    def _column_chunks(columns: Tuple[Sequence, Sequence, Sequence], chunk_size: int):
+        for start in range(0, len(columns[0]), chunk_size):
+            chunk = tuple(column[start:start + chunk_size] for column in columns)
+            try:
+                converted = tuple(values if isinstance(values, array) and values.typecode == "d"
+                                  else array("d", map(float, values)) for values in chunk)
+            except (TypeError, ValueError):
+                for i, reading in enumerate(zip(*chunk), start):
+                    if not all(map(_is_number, reading)):
+                        raise BatchIngestionError(f"Index {i}: invalid values {reading!r}", i) from None
+                raise
+            yield converted
+
+    @staticmethod
+    def _row_chunks(rows: Iterable, chunk_size: int):
+        """
+        Chunks (temperature, humidity, pressure) rows into float columns. A leading CSV
+        header and blank lines are skipped; a short or non-numeric row raises
+        BatchIngestionError naming its (1-based) row number.
+        """
+        numbered = zip(count(1), rows)
+        first = next((numbered_row for numbered_row in numbered if numbered_row[1]), None)  # skip blank lines
+        pending = [] if first is None or not all(map(_is_number, first[1][:3])) else [first]
+        while pending := pending + list(islice(numbered, chunk_size - len(pending))):
+            chunk = [row for _, row in pending if row]  # csv.reader yields [] for blank lines
+            try:
+                if any(len(row) != 3 for row in chunk):
+                    raise ValueError
+                converted = tuple(array("d", map(float, column)) for column in zip(*chunk))
+            except ValueError:
+                for number, row in pending:
+                    if row and (len(row) != 3 or not all(map(_is_number, row))):
+                        raise BatchIngestionError(f"Row {number}: expected 3 numbers, got {list(row)!r}",
+                                                  number) from None
+                raise
+            pending = []
+            if chunk:
+                yield converted
+
+
+class BatchIngestionError(ValueError):
+    """A backfill hit a malformed reading; `row` is where it stopped, `ingested` how many got in."""
+    def __init__(self, message: str, row: int) -> None:
+        super().__init__(message)
+        self.row = row
+        self.ingested = 0
+
+
+def _is_number(text) -> bool:
+    try:
+        float(text)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+# --- Streaming aggregates (constant memory, used by StatisticsDisplay) ---
+class RunningStats:
+    """Count, mean, variance (Welford's numerically stable update), min and max in O(1) memory."""
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_batch(self, values: Sequence[float]) -> None:
+        """Adds a chunk: exact two-pass stats of the chunk, then one parallel merge."""
+        if not values:
+            return
+        chunk = RunningStats()
+        chunk.count = len(values)
+        chunk.mean = math.fsum(values) / chunk.count
+        deviations = list(map(sub, values, repeat(chunk.mean)))
+        chunk._m2 = math.fsum(map(mul, deviations, deviations))
+        chunk.min = min(values)
+        chunk.max = max(values)
+        self.merge(chunk)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Folds in the stats of another stream (Chan et al.'s parallel update)."""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+
+class SlidingMinMax:
+    """
+    Min and max over the last `size` readings and/or the last `seconds` seconds.
+    Two monotonic deques keep only the readings that can still become the min or max,
+    so each reading is pushed and popped at most once (amortized O(1)).
+    """
+    def __init__(self, size: Optional[int] = None, seconds: Optional[float] = None) -> None:
+        if size is None and seconds is None:
+            raise ValueError("SlidingMinMax needs a window size, a window duration, or both.")
+        self.size = size
+        self.seconds = seconds
+        self._mins: deque = deque()  # (seq, timestamp, value), values increasing
+        self._maxs: deque = deque()  # (seq, timestamp, value), values decreasing
+        self._seq = 0
+
+    def add(self, value: float, now: float) -> None:
+        self._push((self._seq, now, value))
+        self._seq += 1
+        self.expire(now)
+
+    def add_batch(self, values: Sequence[float], now: float) -> None:
+        """
+        Adds a chunk that arrived at `now`. Only readings that can still be in the window
+        afterwards are pushed: the last `size` of them, or, for a time-only window (all
+        chunk readings share one timestamp), just the chunk's min and max.
+        """
+        if not values:
+            return
+        n = len(values)
+        if self.size is not None:
+            positions = range(max(0, n - self.size), n)
+        else:
+            positions = sorted({values.index(min(values)), values.index(max(values))})
+        base = self._seq
+        for i in positions:
+            self._push((base + i, now, values[i]))
+        self._seq = base + n
+        self.expire(now)
+
+    def _push(self, entry: Tuple[int, float, float]) -> None:
+        value = entry[2]
+        mins, maxs = self._mins, self._maxs
+        while mins and mins[-1][2] >= value:
+            mins.pop()
+        mins.append(entry)
+        while maxs and maxs[-1][2] <= value:
+            maxs.pop()
+        maxs.append(entry)
+
+    def expire(self, now: float) -> None:
+        oldest_seq = self._seq - self.size if self.size is not None else -1
+        oldest_time = now - self.seconds if self.seconds is not None else float("-inf")
+        for window in (self._mins, self._maxs):
+            while window and (window[0][0] < oldest_seq or window[0][1] <= oldest_time):
+                window.popleft()
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._mins[0][2] if self._mins else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._maxs[0][2] if self._maxs else None
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (the DDSketch idea):
+    values fall into logarithmic buckets (k = ceil(log_gamma |v|)), so any quantile is
+    answered within `relative_accuracy` of the true value using a few hundred counters.
+    Sketches from different streams merge by adding bucket counts. If more than
+    `max_buckets` buckets are ever needed, the smallest magnitudes are folded together.
+    """
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048,
+                 min_magnitude: float = 1e-9) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.min_magnitude = min_magnitude
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value > self.min_magnitude:
+            buckets = self._positive
+        elif value < -self.min_magnitude:
+            buckets, value = self._negative, -value
+        else:
+            self._zero += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def add_batch(self, values: Sequence[float]) -> None:
+        """Adds a chunk: bucket keys for the whole chunk in C-level passes, counted at once."""
+        positives = list(filter(partial(lt, self.min_magnitude), values))
+        negatives = [-v for v in filter(partial(gt, -self.min_magnitude), values)]
+        self._zero += len(values) - len(positives) - len(negatives)
+        self.count += len(values)
+        for buckets, magnitudes in ((self._positive, positives), (self._negative, negatives)):
+            for key, count in Counter(map(math.ceil, map(truediv, map(math.log, magnitudes),
+                                                         repeat(self._log_gamma)))).items():
+                buckets[key] = buckets.get(key, 0) + count
+            while len(buckets) > self.max_buckets:
+                self._collapse(buckets)
+
+    @staticmethod
+    def _collapse(buckets: Dict[int, int]) -> None:
+        lowest, second = sorted(buckets)[:2]
+        buckets[second] += buckets.pop(lowest)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            while len(mine) > self.max_buckets:
+                self._collapse(mine)
+        self._zero += other._zero
+        self.count += other.count
+
+    def _value(self, key: int) -> float:
+        return 2 * self.gamma ** key / (self.gamma + 1)  # bucket midpoint in relative terms
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):  # most negative first
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+    def buckets(self) -> int:
+        return len(self._positive) + len(self._negative)
+
+
+class FieldStats:
+    """All streaming aggregates of one measured field."""
+    __slots__ = ("moments", "window", "sketch")
+
+    def __init__(self, window_size: Optional[int], window_seconds: Optional[float],
+                 relative_accuracy: float) -> None:
+        self.moments = RunningStats()
+        self.window = SlidingMinMax(window_size, window_seconds)
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float, now: float) -> None:
+        self.moments.add(value)
+        self.window.add(value, now)
+        self.sketch.add(value)
+
+    def add_batch(self, values: Sequence[float], now: float) -> None:
+        self.moments.add_batch(values)
+        self.window.add_batch(values, now)
+        self.sketch.add_batch(values)
+
+    def merge(self, other: "FieldStats") -> None:
+        """Merges all-time aggregates (the sliding window is per stream and is not merged)."""
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+
+    def summary(self, now: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """`now` (if given) first expires readings that left a time window while no new ones came in."""
+        if now is not None:
+            self.window.expire(now)
+        moments, sketch = self.moments, self.sketch
+        return {"count": moments.count, "mean": moments.mean, "stddev": moments.stddev,
+                "min": moments.min, "max": moments.max,
+                "window_min": self.window.min, "window_max": self.window.max,
+                "p50": sketch.quantile(0.5), "p95": sketch.quantile(0.95), "p99": sketch.quantile(0.99)}
+
+
 # --- 3. Display Elements (Concrete Observers) ---
 class CurrentConditionsDisplay(Observer):
     """
@@ -89,45 +813,448 @@ class CurrentConditionsDisplay(Observer):
 class StatisticsDisplay(Observer):
     """
     Calculates and displays min, max, and average temperature.
+
+    Keeps constant-memory streaming aggregates for temperature, humidity and pressure:
+    mean/variance, all-time and sliding-window (last `window_size` readings and/or
+    `window_seconds` seconds) min/max, and approximate percentiles (see FieldStats).
     """
-    def __init__(self) -> None:
-        self._temperatures: List[float] = []
-        self._min_temp: float = float('inf')
-        self._max_temp: float = float('-inf')
-        self._sum_temp: float = 0.0
-        self._num_readings: int = 0
+    FIELDS = ("temperature", "humidity", "pressure")
+    verbose: bool = True  # print after every update (the original behaviour)
+
+    def __init__(self, window_size: Optional[int] = 100, window_seconds: Optional[float] = None,
+                 relative_accuracy: float = 0.01, clock: Callable[[], float] = time.monotonic) -> None:
+        self.fields: Dict[str, FieldStats] = {
+            name: FieldStats(window_size, window_seconds, relative_accuracy) for name in self.FIELDS}
+        self._clock = clock
 
     def update(self, temperature: float, humidity: float, pressure: float) -> None:
         """Updates statistics and prints them."""
-        self._temperatures.append(temperature) # Keep for simple average calculation
+        now = self._clock()
+        fields = self.fields
+        fields["temperature"].add(temperature, now)
+        fields["humidity"].add(humidity, now)
+        fields["pressure"].add(pressure, now)
+        if self.verbose:
+            temps = fields["temperature"].moments
+            print(f"  StatisticsDisplay: Avg Temp: {temps.mean:.1f}°C, Min Temp: {temps.min:.1f}°C, Max Temp: {temps.max:.1f}°C.")
 
-        # Update min/max
-        if temperature < self._min_temp:
-            self._min_temp = temperature
-        if temperature > self._max_temp:
-            self._max_temp = temperature
+    def update_batch(self, temperatures: Sequence[float], humidities: Sequence[float],
+                     pressures: Sequence[float]) -> None:
+        """Folds a whole chunk into the aggregates (readings share the chunk's timestamp)."""
+        now = self._clock()
+        for name, values in zip(self.FIELDS, (temperatures, humidities, pressures)):
+            self.fields[name].add_batch(values, now)
+        if self.verbose:
+            temps = self.fields["temperature"].moments
+            print(f"  StatisticsDisplay: Avg Temp: {temps.mean:.1f}°C, Min Temp: {temps.min:.1f}°C, Max Temp: {temps.max:.1f}°C.")
 
-        # Update for average using sum/count for robustness
-        self._sum_temp += temperature
-        self._num_readings += 1
-        avg_temp = self._sum_temp / self._num_readings if self._num_readings > 0 else 0.0
+    def summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        now = self._clock()
+        return {name: stats.summary(now) for name, stats in self.fields.items()}
 
-        print(f"  StatisticsDisplay: Avg Temp: {avg_temp:.1f}°C, Min Temp: {self._min_temp:.1f}°C, Max Temp: {self._max_temp:.1f}°C.")
+    def merge(self, other: "StatisticsDisplay") -> None:
+        """Combines the all-time statistics of another display (e.g. a second station)."""
+        for name, stats in self.fields.items():
+            stats.merge(other.fields[name])
 
 class ForecastDisplay(Observer):
     """
     Provides a simple weather forecast based on temperature.
     """
+    verbose: bool = True
+
+    def __init__(self) -> None:
+        self.forecast = "No forecast available."
+        self.tally: Dict[str, int] = {"warm": 0, "mild": 0, "cool": 0}  # readings per outlook
+
     def update(self, temperature: float, humidity: float, pressure: float) -> None:
         """Updates and prints the forecast."""
         forecast = "No forecast available."
         if temperature > 25:
             forecast = "Warm weather expected!"
+            self.tally["warm"] += 1
         elif temperature < 10:
             forecast = "Cooler weather coming!"
+            self.tally["cool"] += 1
         else:
             forecast = "Mild weather ahead."
-        print(f"  ForecastDisplay: {forecast}")
+            self.tally["mild"] += 1
+        self.forecast = forecast
+        if self.verbose:
+            print(f"  ForecastDisplay: {forecast}")
+
+    def update_batch(self, temperatures: Sequence[float], humidities: Sequence[float],
+                     pressures: Sequence[float]) -> None:
+        """Tallies the outlook of a whole chunk; the forecast follows its last reading."""
+        head = len(temperatures) - 1
+        warm = sum(map(gt, islice(temperatures, head), repeat(25)))
+        cool = sum(map(lt, islice(temperatures, head), repeat(10)))
+        self.tally["warm"] += warm
+        self.tally["cool"] += cool
+        self.tally["mild"] += head - warm - cool
+        self.update(temperatures[-1], humidities[-1], pressures[-1])
+
+# --- Async fan-out: producer latency with a slow observer ---
+class CountingDisplay(Observer):
+    """A quiet display that only counts its updates."""
+    def __init__(self) -> None:
+        self.updates = 0
+
+    def update(self, temperature: float, humidity: float, pressure: float) -> None:
+        self.updates += 1
+
+
+class SlowDisplay(CountingDisplay):
+    """Simulates a display stuck on slow I/O (e.g. a remote dashboard)."""
+    def __init__(self, delay: float = 0.005) -> None:
+        super().__init__()
+        self.delay = delay
+
+    def update(self, temperature: float, humidity: float, pressure: float) -> None:
+        time.sleep(self.delay)
+        super().update(temperature, humidity, pressure)
+
+
+class FaultyDisplay(Observer):
+    def update(self, temperature: float, humidity: float, pressure: float) -> None:
+        raise RuntimeError("display unplugged")
+
+
+def benchmark_producer_latency(readings: int = 200) -> None:
+    print(f"\n--- Producer latency: {readings} readings, 3 fast displays + 1 slow (5 ms) display ---")
+    print(f"{'mode':<22}{'p50 us':>9}{'p99 us':>10}{'max us':>10}{'total s':>9}   slow display")
+    for mode in ("sync", "block", "drop_oldest", "keep_latest"):
+        station = WeatherStation()
+        station.verbose = False
+        fast = [CountingDisplay() for _ in range(3)]
+        slow = SlowDisplay()
+        overflow = "block" if mode == "sync" else mode
+        for display in fast:
+            station.register_observer(display)
+        station.register_observer(slow, queue_size=16, overflow=overflow)
+        if mode != "sync":
+            station.enable_async()
+        latencies = []
+        start = time.perf_counter()
+        for i in range(readings):
+            before = time.perf_counter()
+            station.set_measurements(20.0 + i % 10, 50.0, 1013.0)
+            latencies.append(time.perf_counter() - before)
+        station.close()
+        total = time.perf_counter() - start
+        latencies.sort()
+        complete = all(display.updates == readings for display in fast)
+        print(f"{mode if mode == 'sync' else 'async ' + mode:<22}"
+              f"{latencies[len(latencies) // 2] * 1e6:>9.0f}{latencies[int(len(latencies) * 0.99)] * 1e6:>10.0f}"
+              f"{latencies[-1] * 1e6:>10.0f}{total:>9.2f}   got {slow.updates}/{readings}"
+              f"{'' if complete else '  FAILURE: a fast display missed readings'}")
+    print("(block keeps every reading, so once the slow display's queue of 16 is full the "
+          "producer runs at its pace)")
+
+
+def demo_failure_isolation() -> None:
+    print("\n--- Failure isolation ---")
+    for async_mode in (False, True):
+        station = WeatherStation()
+        station.verbose = False
+        display = CountingDisplay()
+        station.register_observer(FaultyDisplay())
+        station.register_observer(display)
+        if async_mode:
+            station.enable_async()
+        station.set_measurements(21.0, 55.0, 1012.0)
+        station.flush()
+        stats = station.delivery_stats()
+        station.close()
+        mode = "async" if async_mode else "sync"
+        print(f"{'SUCCESS' if display.updates == 1 else 'FAILURE'} ({mode}): "
+              f"the display after a failing one still got the update.")
+        if stats:
+            print(f"  delivery stats: {stats}")
+
+
+# --- Streaming statistics: checked against exact results ---
+def synthetic_readings(n: int, seed: int = 42):
+    """One reading per second: daily temperature/humidity cycles plus sensor noise."""
+    rng = random.Random(seed)
+    for i in range(n):
+        daily = math.sin(2 * math.pi * i / 86_400)
+        yield (15 + 10 * daily + rng.gauss(0, 2), 60 - 20 * daily + rng.gauss(0, 5),
+               1013 + rng.gauss(0, 3))
+
+
+def verify_streaming_statistics(n: int = 300_000, window_size: int = 3_600,
+                                window_seconds: float = 900.0) -> None:
+    print(f"\n--- Streaming statistics vs exact reference: {n:,} readings ---")
+    gaps = random.Random(7)
+    now = [0.0]
+    by_count = StatisticsDisplay(window_size=window_size, clock=lambda: now[0])
+    by_time = StatisticsDisplay(window_size=None, window_seconds=window_seconds, clock=lambda: now[0])
+    by_count.verbose = by_time.verbose = False
+    def state_size(display: StatisticsDisplay) -> int:
+        """Entries held by the display: window deques plus sketch buckets (all bounded)."""
+        return sum(len(stats.window._mins) + len(stats.window._maxs) + stats.sketch.buckets()
+                   for stats in display.fields.values())
+
+    sizes = []
+    start = time.perf_counter()
+    for i, reading in enumerate(synthetic_readings(n), 1):
+        now[0] += gaps.uniform(0.5, 1.5)  # irregular reporting interval
+        by_count.update(*reading)
+        by_time.update(*reading)
+        if i in (n // 10, n // 2, n):
+            sizes.append(state_size(by_count) + state_size(by_time))
+    elapsed = time.perf_counter() - start
+    print(f"{2 * n / elapsed:,.0f} updates/s; entries held after {n // 10:,} / {n // 2:,} / {n:,} readings: "
+          f"{' / '.join(map(str, sizes))}")
+    gaps = random.Random(7)
+    timestamps = []
+    clock = 0.0
+    for _ in range(n):
+        clock += gaps.uniform(0.5, 1.5)
+        timestamps.append(clock)
+
+    columns = list(zip(*synthetic_readings(n)))
+    first_recent = next(i for i, t in enumerate(timestamps) if t > now[0] - window_seconds)
+    # per field and deque: at most window_size readings (by_count) or 2 readings/s (by_time),
+    # plus at most max_buckets sketch buckets per sign
+    max_buckets = by_count.fields["pressure"].sketch.max_buckets
+    bound = 3 * (2 * window_size + 2 * 2 * window_seconds + 2 * 2 * max_buckets)
+    ok = max(sizes) <= bound
+    print(f"{'field':<12}{'mean err':>10}{'stddev err':>12}{'p50 err':>9}{'p95 err':>9}{'p99 err':>9}  windows")
+    for name, values in zip(StatisticsDisplay.FIELDS, columns):
+        mean = math.fsum(values) / n
+        stddev = math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (n - 1))
+        ordered = sorted(values)
+        stats = by_count.fields[name]
+        quantile_errors = [abs(stats.sketch.quantile(q) - ordered[int(q * (n - 1))]) / abs(ordered[int(q * (n - 1))])
+                           for q in (0.5, 0.95, 0.99)]
+        windows_exact = (stats.window.min == min(values[-window_size:])
+                         and stats.window.max == max(values[-window_size:])
+                         and by_time.fields[name].window.min == min(values[first_recent:])
+                         and by_time.fields[name].window.max == max(values[first_recent:]))
+        mean_error = abs(stats.moments.mean - mean) / abs(mean)
+        stddev_error = abs(stats.moments.stddev - stddev) / stddev
+        ok = ok and mean_error < 1e-9 and stddev_error < 1e-9 and windows_exact
+        ok = ok and max(quantile_errors) <= stats.sketch.relative_accuracy
+        print(f"{name:<12}{mean_error:>10.1e}{stddev_error:>12.1e}"
+              + "".join(f"{error:>9.2%}" for error in quantile_errors)
+              + f"  {'exact' if windows_exact else 'WRONG'}")
+    print(f"{'SUCCESS' if ok else 'FAILURE'}: bounded state; Welford exact to 1e-9; "
+          f"sliding min/max exact; percentiles within 1%.")
+
+    # Mergeable: two half-streams combined give the statistics of the whole stream.
+    halves = [StatisticsDisplay(), StatisticsDisplay()]
+    for display in halves:
+        display.verbose = False
+    for i, reading in enumerate(synthetic_readings(100_000)):
+        halves[i % 2].update(*reading)
+    whole = StatisticsDisplay()
+    whole.verbose = False
+    for reading in synthetic_readings(100_000):
+        whole.update(*reading)
+    halves[0].merge(halves[1])
+    merged, full = halves[0].fields["pressure"], whole.fields["pressure"]
+    same = (abs(merged.moments.mean - full.moments.mean) < 1e-9
+            and abs(merged.moments.variance - full.moments.variance) < 1e-9
+            and merged.sketch.quantile(0.99) == full.sketch.quantile(0.99))
+    print(f"{'SUCCESS' if same else 'FAILURE'}: merged half-stream statistics match the whole stream.")
+
+    # Numerical stability: a large offset ruins the naive sum-of-squares variance.
+    rng = random.Random(1)
+    values = [1e9 + rng.gauss(0, 1) for _ in range(100_000)]
+    welford = RunningStats()
+    total = total_sq = 0.0
+    for value in values:
+        welford.add(value)
+        total += value
+        total_sq += value * value
+    naive = (total_sq - total * total / len(values)) / (len(values) - 1)
+    mean = math.fsum(values) / len(values)
+    exact = math.fsum((v - mean) ** 2 for v in values) / (len(values) - 1)
+    print(f"variance around 1e9: exact {exact:.6f}, Welford {welford.variance:.6f}, naive sum of squares {naive:.1f}")
+
+
+# --- Batch ingestion: backfilling history ---
+def benchmark_batch_ingestion(total: int = 10_000_000, distinct: int = 1_000_000,
+                              per_row_sample: int = 200_000) -> None:
+    print(f"\n--- Batch ingestion: {total:,} readings ---")
+    columns = tuple(array("d", column) for column in zip(*synthetic_readings(distinct)))
+
+    def quiet_station(stats: StatisticsDisplay, forecast: ForecastDisplay) -> WeatherStation:
+        station = WeatherStation()
+        station.verbose = stats.verbose = forecast.verbose = False
+        station.register_observer(stats)
+        station.register_observer(forecast)
+        return station
+
+    # Same results either way (on a sample).
+    row_stats, row_forecast = StatisticsDisplay(clock=lambda: 0.0), ForecastDisplay()
+    station = quiet_station(row_stats, row_forecast)
+    start = time.perf_counter()
+    for reading in zip(*(column[:per_row_sample] for column in columns)):
+        station.set_measurements(*reading)
+    per_row_rate = per_row_sample / (time.perf_counter() - start)
+    batch_stats, batch_forecast = StatisticsDisplay(clock=lambda: 0.0), ForecastDisplay()
+    quiet_station(batch_stats, batch_forecast).set_measurements_batch(
+        *(column[:per_row_sample] for column in columns))
+    same = row_forecast.tally == batch_forecast.tally and row_forecast.forecast == batch_forecast.forecast
+    for name in StatisticsDisplay.FIELDS:
+        row, batch = row_stats.fields[name], batch_stats.fields[name]
+        same = same and math.isclose(row.moments.mean, batch.moments.mean, rel_tol=1e-9)
+        same = same and math.isclose(row.moments.variance, batch.moments.variance, rel_tol=1e-9)
+        same = same and (row.moments.min, row.moments.max) == (batch.moments.min, batch.moments.max)
+        same = same and (row.window.min, row.window.max) == (batch.window.min, batch.window.max)
+        same = same and row.sketch._positive == batch.sketch._positive
+    print(f"{'SUCCESS' if same else 'FAILURE'}: update_batch() matches per-row update() on {per_row_sample:,} readings.")
+
+    stats, forecast = StatisticsDisplay(), ForecastDisplay()
+    station = quiet_station(stats, forecast)
+    start = time.perf_counter()
+    for _ in range(total // distinct):
+        station.set_measurements_batch(*columns)
+    elapsed = time.perf_counter() - start
+    print(f"per-row set_measurements:      {per_row_rate:>12,.0f} readings/s "
+          f"(~{total / per_row_rate / 60:.1f} min for {total:,}, extrapolated)")
+    print(f"set_measurements_batch arrays: {total / elapsed:>12,.0f} readings/s "
+          f"({elapsed:.1f}s for {stats.fields['temperature'].moments.count:,})")
+
+    # Streamed CSV: the file is read chunk by chunk, never loaded whole.
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("temperature", "humidity", "pressure"))
+            writer.writerows(zip(*columns))
+        stats, forecast = StatisticsDisplay(), ForecastDisplay()
+        station = quiet_station(stats, forecast)
+        start = time.perf_counter()
+        with open(path, newline="") as f:
+            ingested = station.set_measurements_batch(csv.reader(f))
+        elapsed = time.perf_counter() - start
+        print(f"set_measurements_batch CSV:    {ingested / elapsed:>12,.0f} readings/s "
+              f"({ingested:,} rows from {os.path.getsize(path) / 1e6:.0f} MB)")
+    finally:
+        os.remove(path)
+
+    # Malformed input: blank lines are skipped; a bad row stops the backfill at a chunk
+    # boundary with its row number, and nothing from that chunk reaches the observers.
+    lines = ["", "temperature,humidity,pressure", "20,50,1013", "", "21,51,1012", "22,52,1011", "23,oops,1010"]
+    stats, forecast = StatisticsDisplay(), ForecastDisplay()
+    station = quiet_station(stats, forecast)
+    try:
+        station.set_measurements_batch(csv.reader(lines), chunk_size=2)
+        error = None
+    except BatchIngestionError as e:
+        error = e
+        print(f"Rejected: {e}")
+    ok = (error is not None and error.row == 7 and error.ingested == 3
+          and stats.fields["temperature"].moments.count == 3)
+    print(f"{'SUCCESS' if ok else 'FAILURE'}: Blank lines (even before the header) are skipped; "
+          f"a bad row stops at a chunk boundary.")
+
+
+# --- Delivery policies: invocations saved on a noisy sensor ---
+def noisy_sensor_trace(seconds: int = 600, hz: int = 100, seed: int = 11):
+    """(timestamp, reading) at `hz`: slow drifts plus jitter well below what displays care about."""
+    rng = random.Random(seed)
+    for i in range(seconds * hz):
+        t = i / hz
+        yield t, (20 + 3 * math.sin(t / 120) + rng.gauss(0, 0.05),
+                  55 + 10 * math.sin(t / 300) + rng.gauss(0, 0.3),
+                  1013 + 2 * math.sin(t / 400) + rng.gauss(0, 0.1))
+
+
+def measure_delivery_policies(seconds: int = 600, hz: int = 100, observers_per_policy: int = 5) -> None:
+    print(f"\n--- Delivery policies: {seconds * hz:,} readings at {hz} Hz, "
+          f"{observers_per_policy} observers per policy ---")
+    now = [0.0]
+    station = WeatherStation(clock=lambda: now[0])
+    station.verbose = False
+    make_policy = {
+        "none (every reading)": lambda: None,
+        "Deadband(0.2°C, 1%, 0.5hPa)": lambda: Deadband(temperature=0.2, humidity=1.0, pressure=0.5),
+        "MaxRate(2/s)": lambda: MaxRate(2),
+        "LatestEvery(1000 ms)": lambda: LatestEvery(1000),
+    }
+    groups: Dict[str, List[CountingDisplay]] = {}
+    last_seen: Dict[CountingDisplay, Reading] = {}
+
+    class LastValueDisplay(CountingDisplay):
+        def update(self, temperature: float, humidity: float, pressure: float) -> None:
+            super().update(temperature, humidity, pressure)
+            last_seen[self] = (temperature, humidity, pressure)
+
+    for label, policy in make_policy.items():
+        groups[label] = [LastValueDisplay() for _ in range(observers_per_policy)]
+        for display in groups[label]:
+            station.register_observer(display, policy=policy())
+    for now[0], reading in noisy_sensor_trace(seconds, hz):
+        station.set_measurements(*reading)
+    now[0] += 1.0
+    station.tick()  # the sensor went quiet: held readings are delivered on the next tick
+
+    offered = seconds * hz * observers_per_policy
+    print(f"{'policy':<30}{'invocations':>12}{'eliminated':>12}")
+    for label, displays in groups.items():
+        invocations = sum(display.updates for display in displays)
+        print(f"{label:<30}{invocations:>12,}{1 - invocations / offered:>12.2%}")
+    total_offered = offered * len(groups)
+    total = sum(display.updates for displays in groups.values() for display in displays)
+    print(f"all observers: {total:,} of {total_offered:,} invocations ({1 - total / total_offered:.1%} eliminated)")
+
+    final = reading
+    deadband = groups["Deadband(0.2°C, 1%, 0.5hPa)"][0]
+    within = all(abs(a - b) < limit for a, b, limit in zip(last_seen[deadband], final, (0.2, 1.0, 0.5)))
+    fresh = all(last_seen[display] == final for label in ("MaxRate(2/s)", "LatestEvery(1000 ms)")
+                for display in groups[label])
+    print(f"{'SUCCESS' if within else 'FAILURE'}: deadband observers end within their thresholds of the last reading.")
+    print(f"{'SUCCESS' if fresh else 'FAILURE'}: rate-limited and sampling observers end on the latest reading.")
+    print(f"policy stats: {station.policy_stats()}")
+
+    # Real clock: a timer delivers the held reading when the sensor goes quiet, no tick() needed.
+    station = WeatherStation()
+    station.verbose = False
+    display = LastValueDisplay()
+    station.register_observer(display, policy=MaxRate(20))
+    for reading in ((20.0, 50.0, 1013.0), (21.0, 51.0, 1012.0), (22.0, 52.0, 1011.0)):
+        station.set_measurements(*reading)
+    held = last_seen[display] != reading
+    time.sleep(0.2)
+    station.close()
+    print(f"{'SUCCESS' if held and last_seen[display] == reading else 'FAILURE'}: "
+          f"the timer delivered the held reading after the sensor went quiet.")
+
+    # Async "block" mode: a stuck observer stalls only the thread delivering to it, not the timer.
+    class StuckDisplay(CountingDisplay):
+        def update(self, temperature: float, humidity: float, pressure: float) -> None:
+            unstick.wait()
+            super().update(temperature, humidity, pressure)
+
+    unstick = threading.Event()
+    station = WeatherStation()
+    station.verbose = False
+    station.register_observer(StuckDisplay(), queue_size=1, overflow="block")
+    station.register_observer(LastValueDisplay(), policy=MaxRate(20))
+    station.enable_async()
+    producer = threading.Thread(target=lambda: [station.set_measurements(20.0 + i, 50.0, 1013.0)
+                                                for i in range(3)])
+    producer.start()
+    time.sleep(0.1)  # the third reading now waits for room in the stuck observer's queue
+    start = time.perf_counter()
+    station.tick()
+    tick_ms = (time.perf_counter() - start) * 1000
+    unstick.set()
+    producer.join()
+    station.close()
+    print(f"{'SUCCESS' if tick_ms < 50 else 'FAILURE'}: tick() returned in {tick_ms:.1f} ms "
+          f"while a producer was blocked on a full observer queue.")
+    try:
+        Deadband()
+        print("FAILURE: Deadband() with no thresholds was accepted.")
+    except ValueError as e:
+        print(f"SUCCESS: Deadband() rejected: {e}")
+
 
 # --- Usage Example ---
 if __name__ == "__main__":
@@ -166,6 +1293,12 @@ if __name__ == "__main__":
     print("\n--- Fourth Measurement Update (Mild Weather) ---")
     weather_station.set_measurements(18.0, 60.0, 1014.5)
 
+    demo_failure_isolation()
+    benchmark_producer_latency()
+    verify_streaming_statistics()
+    benchmark_batch_ingestion()
+    measure_delivery_policies()
+
 """
 --- Registering Observers ---
 WeatherStation: Registered CurrentConditionsDisplay.
@@ -1,5 +1,15 @@
+import json
+import os
+import random
+import re
+import shutil
+import struct
+import tempfile
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 # --- 1. Product/Event Structure ---
 class JobPost:
@@ -27,29 +37,541 @@ class JobSubscriber(ABC):
         """Receives the JobPost event (Push Model)."""
         pass
 
+    def receive_batch(self, jobs: List[JobPost]) -> None:
+        """Receives posts replayed from the event log; override to process them in bulk."""
+        for job in jobs:
+            self.receive_update(job)
+
+# --- Declarative subscription filters ---
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def title_tokens(title: str) -> Set[str]:
+    return set(_TOKEN.findall(title.lower()))
+
+
+class JobFilter:
+    """
+    A saved search: every given criterion must hold (unset ones match anything).
+      - salary range:  min_salary <= salary <= max_salary (either bound optional)
+      - companies:     the company is one of these (case-insensitive)
+      - keywords:      the title contains at least one of these words (case-insensitive)
+    """
+    def __init__(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None,
+                 companies: Iterable[str] = (), keywords: Iterable[str] = ()) -> None:
+        self.min_salary = float("-inf") if min_salary is None else min_salary
+        self.max_salary = float("inf") if max_salary is None else max_salary
+        if self.min_salary > self.max_salary:
+            raise ValueError(f"Empty salary range: min_salary {min_salary} > max_salary {max_salary}.")
+        self.companies: FrozenSet[str] = frozenset(company.lower() for company in companies)
+        self.keywords: FrozenSet[str] = frozenset(word.lower() for word in keywords)
+        if any(len(title_tokens(word)) != 1 for word in self.keywords):
+            raise ValueError("Keywords must be single words.")
+
+    @property
+    def has_salary_range(self) -> bool:
+        return self.min_salary != float("-inf") or self.max_salary != float("inf")
+
+    def matches(self, job: JobPost, tokens: Optional[Set[str]] = None) -> bool:
+        if not self.min_salary <= job.salary <= self.max_salary:
+            return False
+        if self.companies and job.company.lower() not in self.companies:
+            return False
+        if self.keywords and self.keywords.isdisjoint(title_tokens(job.title) if tokens is None else tokens):
+            return False
+        return True
+
+
+class _IntervalNode:
+    __slots__ = ("center", "starts", "start_ids", "ends", "end_ids", "unsplit", "left", "right")
+
+
+class SalaryIntervalIndex:
+    """
+    Centered interval tree over salary ranges: `stab(x)` returns the ids of all ranges
+    containing x in O(log n + matches). Each node keeps the ranges that contain its
+    center sorted by start and by end, so the matching ones are a single list slice.
+
+    `add` and `remove` update the tree in place: a range goes to the first node on its
+    path whose center it contains (a new leaf centered on the range if there is none),
+    an O(depth + node size) step. In-place updates can unbalance the tree, so it is
+    rebuilt from scratch once the changes since the last build exceed half its size,
+    which keeps each update amortized O(log n) under subscribe/unsubscribe churn.
+    """
+    def __init__(self, intervals: Iterable[Tuple[float, float, int]] = ()) -> None:
+        self._intervals: Dict[int, Tuple[float, float]] = {
+            sub_id: (start, end) for start, end, sub_id in intervals}
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, start: float, end: float, sub_id: int) -> None:
+        if sub_id in self._intervals:
+            raise KeyError(f"Range id {sub_id} is already indexed.")
+        self._intervals[sub_id] = (start, end)
+        if self._changed():
+            return
+        node, parent, went_left = self._root, None, False
+        while node is not None:
+            if start <= node.center <= end:
+                position = bisect_right(node.starts, start)
+                node.starts.insert(position, start)
+                node.start_ids.insert(position, sub_id)
+                position = bisect_right(node.ends, end)
+                node.ends.insert(position, end)
+                node.end_ids.insert(position, sub_id)
+                return
+            if start > end:  # an inverted range contains no center: checked one by one
+                node.unsplit.append((start, end, sub_id))
+                return
+            parent, went_left = node, end < node.center
+            node = node.left if went_left else node.right
+        leaf = self._build([(start, end, sub_id)])
+        if parent is None:
+            self._root = leaf
+        elif went_left:
+            parent.left = leaf
+        else:
+            parent.right = leaf
+
+    def remove(self, sub_id: int) -> None:
+        start, end = self._intervals.pop(sub_id)
+        if self._changed():
+            return
+        node = self._root
+        while node is not None:
+            if start <= node.center <= end:
+                lo = bisect_left(node.starts, start)
+                position = node.start_ids.index(sub_id, lo, bisect_right(node.starts, start, lo))
+                del node.starts[position], node.start_ids[position]
+                lo = bisect_left(node.ends, end)
+                position = node.end_ids.index(sub_id, lo, bisect_right(node.ends, end, lo))
+                del node.ends[position], node.end_ids[position]
+                return
+            if (start, end, sub_id) in node.unsplit:
+                node.unsplit.remove((start, end, sub_id))
+                return
+            node = node.left if end < node.center else node.right
+        raise KeyError(sub_id)  # unreachable while the tree and _intervals agree
+
+    def _changed(self) -> bool:
+        """Counts one change; rebuilds (and returns True) once enough have piled up."""
+        self._changes += 1
+        if self._changes > 32 + self._built_size // 2:
+            self._rebuild()
+            return True
+        return False
+
+    def _rebuild(self) -> None:
+        self._root = self._build([(start, end, sub_id) for sub_id, (start, end) in self._intervals.items()])
+        self._built_size = len(self._intervals)
+        self._changes = 0
+
+    def _build(self, intervals: List[Tuple[float, float, int]]) -> Optional[_IntervalNode]:
+        if not intervals:
+            return None
+        finite = sorted(bound for start, end, _ in intervals for bound in (start, end)
+                        if bound not in (float("inf"), float("-inf")))
+        center = finite[len(finite) // 2] if finite else 0.0
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        node = _IntervalNode()
+        node.center = center
+        by_start = sorted(here)
+        node.starts = [start for start, _, _ in by_start]
+        node.start_ids = [sub_id for _, _, sub_id in by_start]
+        by_end = sorted(here, key=lambda interval: interval[1])
+        node.ends = [end for _, end, _ in by_end]
+        node.end_ids = [sub_id for _, _, sub_id in by_end]
+        node.unsplit = []
+        if len(left) == len(intervals) or len(right) == len(intervals):
+            # The split moved nothing (only possible with inverted ranges): keep them here,
+            # checked one by one, instead of recursing on the same list forever.
+            node.unsplit, left, right = left or right, [], []
+        node.left = self._build(left)
+        node.right = self._build(right)
+        return node
+
+    def stab(self, x: float) -> List[int]:
+        found: List[int] = []
+        node = self._root
+        while node is not None:
+            found.extend(sub_id for start, end, sub_id in node.unsplit if start <= x <= end)
+            if x < node.center:  # every range here ends >= center > x: need start <= x
+                found.extend(node.start_ids[:bisect_right(node.starts, x)])
+                node = node.left
+            elif x > node.center:  # every range here starts <= center < x: need end >= x
+                found.extend(node.end_ids[bisect_left(node.ends, x):])
+                node = node.right
+            else:
+                found.extend(node.start_ids)
+                break
+        return found
+
+
+# --- Durable event log ---
+class LogRecord(NamedTuple):
+    offset: int
+    timestamp: float
+    job: JobPost
+
+
+class _Segment:
+    """One log file. Sparse entries every `index_interval` records map offsets/timestamps to positions."""
+    __slots__ = ("base_offset", "path", "first_timestamp", "offsets", "timestamps", "positions", "indexed")
+
+    def __init__(self, base_offset: int, path: str) -> None:
+        self.base_offset = base_offset
+        self.path = path
+        self.first_timestamp: Optional[float] = None
+        self.offsets: List[int] = []
+        self.timestamps: List[float] = []
+        self.positions: List[int] = []
+        self.indexed = False
+
+
+class JobEventLog:
+    """
+    Append-only, segmented on-disk log of JobPosts with committed consumer offsets.
+
+    Each record is a header (offset, timestamp, payload length, CRC-32) followed by the
+    post as JSON. Segments are named after their first offset and roll over at
+    `segment_bytes`. Reads locate their start through a sparse in-memory index and then
+    stream the segment files sequentially. A torn record at the tail (a crash mid-write) is
+    detected by its CRC and truncated on reopen. Timestamps never decrease, so replay from
+    a time is a binary search.
+
+    Consumer offsets name the next offset a consumer has not processed yet. `commit` is
+    in-memory; `flush` and `close` persist them atomically, so a crash may redeliver
+    posts committed since the last flush (at-least-once).
+    """
+    HEADER = struct.Struct("<QdII")  # offset, timestamp, payload length, crc32
+    index_interval: int = 256
+    read_buffer: int = 1 << 20
+
+    def __init__(self, directory: str, segment_bytes: int = 8 << 20,
+                 clock: Callable[[], float] = time.time) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._clock = clock
+        self._segments: List[_Segment] = [
+            _Segment(int(name[:-4]), os.path.join(directory, name))
+            for name in sorted(os.listdir(directory)) if name.endswith(".log")]
+        if not self._segments:
+            self._segments.append(self._new_segment(0))
+        for segment in self._segments[:-1]:
+            self._read_first_timestamp(segment)
+        active = self._segments[-1]
+        self._end_offset, self._last_timestamp, cut = self._index(active, recover=True)
+        if cut is not None:
+            with open(active.path, "r+b") as f:
+                f.truncate(cut)
+        if self._end_offset == active.base_offset and len(self._segments) > 1:
+            _, self._last_timestamp, _ = self._index(self._segments[-2])
+        self._writer = open(active.path, "ab")
+        self._offsets_path = os.path.join(directory, "offsets.json")
+        try:
+            with open(self._offsets_path) as f:
+                self._offsets: Dict[str, int] = json.load(f)
+        except FileNotFoundError:
+            self._offsets = {}
+        self._offsets_dirty = False
+
+    def _new_segment(self, base_offset: int) -> _Segment:
+        segment = _Segment(base_offset, os.path.join(self.directory, f"{base_offset:020d}.log"))
+        open(segment.path, "ab").close()
+        segment.indexed = True
+        return segment
+
+    def _read_first_timestamp(self, segment: _Segment) -> None:
+        with open(segment.path, "rb") as f:
+            header = f.read(self.HEADER.size)
+        if len(header) == self.HEADER.size:
+            segment.first_timestamp = self.HEADER.unpack(header)[1]
+
+    def _index(self, segment: _Segment, recover: bool = False) -> Tuple[int, float, Optional[int]]:
+        """
+        Scans a segment's headers once to build its sparse index. Returns the offset after
+        the last intact record, that record's timestamp and, when `recover` (CRC-checking
+        every payload) finds a torn tail, the position to cut at.
+        """
+        segment.offsets, segment.timestamps, segment.positions = [], [], []
+        offset, position, size = segment.base_offset, 0, os.path.getsize(segment.path)
+        last_timestamp = float("-inf")
+        with open(segment.path, "rb", buffering=self.read_buffer) as f:
+            while True:
+                header = f.read(self.HEADER.size)
+                if len(header) < self.HEADER.size:
+                    break
+                record_offset, timestamp, length, crc = self.HEADER.unpack(header)
+                if record_offset != offset or position + self.HEADER.size + length > size:
+                    break
+                if recover:
+                    if zlib.crc32(f.read(length)) != crc:
+                        break
+                else:
+                    f.seek(length, os.SEEK_CUR)
+                if (offset - segment.base_offset) % self.index_interval == 0:
+                    segment.offsets.append(offset)
+                    segment.timestamps.append(timestamp)
+                    segment.positions.append(position)
+                if segment.first_timestamp is None:
+                    segment.first_timestamp = timestamp
+                last_timestamp = timestamp
+                offset += 1
+                position += self.HEADER.size + length
+        segment.indexed = True
+        return offset, last_timestamp, (position if recover and position < size else None)
+
+    @property
+    def end_offset(self) -> int:
+        """The offset the next appended post will get."""
+        return self._end_offset
+
+    def append(self, job: JobPost) -> int:
+        payload = json.dumps([job.title, job.company, job.salary]).encode()
+        active = self._segments[-1]
+        if self._writer.tell() + self.HEADER.size + len(payload) > self.segment_bytes \
+                and self._end_offset > active.base_offset:
+            self._writer.close()
+            active = self._new_segment(self._end_offset)
+            self._segments.append(active)
+            self._writer = open(active.path, "ab")
+        offset = self._end_offset
+        timestamp = max(self._clock(), self._last_timestamp)
+        position = self._writer.tell()
+        if (offset - active.base_offset) % self.index_interval == 0:
+            active.offsets.append(offset)
+            active.timestamps.append(timestamp)
+            active.positions.append(position)
+        if active.first_timestamp is None:
+            active.first_timestamp = timestamp
+        self._writer.write(self.HEADER.pack(offset, timestamp, len(payload), zlib.crc32(payload)) + payload)
+        self._end_offset = offset + 1
+        self._last_timestamp = timestamp
+        return offset
+
+    def read(self, from_offset: int, max_records: int = 1_000) -> List[LogRecord]:
+        """Up to `max_records` records starting at `from_offset`, read sequentially."""
+        self._writer.flush()
+        from_offset = max(from_offset, self._segments[0].base_offset)
+        stop = min(from_offset + max_records, self._end_offset)
+        records: List[LogRecord] = []
+        i = max(bisect_right([segment.base_offset for segment in self._segments], from_offset) - 1, 0)
+        while from_offset < stop and i < len(self._segments):
+            batch = list(self._scan(self._segments[i], from_offset, stop))
+            records.extend(batch)
+            from_offset += len(batch)
+            i += 1
+        return records
+
+    def _scan(self, segment: _Segment, from_offset: int, stop: int) -> Iterable[LogRecord]:
+        if not segment.indexed:
+            self._index(segment)
+        k = bisect_right(segment.offsets, from_offset) - 1
+        offset, position = (segment.offsets[k], segment.positions[k]) if k >= 0 else (segment.base_offset, 0)
+        header_size, unpack = self.HEADER.size, self.HEADER.unpack
+        with open(segment.path, "rb", buffering=self.read_buffer) as f:
+            f.seek(position)
+            while offset < stop:
+                header = f.read(header_size)
+                if len(header) < header_size:
+                    return
+                offset, timestamp, length, _ = unpack(header)
+                if offset < from_offset:
+                    f.seek(length, os.SEEK_CUR)
+                else:
+                    title, company, salary = json.loads(f.read(length))
+                    yield LogRecord(offset, timestamp, JobPost(title, company, salary))
+                offset += 1
+
+    def offset_for_timestamp(self, timestamp: float) -> int:
+        """The first offset posted at or after `timestamp` (end_offset if there is none)."""
+        self._writer.flush()
+        firsts = [segment.first_timestamp for segment in self._segments if segment.first_timestamp is not None]
+        i = max(bisect_left(firsts, timestamp) - 1, 0)
+        for segment in self._segments[i:]:
+            if not segment.indexed:
+                self._index(segment)
+            k = max(bisect_left(segment.timestamps, timestamp) - 1, 0)
+            start = segment.offsets[k] if segment.offsets else segment.base_offset
+            for record in self._scan(segment, start, self._end_offset):
+                if record.timestamp >= timestamp:
+                    return record.offset
+        return self._end_offset
+
+    def committed(self, consumer: str) -> int:
+        return self._offsets.get(consumer, self._segments[0].base_offset)
+
+    def commit(self, consumer: str, offset: int) -> None:
+        self._offsets[consumer] = offset
+        self._offsets_dirty = True
+
+    def flush(self, fsync: bool = False) -> None:
+        """Writes buffered records and committed offsets to disk (and to the device if fsync)."""
+        self._writer.flush()
+        if fsync:
+            os.fsync(self._writer.fileno())
+        if self._offsets_dirty:
+            temporary = self._offsets_path + ".tmp"
+            with open(temporary, "w") as f:
+                json.dump(self._offsets, f)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(temporary, self._offsets_path)
+            self._offsets_dirty = False
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+
 # --- 2. Publisher (Subject) ---
 class JobBoard:
-    def __init__(self):
-        self._observers: List[JobSubscriber] = []
+    """
+    Subscribers may register with a JobFilter. Filters are compiled into indexes, so a
+    post only touches subscribers that can match it instead of every subscriber:
+      - a company criterion:      hash map company -> subscriptions (checked first)
+      - else keywords:            inverted index word -> subscriptions
+      - else only a salary range: SalaryIntervalIndex (updated in place)
+      - no filter:                receives every post
+    Candidates from the company/keyword maps are confirmed against their full filter.
+
+    With an `event_log`, every post is appended to it before delivery. Named consumers can
+    then `catch_up` in bulk from their committed offset (or from a timestamp) and `resume`
+    live delivery, with their offset advancing on every post while registered.
+    """
+    verbose: bool = True  # print on registration and on every post (the original behaviour)
 
-    def register_observer(self, observer: JobSubscriber) -> None:
-        if observer not in self._observers:
-            self._observers.append(observer)
-            print(f"[Board] Registered observer: {observer.__class__.__name__}")
+    def __init__(self, event_log: Optional[JobEventLog] = None):
+        self._event_log = event_log
+        self._consumers: Dict[JobSubscriber, str] = {}  # live observers with a committed offset
+        self._subscriptions: Dict[JobSubscriber, int] = {}  # observer -> subscription id, in registration order
+        self._entries: Dict[int, Tuple[JobSubscriber, Optional[JobFilter]]] = {}
+        self._next_id = 0
+        self._match_all: Set[int] = set()
+        self._by_company: Dict[str, Set[int]] = {}
+        self._by_keyword: Dict[str, Set[int]] = {}
+        self._salary_index = SalaryIntervalIndex()
+
+    def register_observer(self, observer: JobSubscriber, job_filter: Optional[JobFilter] = None) -> None:
+        if observer not in self._subscriptions:
+            sub_id = self._next_id
+            self._next_id += 1
+            self._subscriptions[observer] = sub_id
+            self._entries[sub_id] = (observer, job_filter)
+            self._index(sub_id, job_filter, add=True)
+            if self.verbose:
+                print(f"[Board] Registered observer: {observer.__class__.__name__}")
 
     def remove_observer(self, observer: JobSubscriber) -> None:
-        if observer in self._observers:
-            self._observers.remove(observer)
-            print(f"[Board] Removed observer: {observer.__class__.__name__}")
+        if observer in self._subscriptions:
+            sub_id = self._subscriptions.pop(observer)
+            _, job_filter = self._entries.pop(sub_id)
+            self._index(sub_id, job_filter, add=False)
+            self._consumers.pop(observer, None)
+            if self.verbose:
+                print(f"[Board] Removed observer: {observer.__class__.__name__}")
+
+    def _index(self, sub_id: int, job_filter: Optional[JobFilter], add: bool) -> None:
+        if job_filter is None or not (job_filter.companies or job_filter.keywords or job_filter.has_salary_range):
+            postings = [(self._match_all, None)]
+        elif job_filter.companies:
+            postings = [(self._by_company, company) for company in job_filter.companies]
+        elif job_filter.keywords:
+            postings = [(self._by_keyword, word) for word in job_filter.keywords]
+        else:
+            if add:
+                self._salary_index.add(job_filter.min_salary, job_filter.max_salary, sub_id)
+            else:
+                self._salary_index.remove(sub_id)
+            return
+        for index, key in postings:
+            ids = index if key is None else index.setdefault(key, set())
+            if add:
+                ids.add(sub_id)
+            else:
+                ids.discard(sub_id)
+                if key is not None and not ids:
+                    del index[key]
+
+    def matching_subscribers(self, job: JobPost) -> List[JobSubscriber]:
+        """Subscribers whose filter accepts `job`, in registration order."""
+        matched = set(self._match_all)
+        matched.update(self._salary_index.stab(job.salary))
+        entries = self._entries
+        candidates = set(self._by_company.get(job.company.lower(), ()))
+        tokens = title_tokens(job.title)
+        for word in tokens:
+            candidates.update(self._by_keyword.get(word, ()))
+        matched.update(sub_id for sub_id in candidates if entries[sub_id][1].matches(job, tokens))
+        return [entries[sub_id][0] for sub_id in sorted(matched)]
 
     def notify_subscribers(self, job: JobPost) -> None:
-        print(f"\n[Board] Notifying subscribers about new job: {job.title} ({job.salary:.0f})")
-        for observer in self._observers:
+        if self.verbose:
+            print(f"\n[Board] Notifying subscribers about new job: {job.title} ({job.salary:.0f})")
+        for observer in self.matching_subscribers(job):
             observer.receive_update(job)
 
     def post_job(self, job: JobPost) -> None:
         """Updates state and triggers notification automatically."""
+        if self._event_log is None:
+            self.notify_subscribers(job)
+            return
+        offset = self._event_log.append(job)
         self.notify_subscribers(job)
+        for consumer in self._consumers.values():
+            self._event_log.commit(consumer, offset + 1)
+
+    def catch_up(self, consumer: str, observer: JobSubscriber, job_filter: Optional[JobFilter] = None, *,
+                 from_timestamp: Optional[float] = None, batch_size: int = 1_000) -> int:
+        """
+        Replays logged posts to `observer` through `receive_batch`, from the consumer's
+        committed offset (or from `from_timestamp`), committing after every batch.
+        Returns the number of posts delivered.
+        """
+        log = self._event_log
+        if log is None:
+            raise ValueError("catch_up() needs a JobBoard created with an event_log.")
+        offset = log.committed(consumer) if from_timestamp is None else log.offset_for_timestamp(from_timestamp)
+        delivered = 0
+        while offset < log.end_offset:
+            records = log.read(offset, batch_size)
+            if not records:  # e.g. a missing segment file, or a damaged record before the tail
+                raise RuntimeError(f"Event log has no readable record at offset {offset} "
+                                   f"(end offset {log.end_offset}); '{consumer}' stays committed at {offset}.")
+            jobs = [record.job for record in records]
+            if job_filter is not None:
+                jobs = [job for job in jobs if job_filter.matches(job)]
+            if jobs:
+                observer.receive_batch(jobs)
+            delivered += len(jobs)
+            offset = records[-1].offset + 1
+            log.commit(consumer, offset)
+        log.flush()
+        return delivered
+
+    def resume(self, consumer: str, observer: JobSubscriber, job_filter: Optional[JobFilter] = None, *,
+               from_timestamp: Optional[float] = None, batch_size: int = 1_000) -> int:
+        """`catch_up`, then register `observer` for live posts under the same committed offset."""
+        delivered = self.catch_up(consumer, observer, job_filter,
+                                  from_timestamp=from_timestamp, batch_size=batch_size)
+        self.register_observer(observer, job_filter)
+        self._consumers[observer] = consumer
+        return delivered
+
+    def close(self) -> None:
+        if self._event_log is not None:
+            self._event_log.close()
 
 # --- 4. Concrete Subscribers ---
 class EmailAlerter(JobSubscriber):
@@ -58,9 +580,19 @@ class EmailAlerter(JobSubscriber):
         print(f"EmailAlerter: Sending job alert for '{job.title}' to all users.")
 
 class AnalyticsTracker(JobSubscriber):
+    def __init__(self) -> None:
+        self.posts_by_company: Dict[str, int] = {}
+
     def receive_update(self, job: JobPost) -> None:
         # Requirement: "AnalyticsTracker: Logging new job posting data for {company}."
         print(f"AnalyticsTracker: Logging new job posting data for {job.company}.")
+        self.posts_by_company[job.company] = self.posts_by_company.get(job.company, 0) + 1
+
+    def receive_batch(self, jobs: List[JobPost]) -> None:
+        for job in jobs:
+            self.posts_by_company[job.company] = self.posts_by_company.get(job.company, 0) + 1
+        print(f"AnalyticsTracker: Logging {len(jobs):,} job postings in bulk "
+              f"({sum(self.posts_by_company.values()):,} total).")
 
 class SponsorAdvertiser(JobSubscriber):
     def receive_update(self, job: JobPost) -> None:
@@ -72,6 +604,185 @@ class SponsorAdvertiser(JobSubscriber):
             # Requirement: Otherwise, prints a simple tracking message.
             print(f"SponsorAdvertiser: Tracking standard job post.")
 
+class SavedSearchAlert(JobSubscriber):
+    """A user's saved search; counts the posts it is alerted about."""
+    def __init__(self, job_filter: JobFilter) -> None:
+        self.job_filter = job_filter
+        self.alerts = 0
+
+    def receive_update(self, job: JobPost) -> None:
+        self.alerts += 1
+
+
+class SelfFilteringAlert(SavedSearchAlert):
+    """The naive alternative: receives every post and checks its own filter."""
+    def receive_update(self, job: JobPost) -> None:
+        if self.job_filter.matches(job):
+            self.alerts += 1
+
+
+# --- Benchmark: indexed saved searches vs. every subscriber checking every post ---
+def random_saved_searches(n: int, companies: List[str], words: List[str], seed: int = 7) -> List[JobFilter]:
+    rng = random.Random(seed)
+    filters = []
+    for _ in range(n):
+        low = rng.randrange(40_000, 200_000, 5_000)
+        kind = rng.random()
+        if kind < 0.35:
+            filters.append(JobFilter(min_salary=low if rng.random() < 0.5 else None,
+                                     companies=rng.sample(companies, rng.randint(1, 3))))
+        elif kind < 0.75:
+            filters.append(JobFilter(min_salary=low if rng.random() < 0.5 else None,
+                                     keywords=rng.sample(words, rng.randint(1, 3))))
+        elif kind < 0.995:
+            filters.append(JobFilter(min_salary=low, max_salary=low + rng.randrange(10_000, 80_000, 5_000)))
+        else:
+            filters.append(JobFilter())
+    return filters
+
+
+def benchmark_saved_searches(subscribers: int = 30_000, posts: int = 300) -> None:
+    print(f"\n--- Saved searches: {subscribers:,} subscribers, {posts:,} posts ---")
+    rng = random.Random(3)
+    companies = [f"Company {i}" for i in range(500)]
+    words = [f"skill{i}" for i in range(300)] + ["senior", "junior", "lead", "engineer", "manager"]
+    filters = random_saved_searches(subscribers, companies, words)
+    jobs = [JobPost(title=" ".join(rng.sample(words, 3)), company=rng.choice(companies),
+                    salary=rng.randrange(40_000, 250_000, 1_000)) for _ in range(posts)]
+
+    results = {}
+    for label, alert_class, indexed in (("every subscriber filters", SelfFilteringAlert, False),
+                                        ("publisher-side index", SavedSearchAlert, True)):
+        board = JobBoard()
+        board.verbose = False
+        alerts = [alert_class(job_filter) for job_filter in filters]
+        start = time.perf_counter()
+        for alert in alerts:
+            board.register_observer(alert, alert.job_filter if indexed else None)
+        registered = time.perf_counter() - start
+        start = time.perf_counter()
+        for job in jobs:
+            board.post_job(job)
+        elapsed = time.perf_counter() - start
+        results[label] = [alert.alerts for alert in alerts]
+        print(f"{label:<25} {posts / elapsed:>9,.0f} posts/s   (registration {registered:.2f}s)")
+    matched = sum(results["publisher-side index"])
+    print(f"average matches per post: {matched / posts:,.1f} of {subscribers:,} subscribers")
+    same = results["every subscriber filters"] == results["publisher-side index"]
+    print(f"{'SUCCESS' if same else 'FAILURE'}: the index alerts exactly the subscribers whose filters match.")
+
+    board = JobBoard()
+    board.verbose = False
+    alerts = [SavedSearchAlert(job_filter) for job_filter in filters]
+    for alert in alerts:
+        board.register_observer(alert, alert.job_filter)
+    for alert in alerts[::2]:
+        board.remove_observer(alert)
+    for job in jobs[:200]:
+        board.post_job(job)
+    expected = [sum(alert.job_filter.matches(job) for job in jobs[:200]) if i % 2 else 0
+                for i, alert in enumerate(alerts)]
+    same = expected == [alert.alerts for alert in alerts]
+    print(f"{'SUCCESS' if same else 'FAILURE'}: removed subscribers leave every index.")
+
+    # Churn: each post is interleaved with one new salary-only alert and one cancelled one.
+    salary_only = [job_filter for job_filter in filters
+                   if job_filter.has_salary_range and not (job_filter.companies or job_filter.keywords)]
+    half = len(salary_only) // 2
+    alerts = [SavedSearchAlert(job_filter) for job_filter in salary_only[:half + posts]]
+    board = JobBoard()
+    board.verbose = False
+    for alert in alerts[:half]:
+        board.register_observer(alert, alert.job_filter)
+    start = time.perf_counter()
+    for i, job in enumerate(jobs):
+        board.register_observer(alerts[half + i], alerts[half + i].job_filter)
+        board.remove_observer(alerts[i])
+        board.post_job(job)
+    elapsed = time.perf_counter() - start
+    print(f"{'salary alerts with churn':<25} {posts / elapsed:>9,.0f} posts/s   "
+          f"(one subscribe + one unsubscribe per post, {half:,} live)")
+    expected = [sum(alert.job_filter.matches(job) for job in (jobs[:k] if k < half else jobs[max(0, k - half):]))
+                for k, alert in enumerate(alerts)]
+    same = expected == [alert.alerts for alert in alerts]
+    print(f"{'SUCCESS' if same else 'FAILURE'}: the salary index stays exact under subscribe/unsubscribe churn.")
+
+
+# --- Event log: late and restarted subscribers catch up ---
+def demo_event_log(posts: int = 200_000, batch_size: int = 50_000) -> None:
+    print(f"\n--- Event log: {posts:,} posts, bulk catch-up and replay ---")
+    directory = tempfile.mkdtemp(prefix="job_log_")
+    now = [1_700_000_000.0]
+    clock = lambda: now[0]
+    rng = random.Random(5)
+    jobs = [JobPost(title=f"Engineer {i}", company=f"Company {rng.randrange(50)}",
+                    salary=rng.randrange(40_000, 250_000, 1_000)) for i in range(posts)]
+    try:
+        board = JobBoard(JobEventLog(directory, segment_bytes=1 << 20, clock=clock))
+        board.verbose = False
+        start = time.perf_counter()
+        for job in jobs:
+            now[0] += 1.0
+            board.post_job(job)
+        board.close()
+        append_rate = posts / (time.perf_counter() - start)
+        segments = sum(name.endswith(".log") for name in os.listdir(directory))
+
+        # The analytics consumer was offline for all of it: one bulk pass after a "restart".
+        board = JobBoard(JobEventLog(directory, segment_bytes=1 << 20, clock=clock))
+        board.verbose = False
+        analytics = AnalyticsTracker()
+        start = time.perf_counter()
+        delivered = board.catch_up("analytics", analytics, batch_size=batch_size)
+        read_rate = delivered / (time.perf_counter() - start)
+        expected: Dict[str, int] = {}
+        for job in jobs:
+            expected[job.company] = expected.get(job.company, 0) + 1
+        print(f"append: {append_rate:,.0f} posts/s into {segments} segments; "
+              f"sequential catch-up: {read_rate:,.0f} posts/s")
+        ok = delivered == posts and analytics.posts_by_company == expected
+        print(f"{'SUCCESS' if ok else 'FAILURE'}: the offline consumer caught up on all {posts:,} posts.")
+
+        # Go live, restart, and resume: only what was missed is replayed.
+        board.resume("analytics", analytics)
+        history = list(jobs)
+        for job in jobs[:3] + [None] + jobs[3:253]:
+            if job is None:
+                board.remove_observer(analytics)
+                continue
+            now[0] += 1.0
+            board.post_job(job)
+            history.append(job)
+        board.close()
+        board = JobBoard(JobEventLog(directory, segment_bytes=1 << 20, clock=clock))
+        board.verbose = False
+        missed = board.catch_up("analytics", analytics)
+        print(f"{'SUCCESS' if missed == 250 else 'FAILURE'}: after a restart the consumer resumed "
+              f"from its committed offset ({missed} missed posts replayed).")
+
+        # Replay a time window with a filter, e.g. a new saved search backfilling a day.
+        since = 1_700_000_000.0 + posts - 86_400
+        job_filter = JobFilter(min_salary=200_000, companies=["Company 7"])
+        alert = SavedSearchAlert(job_filter)
+        replayed = board.catch_up("new-search", alert, job_filter, from_timestamp=since)
+        wanted = sum(job_filter.matches(job) for job in history[posts - 86_401:])  # post i is at t0 + i + 1
+        print(f"{'SUCCESS' if replayed == alert.alerts == wanted else 'FAILURE'}: replay from a timestamp "
+              f"delivered the {wanted} matching posts of the last day.")
+        board.close()
+
+        # A crash mid-append leaves a torn record: it is cut off on reopen.
+        active = max(name for name in os.listdir(directory) if name.endswith(".log"))
+        with open(os.path.join(directory, active), "ab") as f:
+            f.write(JobEventLog.HEADER.pack(len(history), now[0], 64, 0) + b"{torn")
+        log = JobEventLog(directory, segment_bytes=1 << 20, clock=clock)
+        offset = log.append(jobs[0])
+        ok = offset == len(history) and log.read(offset, 10)[0].job.title == jobs[0].title
+        log.close()
+        print(f"{'SUCCESS' if ok else 'FAILURE'}: a torn tail record is dropped and appends continue.")
+    finally:
+        shutil.rmtree(directory)
+
+
 # --- 5. Test Harness ---
 if __name__ == "__main__":
     job_board = JobBoard()
@@ -106,4 +817,7 @@ if __name__ == "__main__":
 
     # 5. Posting another job (EmailAlerter should be ignored)
     print("\n--- PHASE 5: Post Mid-Salary Job (Verify Unsubscribe) ---")
-    job_board.post_job(mid_salary_job)
\ No newline at end of file
+    job_board.post_job(mid_salary_job)
+
+    benchmark_saved_searches()
+    demo_event_log()
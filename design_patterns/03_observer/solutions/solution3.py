@@ -0,0 +1,440 @@
+import random
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+# --- 1. Subscriber (Observer) Interface ---
+class TopicSubscriber(ABC):
+    # Content filter applied by the publisher: when non-empty, only articles containing at
+    # least one of these (case-insensitive) are delivered. Read when first subscribed.
+    keywords: FrozenSet[str] = frozenset()
+
+    @abstractmethod
+    def receive_update(self, topic: str, content: str) -> None:
+        """Receives an article published on `topic` (Push Model)."""
+        pass
+
+# --- Topic patterns ---
+# Topics are dot-separated words ("finance.stocks.nasdaq"). A subscription pattern may use
+#   *  to match exactly one word    ("finance.stocks.*")
+#   #  to match zero or more words   ("finance.#" matches "finance" and "finance.stocks.nasdaq")
+SINGLE_WORD = "*"
+ANY_WORDS = "#"
+
+
+def split_topic(topic: str, wildcards: bool = False) -> List[str]:
+    words = topic.split(".")
+    if not all(words):
+        raise ValueError(f"Invalid topic '{topic}': words must be non-empty.")
+    if not wildcards and (SINGLE_WORD in words or ANY_WORDS in words):
+        raise ValueError(f"Cannot publish to wildcard topic '{topic}'.")
+    return words
+
+
+def pattern_matches(pattern: str, topic: str) -> bool:
+    """Reference matcher for one pattern (used by the benchmark as the naive approach)."""
+    def match(p: Sequence[str], t: Sequence[str]) -> bool:
+        if not p:
+            return not t
+        if p[0] == ANY_WORDS:
+            return any(match(p[1:], t[i:]) for i in range(len(t) + 1))
+        return bool(t) and (p[0] == SINGLE_WORD or p[0] == t[0]) and match(p[1:], t[1:])
+    return match(pattern.split("."), topic.split("."))
+
+
+# --- Multi-keyword content matching ---
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over case-folded keywords: `scan(text)` reports every keyword
+    occurring in `text` in one pass, however many keywords there are. Runs of characters
+    that appear in no keyword are collapsed (in C, by `re.sub`) to a single separator
+    before the pass. Goto/failure transitions are resolved lazily into a per-state
+    transition table, so each (state, character) pair follows failure links only once.
+    """
+    SEPARATOR = "\x00"
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[Tuple[str, ...]] = [()]
+        for keyword in {keyword.casefold() for keyword in keywords if keyword}:
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._outputs.append(())
+                state = nxt
+            self._outputs[state] = (keyword,)
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())  # depth 1 fails to the root
+        for state in queue:  # breadth-first: a state's failure target is always shallower
+            for ch, nxt in self._goto[state].items():
+                self._fail[nxt] = self._resolve(self._fail[state], ch)
+                self._outputs[nxt] += self._outputs[self._fail[nxt]]
+                queue.append(nxt)
+        self._delta: List[Dict[str, int]] = [dict(goto) for goto in self._goto]
+        self._accepting = frozenset(state for state, out in enumerate(self._outputs) if out)
+        alphabet = {ch for goto in self._goto for ch in goto}
+        self._other = re.compile("[^" + "".join(re.escape(ch) for ch in sorted(alphabet)) + "]+") \
+            if alphabet else None
+
+    def _resolve(self, state: int, ch: str) -> int:
+        while True:
+            nxt = self._goto[state].get(ch)
+            if nxt is not None or state == 0:
+                return nxt or 0
+            state = self._fail[state]
+
+    def scan(self, text: str) -> Set[str]:
+        """The keywords (case-folded) found anywhere in `text`."""
+        if self._other is None:
+            return set()
+        text = self._other.sub(self.SEPARATOR, text.casefold())
+        delta, fail, accepting = self._delta, self._fail, self._accepting
+        state, visited = 0, set()
+        for ch in text:
+            nxt = delta[state].get(ch)
+            if nxt is None:
+                nxt = delta[state][ch] = self._resolve(fail[state], ch) if state else 0
+            state = nxt
+            if state in accepting:
+                visited.add(state)
+        return {keyword for state in visited for keyword in self._outputs[state]}
+
+
+class _TopicNode:
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TopicNode"] = {}
+        self.subscribers: List[TopicSubscriber] = []  # subscribed to the pattern ending here
+
+
+# --- 2. Publisher (Subject) ---
+class TopicPublisher:
+    """
+    Subscriptions are kept per pattern in `_subscriptions` and compiled into a trie of
+    pattern words. Publishing walks the trie along the topic's words (following exact, `*`
+    and `#` children), so the cost depends on the topic and the matching patterns, not on
+    the total number of subscriptions. The subscriber tuple for each concrete topic is
+    cached; subscribing/unsubscribing an exact pattern drops that topic's entry, and a
+    wildcard pattern clears the cache.
+
+    The `keywords` of all subscribers are compiled into one KeywordAutomaton (rebuilt
+    lazily when the keyword set changes). An article is scanned once, and keyword-filtered
+    subscribers only receive it if one of their keywords hit.
+    """
+    verbose: bool = True
+    cache_size: int = 65_536
+
+    def __init__(self) -> None:
+        self._subscriptions: Dict[str, List[TopicSubscriber]] = {}
+        self._root = _TopicNode()
+        self._match_cache: Dict[str, Tuple[TopicSubscriber, ...]] = {}
+        self._patterns_per_observer: Dict[TopicSubscriber, int] = {}
+        self._keyword_owners: Dict[str, Set[TopicSubscriber]] = {}  # case-folded keyword -> subscribers
+        self._automaton: Optional[KeywordAutomaton] = KeywordAutomaton(())
+
+    def subscribe(self, observer: TopicSubscriber, topic: str) -> None:
+        words = split_topic(topic, wildcards=True)
+        subscribers = self._subscriptions.setdefault(topic, [])
+        if observer in subscribers:
+            return
+        subscribers.append(observer)
+        node = self._root
+        for word in words:
+            node = node.children.setdefault(word, _TopicNode())
+        node.subscribers.append(observer)
+        self._invalidate(topic, words)
+        self._count_pattern(observer, +1)
+        if self.verbose:
+            print(f"[Publisher] {observer.__class__.__name__} subscribed to '{topic}'.")
+
+    def unsubscribe(self, observer: TopicSubscriber, topic: str) -> None:
+        subscribers = self._subscriptions.get(topic)
+        if not subscribers or observer not in subscribers:
+            return
+        subscribers.remove(observer)
+        if not subscribers:
+            del self._subscriptions[topic]
+        words = topic.split(".")
+        path = [self._root]
+        for word in words:
+            path.append(path[-1].children[word])
+        path[-1].subscribers.remove(observer)
+        for parent, word, node in zip(reversed(path[:-1]), reversed(words), reversed(path[1:])):
+            if node.subscribers or node.children:
+                break
+            del parent.children[word]  # prune empty branches
+        self._invalidate(topic, words)
+        self._count_pattern(observer, -1)
+        if self.verbose:
+            print(f"[Publisher] {observer.__class__.__name__} unsubscribed from '{topic}'.")
+
+    def _count_pattern(self, observer: TopicSubscriber, change: int) -> None:
+        """Adds an observer's keywords on its first pattern and drops them after its last."""
+        count = self._patterns_per_observer.get(observer, 0) + change
+        if count:
+            self._patterns_per_observer[observer] = count
+        else:
+            del self._patterns_per_observer[observer]
+        first, last = count == 1 and change > 0, count == 0
+        if not observer.keywords or not (first or last):
+            return
+        for keyword in {keyword.casefold() for keyword in observer.keywords}:
+            owners = self._keyword_owners.get(keyword)
+            if count:
+                if owners is None:
+                    owners = self._keyword_owners[keyword] = set()
+                    self._automaton = None  # a new keyword: rebuilt on the next scan
+                owners.add(observer)
+            else:
+                owners.discard(observer)
+                if not owners:
+                    del self._keyword_owners[keyword]
+                    self._automaton = None
+
+    def keyword_hits(self, content: str) -> Set[TopicSubscriber]:
+        """Keyword-filtered subscribers (on any topic) with a keyword in `content`."""
+        if self._automaton is None:
+            self._automaton = KeywordAutomaton(self._keyword_owners)
+        hits: Set[TopicSubscriber] = set()
+        for keyword in self._automaton.scan(content):
+            hits.update(self._keyword_owners[keyword])
+        return hits
+
+    def _invalidate(self, topic: str, words: List[str]) -> None:
+        if SINGLE_WORD in words or ANY_WORDS in words:
+            self._match_cache.clear()
+        else:
+            self._match_cache.pop(topic, None)
+
+    def subscribers_for(self, topic: str) -> Tuple[TopicSubscriber, ...]:
+        """Every subscriber with a pattern matching `topic`, each once."""
+        subscribers = self._match_cache.get(topic)
+        if subscribers is None:
+            subscribers = self._match(split_topic(topic))
+            if len(self._match_cache) >= self.cache_size:
+                del self._match_cache[next(iter(self._match_cache))]  # evict the oldest entry
+            self._match_cache[topic] = subscribers
+        return subscribers
+
+    def _match(self, words: List[str]) -> Tuple[TopicSubscriber, ...]:
+        found: List[TopicSubscriber] = []
+        end = len(words)
+        stack: List[Tuple[_TopicNode, int]] = [(self._root, 0)]
+        seen = set()
+        while stack:
+            node, i = stack.pop()
+            if (id(node), i) in seen:  # several '#' can reach the same state
+                continue
+            seen.add((id(node), i))
+            any_words = node.children.get(ANY_WORDS)
+            if any_words is not None:
+                stack.extend((any_words, j) for j in range(i, end + 1))  # '#' consumes words i..j-1
+            if i == end:
+                found.extend(node.subscribers)
+                continue
+            child = node.children.get(words[i])
+            if child is not None:
+                stack.append((child, i + 1))
+            single_word = node.children.get(SINGLE_WORD)
+            if single_word is not None:
+                stack.append((single_word, i + 1))
+        return tuple(dict.fromkeys(found))
+
+    def publish_article(self, topic: str, content: str) -> None:
+        subscribers = self.subscribers_for(topic)
+        if self.verbose:
+            print(f"\n[Publisher] Publishing to '{topic}' ({len(subscribers)} subscriber(s)).")
+        hits = None
+        for observer in subscribers:
+            if observer.keywords:
+                if hits is None:
+                    hits = self.keyword_hits(content)  # one scan, only if someone filters
+                if observer not in hits:
+                    continue
+            observer.receive_update(topic, content)
+
+# --- 3. Concrete Subscribers ---
+class TopicLogger(TopicSubscriber):
+    def receive_update(self, topic: str, content: str) -> None:
+        snippet = content if len(content) <= 40 else content[:37] + "..."
+        print(f"TopicLogger: [{topic}] {snippet}")
+
+class PriorityNotifier(TopicSubscriber):
+    # The publisher only delivers content containing one of these (case-insensitive).
+    keywords = frozenset({"URGENT", "BREAKING"})
+
+    def receive_update(self, topic: str, content: str) -> None:
+        print(f"PriorityNotifier: PRIORITY ALERT on '{topic}': {content}")
+
+class CountingSubscriber(TopicSubscriber):
+    def __init__(self, keywords: Iterable[str] = ()) -> None:
+        self.keywords = frozenset(keywords)
+        self.received = 0
+
+    def receive_update(self, topic: str, content: str) -> None:
+        self.received += 1
+
+class SelfFilteringSubscriber(CountingSubscriber):
+    """The naive alternative: receives every article and scans it for its own keywords."""
+    keywords = frozenset()
+
+    def __init__(self, keywords: Iterable[str] = ()) -> None:
+        super().__init__()
+        self.own_keywords = tuple(keyword.lower() for keyword in keywords)
+
+    def receive_update(self, topic: str, content: str) -> None:
+        text = content.lower()
+        if any(keyword in text for keyword in self.own_keywords):
+            self.received += 1
+
+
+# --- Benchmark: trie + cache vs. testing every subscription ---
+def topic_space() -> List[str]:
+    """10 x 25 x 40 = 10,000 three-word topics."""
+    return [f"sector{a}.group{b}.item{c}" for a in range(10) for b in range(25) for c in range(40)]
+
+
+def random_patterns(n: int, rng: random.Random) -> List[str]:
+    patterns = []
+    for _ in range(n):
+        a, b, c = f"sector{rng.randrange(10)}", f"group{rng.randrange(25)}", f"item{rng.randrange(40)}"
+        kind = rng.random()
+        if kind < 0.80:
+            patterns.append(f"{a}.{b}.{c}")
+        elif kind < 0.92:
+            patterns.append(f"{a}.{b}.*")
+        elif kind < 0.97:
+            patterns.append(f"*.{b}.{c}")
+        elif kind < 0.995:
+            patterns.append(f"{a}.#")
+        else:
+            patterns.append(f"#.{c}")
+    return patterns
+
+
+def benchmark_topic_matching(sizes: Tuple[int, ...] = (25_000, 50_000, 100_000),
+                             publishes: int = 100_000, naive_sample: int = 30) -> None:
+    print(f"\n--- Topic matching: 10,000 topics, {publishes:,} publishes ---")
+    rng = random.Random(24)
+    topics = topic_space()
+    stream = [rng.choice(topics) for _ in range(publishes)]
+    print(f"{'subscriptions':>13} {'matches/topic':>14} {'naive scan':>12} {'trie walk':>11} {'cached':>9}  (per publish)")
+    for size in sizes:
+        publisher = TopicPublisher()
+        publisher.verbose = False
+        patterns = random_patterns(size, rng)
+        subscribed = [(CountingSubscriber(), pattern) for pattern in patterns]
+        for observer, pattern in subscribed:
+            publisher.subscribe(observer, pattern)
+
+        sample = topics[::len(topics) // naive_sample][:naive_sample]
+        start = time.perf_counter()
+        naive = [{id(observer) for observer, pattern in subscribed if pattern_matches(pattern, topic)}
+                 for topic in sample]
+        naive_time = (time.perf_counter() - start) / len(sample)
+        start = time.perf_counter()
+        walked = [publisher._match(split_topic(topic)) for topic in topics]
+        trie_time = (time.perf_counter() - start) / len(topics)
+        for topic in topics:
+            publisher.subscribers_for(topic)  # warm the cache
+        start = time.perf_counter()
+        for topic in stream:
+            publisher.subscribers_for(topic)
+        cached_time = (time.perf_counter() - start) / len(stream)
+
+        same = naive == [{id(observer) for observer in publisher.subscribers_for(topic)} for topic in sample]
+        matches = sum(map(len, walked)) / len(topics)
+        print(f"{size:>13,} {matches:>14.1f} {naive_time * 1e6:>10,.0f}us {trie_time * 1e6:>9.1f}us "
+              f"{cached_time * 1e6:>7.2f}us"
+              f"{'' if same else '  FAILURE: trie and naive scan disagree'}")
+
+    # The cache follows subscription changes.
+    observer = CountingSubscriber()
+    before = len(publisher.subscribers_for("sector1.group2.item3"))
+    publisher.subscribe(observer, "sector1.#")
+    after_subscribe = publisher.subscribers_for("sector1.group2.item3")
+    publisher.unsubscribe(observer, "sector1.#")
+    after_unsubscribe = publisher.subscribers_for("sector1.group2.item3")
+    ok = observer in after_subscribe and observer not in after_unsubscribe and len(after_unsubscribe) == before
+    print(f"{'SUCCESS' if ok else 'FAILURE'}: cached matches are invalidated on subscribe/unsubscribe.")
+
+
+# --- Benchmark: one automaton scan vs. every subscriber scanning every article ---
+def benchmark_keyword_filtering(subscribers: int = 5_000, vocabulary: int = 20_000,
+                                article_sizes: Tuple[int, ...] = (10_000, 100_000, 1_000_000)) -> None:
+    print(f"\n--- Keyword filtering: {subscribers:,} keyword subscribers on one topic ---")
+    rng = random.Random(25)
+    words = [f"{rng.choice(['market', 'rate', 'chip', 'vote', 'storm'])}{i}" for i in range(vocabulary)]
+    keyword_sets = [rng.sample(words, rng.randint(1, 3)) + (["URGENT"] if rng.random() < 0.01 else [])
+                    for _ in range(subscribers)]
+    print(f"{'article':>10} {'hits':>6} {'per-subscriber scan':>20} {'automaton':>10} {'speed-up':>9}")
+    for size in article_sizes:
+        text_words, length = [], 0
+        while length < size:
+            word = rng.choice(words) if rng.random() < 0.002 else rng.choice(["the", "a", "Index", "fell", "today,"])
+            text_words.append(word if rng.random() < 0.5 else word.upper())
+            length += len(word) + 1
+        article = " ".join(text_words)
+
+        timings, received = [], []
+        for make in (SelfFilteringSubscriber, CountingSubscriber):
+            publisher = TopicPublisher()
+            publisher.verbose = False
+            observers = [make(keywords) for keywords in keyword_sets]
+            for observer in observers:
+                publisher.subscribe(observer, "news.markets")
+            publisher.keyword_hits("")  # build the automaton outside the timing
+            start = time.perf_counter()
+            publisher.publish_article("news.markets", article)
+            timings.append(time.perf_counter() - start)
+            received.append([observer.received for observer in observers])
+        same = received[0] == received[1]
+        print(f"{len(article):>10,} {sum(received[1]):>6} {timings[0] * 1e3:>18,.1f}ms {timings[1] * 1e3:>8,.1f}ms "
+              f"{timings[0] / timings[1]:>8.1f}x{'' if same else '  FAILURE: deliveries differ'}")
+
+    automaton = KeywordAutomaton(["he", "she", "his", "hers", "Straße"])
+    ok = automaton.scan("uSHErs STRASSE") == {"he", "she", "hers", "strasse"} and automaton.scan("ahishe") == {"his", "she", "he"}
+    print(f"{'SUCCESS' if ok else 'FAILURE'}: overlapping and case-folded keywords are all found in one pass.")
+
+
+# --- 4. Test Harness ---
+if __name__ == "__main__":
+    publisher = TopicPublisher()
+    logger = TopicLogger()
+    notifier = PriorityNotifier()
+
+    print("\n--- PHASE 1: Subscribing ---")
+    publisher.subscribe(logger, "Tech")
+    publisher.subscribe(notifier, "Finance")
+
+    print("\n--- PHASE 2: Publish a Tech Article (only TopicLogger) ---")
+    publisher.publish_article("Tech", "New open-source framework released for building web apps.")
+
+    print("\n--- PHASE 3: Publish a BREAKING Finance Article (only PriorityNotifier) ---")
+    publisher.publish_article("Finance", "BREAKING: Central bank announces surprise rate cut.")
+
+    print("\n--- PHASE 4: Publish a Topic Nobody Follows ---")
+    publisher.publish_article("Gaming", "Patch notes for the new season.")
+
+    print("\n--- PHASE 5: Hierarchical Topics and Wildcards ---")
+    publisher.subscribe(logger, "finance.stocks.*")
+    publisher.subscribe(logger, "finance.#")
+    publisher.subscribe(notifier, "*.stocks.nasdaq")
+    publisher.publish_article("finance.stocks.nasdaq", "Urgent: trading halted after a circuit breaker trip.")
+    publisher.publish_article("finance.bonds", "Treasury yields steady.")
+
+    print("\n--- PHASE 6: Unsubscribe From a Wildcard ---")
+    publisher.unsubscribe(logger, "finance.#")
+    publisher.publish_article("finance.bonds", "Treasury yields steady.")
+
+    print("\n--- PHASE 7: Routine Finance Article (PriorityNotifier filtered out by the publisher) ---")
+    publisher.publish_article("Finance", "Quarterly earnings in line with expectations.")
+
+    benchmark_topic_matching()
+    benchmark_keyword_filtering()